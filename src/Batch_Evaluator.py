@@ -0,0 +1,305 @@
+"""
+Batch Evaluator - Vectorized dengan NumPy
+==========================================
+
+File ini berisi evaluator untuk menghitung SATU ekspresi terhadap
+BANYAK baris data sekaligus (kolom-kolom variabel).
+
+KENAPA PERLU BATCH?
+Menghitung formula yang sama untuk 1 juta baris dengan memanggil
+Calculator.calculate() 1 juta kali berarti loop Python per baris.
+Evaluator ini berjalan di atas program postfix SEKALI saja, tapi setiap
+operator diterapkan ke seluruh array NumPy (vectorized).
+
+Contoh:
+    evaluate_batch("x * 2 + y", {"x": np.array([1, 2, 3]),
+                                 "y": np.array([10, 20, 30])})
+    # → array([12., 24., 36.])
+
+KEBIJAKAN PEMBAGIAN NOL (zero_division):
+- 'raise' : ZeroDivisionError jika ADA baris yang membagi dengan nol
+            (sama seperti evaluator biasa, default)
+- 'nan'   : baris yang membagi dengan nol menghasilkan NaN
+- 'inf'   : ikuti aturan IEEE 754 (x/0 → ±inf, 0/0 → NaN)
+
+Aturan yang sama berlaku untuk 0 ^ negatif (yang di Python biasa
+juga menghasilkan ZeroDivisionError).
+
+FUNGSI (sqrt, sin, log, min, max, ...) memakai ufunc NumPy. Baris di luar
+domain fungsi TIDAK menghasilkan error seperti evaluator biasa, tapi
+mengikuti IEEE 754: sqrt(-1) → NaN, log(0) → -inf, log(-1) → NaN.
+
+CATATAN: NumPy adalah dependency OPSIONAL. Modul lain di project ini
+tetap berjalan tanpa NumPy; hanya evaluate_batch() yang membutuhkannya.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional
+    np = None
+
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OP_ADD, OP_SUB,
+                             OP_MUL, OP_DIV, OP_POW, OP_STORE, OP_FETCH, OP_MIN,
+                             FUNCTION_OPCODES)
+from Infix_to_Postfix import infix_to_program
+
+
+ZERO_DIVISION_POLICIES = ('raise', 'nan', 'inf')
+
+# Nama fungsi → nama ufunc NumPy (di-resolve saat dipakai, NumPy opsional)
+FUNCTION_UFUNCS = {
+    'neg': 'negative', 'sqrt': 'sqrt', 'sin': 'sin', 'cos': 'cos',
+    'tan': 'tan', 'log': 'log', 'exp': 'exp', 'abs': 'absolute',
+    'min': 'minimum', 'max': 'maximum',
+}
+
+
+def _apply_zero_policy(result, zero_mask, zero_division):
+    """
+    Terapkan kebijakan pembagian nol pada hasil vectorized.
+
+    Args:
+        result: Hasil operasi (array atau scalar)
+        zero_mask: Boolean mask baris yang "membagi dengan nol"
+        zero_division (str): 'raise', 'nan' atau 'inf'
+
+    Returns:
+        Hasil setelah kebijakan diterapkan
+
+    Raises:
+        ZeroDivisionError: Jika policy 'raise' dan ada baris yang kena
+    """
+    if not np.any(zero_mask):
+        return result
+    if zero_division == 'raise':
+        raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
+    if zero_division == 'nan':
+        return np.where(zero_mask, np.nan, result)
+    return result
+
+
+def evaluate_batch(expression, columns, zero_division='raise'):
+    """
+    Mengevaluasi satu ekspresi terhadap kolom-kolom variabel (vectorized).
+
+    Args:
+        expression (str atau PostfixProgram): Ekspresi infix, misal "x * 2 + y",
+                                  atau program yang sudah di-compile
+        columns (dict): Mapping nama variabel → array (atau list/scalar).
+                        Semua kolom harus bisa di-broadcast ke shape yang sama.
+        zero_division (str): Kebijakan pembagian nol: 'raise', 'nan', 'inf'
+
+    Returns:
+        numpy.ndarray: Hasil per baris (dtype float64). Shape-nya = broadcast
+                       SEMUA kolom di columns, termasuk kolom yang tidak
+                       dipakai ekspresi: "3 + 4" dengan kolom x 3 baris →
+                       3 baris 7.0. Tanpa kolom sama sekali → array 0-d.
+
+    Raises:
+        ImportError: Jika NumPy tidak terinstall
+        ValueError: Jika ekspresi invalid, variabel tidak ada di columns,
+                    kolom tidak bisa di-broadcast, atau zero_division
+                    tidak dikenal
+        ZeroDivisionError: Jika zero_division='raise' dan ada pembagian nol
+
+    Example:
+        evaluate_batch("x / y", {"x": [1, 2], "y": [0, 4]}, zero_division='nan')
+        # → array([nan, 0.5])
+    """
+    if np is None:
+        raise ImportError("evaluate_batch() membutuhkan NumPy (pip install numpy)")
+
+    if zero_division not in ZERO_DIVISION_POLICIES:
+        raise ValueError(f"Error: zero_division '{zero_division}' tidak dikenal! "
+                         f"Pilih: {', '.join(ZERO_DIVISION_POLICIES)}")
+
+    if isinstance(expression, PostfixProgram):
+        program = expression
+    else:
+        program = infix_to_program(expression)
+
+    # Validasi program sekali di awal (tidak ada pengecekan per operator)
+    if program.error is not None:
+        raise ValueError(program.error)
+    if program.depth == 0:
+        raise ValueError("Error: Expression kosong atau invalid!")
+    if program.depth > 1:
+        raise ValueError(f"Error: Expression invalid! Stack masih berisi {program.depth} angka.")
+
+    # Resolve kolom variabel SEKALI: convert ke array float64
+    slots = []
+    for name in program.names:
+        if name not in columns:
+            raise ValueError(f"Error: Variabel '{name}' tidak didefinisikan!")
+        slots.append(np.asarray(columns[name], dtype=np.float64))
+
+    # Shape hasil = broadcast dari SEMUA kolom, juga yang tidak dipakai
+    # ekspresi (satu hasil per baris input, walaupun ekspresinya konstan)
+    shapes = [slot.shape for slot in slots]
+    shapes += [np.shape(column) for name, column in columns.items()
+               if name not in program.names]
+    try:
+        shape = np.broadcast_shapes(*shapes)
+    except ValueError:
+        raise ValueError(f"Error: Kolom tidak bisa di-broadcast ke shape yang sama "
+                         f"({', '.join(map(str, shapes))})!")
+
+    stack = [None] * program.max_depth
+    temps = [None] * program.temps
+    top = -1
+    ufuncs = {opcode: getattr(np, FUNCTION_UFUNCS[name])
+              for name, opcode in FUNCTION_OPCODES.items()}
+
+    # errstate: NumPy tidak perlu mengeluarkan warning, kebijakan
+    # pembagian nol ditangani sendiri oleh _apply_zero_policy()
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for opcode, constant in zip(program.opcodes, program.constants):
+            if opcode == OP_PUSH:
+                top += 1
+                stack[top] = constant
+                continue
+            if opcode == OP_LOAD:
+                top += 1
+                stack[top] = slots[int(constant)]
+                continue
+            if opcode == OP_STORE:
+                # Kolom hasil sub-ekspresi bersama dipakai ulang, bukan dihitung ulang
+                temps[int(constant)] = stack[top]
+                continue
+            if opcode == OP_FETCH:
+                top += 1
+                stack[top] = temps[int(constant)]
+                continue
+            if opcode in ufuncs:
+                # Fungsi: satu ufunc NumPy per opcode
+                ufunc = ufuncs[opcode]
+                if opcode >= OP_MIN:
+                    right = stack[top]
+                    top -= 1
+                    stack[top] = ufunc(stack[top], right)
+                else:
+                    stack[top] = ufunc(stack[top])
+                continue
+
+            right = stack[top]
+            top -= 1
+            left = stack[top]
+
+            if opcode == OP_ADD:
+                result = np.add(left, right)
+            elif opcode == OP_SUB:
+                result = np.subtract(left, right)
+            elif opcode == OP_MUL:
+                result = np.multiply(left, right)
+            elif opcode == OP_DIV:
+                result = _apply_zero_policy(np.true_divide(left, right),
+                                            np.equal(right, 0), zero_division)
+            elif opcode == OP_POW:
+                # 0 ^ negatif = pembagian dengan nol (sama seperti Python)
+                zero_mask = np.logical_and(np.equal(left, 0), np.less(right, 0))
+                result = _apply_zero_policy(np.power(left, right),
+                                            zero_mask, zero_division)
+            else:
+                raise ValueError(f"Error: Opcode {opcode} tidak didukung di batch evaluator!")
+
+            stack[top] = result
+
+    # Pastikan output selalu array float64 dengan shape hasil broadcast
+    return np.broadcast_to(np.asarray(stack[0], dtype=np.float64), shape).copy()
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing batch evaluator (dibandingkan dengan engine VM per baris).
+    """
+    import time
+    from Postfix_VM import run_program
+
+    print("\n" + "="*60)
+    print("TESTING BATCH EVALUATOR")
+    print("="*60 + "\n")
+
+    if np is None:
+        print("NumPy tidak terinstall, test dilewati.")
+        raise SystemExit(0)
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Hasil sama dengan VM per baris
+    x = np.array([1.0, 2.0, 3.0, 4.5])
+    y = np.array([10.0, 20.0, 30.0, 0.5])
+    expression = "( x + y ) * 2 - x ^ 2 / y"
+    program = infix_to_program(expression)
+    expected = [run_program(program, {"x": a, "y": b}) for a, b in zip(x, y)]
+    check("Sama dengan VM per baris",
+          np.allclose(evaluate_batch(program, {"x": x, "y": y}), expected))
+
+    # Test 2: Kebijakan pembagian nol
+    columns = {"x": [1.0, 2.0], "y": [0.0, 4.0]}
+    try:
+        evaluate_batch("x / y", columns)
+        check("zero_division='raise'", False)
+    except ZeroDivisionError:
+        check("zero_division='raise'", True)
+    result = evaluate_batch("x / y", columns, zero_division='nan')
+    check("zero_division='nan'", np.isnan(result[0]) and result[1] == 0.5)
+    result = evaluate_batch("x / y", columns, zero_division='inf')
+    check("zero_division='inf'", np.isinf(result[0]) and result[1] == 0.5)
+
+    # Test 3: Fungsi dan minus unary (di luar domain → NaN)
+    expression_fn = "max(sqrt(x), -y) + abs(sin(x))"
+    program_fn = infix_to_program(expression_fn)
+    expected = [run_program(program_fn, {"x": a, "y": b}) for a, b in zip(x, y)]
+    check("Fungsi sama dengan VM per baris",
+          np.allclose(evaluate_batch(program_fn, {"x": x, "y": y}), expected))
+    result = evaluate_batch("sqrt(x)", {"x": [-1.0, 4.0]})
+    check("sqrt(-1) → NaN", np.isnan(result[0]) and result[1] == 2.0)
+
+    # Test 4: Variabel tidak ada
+    try:
+        evaluate_batch("x + z", {"x": [1.0]})
+        check("Variabel tidak ada → ValueError", False)
+    except ValueError:
+        check("Variabel tidak ada → ValueError", True)
+
+    # Test 5: Shape hasil = broadcast semua kolom, juga yang tidak dipakai
+    result = evaluate_batch("3 + 4", {"x": np.arange(3)})
+    check("Ekspresi konstan → satu hasil per baris", result.tolist() == [7.0, 7.0, 7.0])
+    result = evaluate_batch("x * 2", {"x": [1.0, 2.0], "w": np.zeros((3, 1))})
+    check("Kolom tidak dipakai ikut broadcast", result.shape == (3, 2))
+    result = evaluate_batch("3 + 4", {})
+    check("Tanpa kolom → array 0-d", result.shape == () and float(result) == 7.0)
+    try:
+        evaluate_batch("x + 1", {"x": [1.0, 2.0], "w": [1.0, 2.0, 3.0]})
+        check("Kolom tidak bisa di-broadcast → ValueError", False)
+    except ValueError as e:
+        check("Kolom tidak bisa di-broadcast → ValueError", "broadcast" in str(e))
+
+    # Demo kecepatan: 1 juta baris
+    n = 1_000_000
+    columns = {"x": np.random.rand(n), "y": np.random.rand(n) + 1}
+    start = time.perf_counter()
+    evaluate_batch(expression, columns)
+    elapsed = time.perf_counter() - start
+    print(f"\n1.000.000 baris dalam {elapsed * 1000:.1f} ms")
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,1091 @@
+"""
+Benchmark Suite
+================
+
+File ini berisi benchmark untuk semua tahap kalkulator:
+- Stack push/pop
+- infix_to_postfix / infix_to_program (konversi)
+- evaluate_postfix / run_program / Codegen (evaluasi; codegen_cold = compile + 1x eval)
+- Calculator.calculate / Calculator.evaluate (end-to-end; evaluate_disk_warm =
+  Calculator baru yang membaca program dari Program_Disk_Cache)
+- Common-subexpression elimination pada corpus redundant (group cse)
+- Fungsi dan minus unary pada corpus fungsi (group functions); bandingkan
+  dengan group convert/evaluate untuk melihat biaya fitur fungsi
+- Backend angka float/decimal/fraction pada corpus yang sama (group backend);
+  ringkasan biaya relatif terhadap float dicetak di akhir (lihat
+  backend_report)
+- Timer per tahap (group stats): calculate() asli dengan timer mati/aktif
+  per corpus, ditambah jalur termurah calculate() (stats.guard_off /
+  guard_on: hasil dari result cache) untuk biaya absolut per panggilan,
+  dirangkum oleh stats_report
+- Calculator.calculate bersama dari thread pool 1/2/4/8 worker (group
+  threads); setiap run memeriksa hasil dan jumlah history, ringkasan
+  throughput relatif terhadap 1 worker dicetak di akhir (lihat
+  thread_report). Di build dengan GIL throughput tidak naik; di build
+  free-threaded (python3.13t) seharusnya naik mendekati jumlah core
+- Startup proses baru (group startup): Python kosong vs mode one-shot
+  `calc.py "3 + 4 * 2"`; startup_report membandingkan selisihnya
+  dan total `-X importtime` dengan STARTUP_BUDGET_MS (exit code 1 jika
+  melebihi budget)
+
+CARA KERJA:
+1. Ekspresi dibuat oleh GENERATOR sintetis dengan seed tetap
+   (hasil selalu sama → bisa dibandingkan antar versi)
+2. Setiap benchmark dijalankan beberapa kali WARM-UP dulu (tidak dihitung)
+3. Lalu diukur `repeat` kali dengan time.perf_counter_ns()
+4. Statistik (min, median, mean, stdev, p95) dihitung per operasi
+5. Hasil ditulis sebagai JSON (machine-readable)
+
+Benchmark baru cukup didaftarkan dengan decorator @register.
+
+CARA PAKAI:
+    python Benchmark.py                          # semua benchmark
+    python Benchmark.py --quick                  # corpus kecil, cepat
+    python Benchmark.py --group evaluate         # hanya satu group
+    python Benchmark.py --group startup          # budget startup one-shot
+    python Benchmark.py -o before.json
+    python Benchmark.py -o after.json --compare before.json
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ============================================================================
+# GENERATOR EKSPRESI SINTETIS
+# ============================================================================
+
+def generate_expression(rng, length, depth, operators):
+    """
+    Membuat satu ekspresi infix acak (dengan spasi antar token).
+
+    Args:
+        rng (random.Random): Random generator (seed tetap)
+        length (int): Jumlah operand di level ini
+        depth (int): Kedalaman nesting tanda kurung maksimal
+        operators (str): Operator yang boleh dipakai, misal "+-*/^"
+
+    Returns:
+        str: Ekspresi infix, misal "( 12 + 7 ) * 3"
+    """
+    parts = []
+    previous = None
+    for i in range(length):
+        if i > 0:
+            operator = rng.choice(operators)
+            # Hindari rantai pangkat (angka bisa meledak / overflow)
+            while operator == '^' and previous == '^' and len(operators) > 1:
+                operator = rng.choice(operators)
+            parts.append(operator)
+            previous = operator
+        if previous in ('/', '^'):
+            # Operand kanan '/' dan '^' selalu angka kecil bukan nol
+            parts.append(str(rng.randint(1, 3)))
+        elif depth > 0 and rng.random() < 0.3:
+            inner = generate_expression(rng, rng.randint(2, 4), depth - 1, operators)
+            parts.append(f"( {inner} )")
+        else:
+            parts.append(str(rng.randint(1, 99)))
+    return ' '.join(parts)
+
+
+def build_corpus(size, length, depth, operators, seed=2026):
+    """
+    Membuat corpus ekspresi yang valid (bisa dievaluasi tanpa error).
+
+    Args:
+        size (int): Jumlah ekspresi
+        length (int): Jumlah operand per ekspresi (level teratas)
+        depth (int): Kedalaman nesting maksimal
+        operators (str): Operator yang boleh dipakai
+        seed (int): Seed random (corpus sama untuk seed sama)
+
+    Returns:
+        list: List ekspresi infix
+    """
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+
+    rng = random.Random(seed)
+    corpus = []
+    while len(corpus) < size:
+        expression = generate_expression(rng, length, depth, operators)
+        try:
+            run_program(infix_to_program(expression))
+        except (ValueError, ArithmeticError):
+            continue  # Buang ekspresi yang error (misal pembagian nol)
+        corpus.append(expression)
+    return corpus
+
+
+def build_redundant_corpus(size, repeats=6, seed=2026):
+    """
+    Membuat corpus ekspresi dengan sub-ekspresi yang BERULANG,
+    seperti formula hasil rules engine (untuk benchmark CSE).
+
+    Contoh: ( a * b + c ) * ( a * b + c ) - ( a * b + c ) / 2
+
+    Args:
+        size (int): Jumlah ekspresi
+        repeats (int): Berapa kali sub-ekspresi diulang per ekspresi
+        seed (int): Seed random
+
+    Returns:
+        list: List ekspresi infix (variabel a, b, c; lihat REDUNDANT_VARIABLES)
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        inner = generate_expression(rng, 3, 0, '+-*').split()
+        # Ganti sebagian angka dengan variabel supaya tidak bisa di-fold
+        inner = [rng.choice('abc') if token.isdigit() and rng.random() < 0.6 else token
+                 for token in inner]
+        shared = f"( {' '.join(inner)} )"
+        parts = [shared]
+        for _ in range(repeats - 1):
+            parts.append(rng.choice('+-*'))
+            parts.append(shared)
+        corpus.append(' '.join(parts))
+    return corpus
+
+
+# Nilai variabel untuk corpus redundant
+REDUNDANT_VARIABLES = {'a': 1.5, 'b': 2.25, 'c': -0.75}
+
+
+def build_function_corpus(size, seed=2026):
+    """
+    Membuat corpus ekspresi yang memakai fungsi dan minus unary.
+
+    Contoh: sqrt( 12 ) * -7 + max( 3 , 41 , 5 ) - abs( 8 )
+
+    Args:
+        size (int): Jumlah ekspresi
+        seed (int): Seed random
+
+    Returns:
+        list: List ekspresi infix (selalu valid: argumen sqrt/log positif)
+    """
+    rng = random.Random(seed)
+    wrappers = [
+        lambda n: f"sqrt( {n} )",
+        lambda n: f"log( {n} )",
+        lambda n: f"abs( {n} )",
+        lambda n: f"-{n}",
+        lambda n: f"max( {n} , {rng.randint(1, 99)} , {rng.randint(1, 99)} )",
+        lambda n: f"min( {n} , {rng.randint(1, 99)} )",
+    ]
+    corpus = []
+    for _ in range(size):
+        tokens = generate_expression(rng, 16, 1, '+-*/').split()
+        # Sebagian angka (yang bukan operand kanan '/') dibungkus fungsi
+        tokens = [rng.choice(wrappers)(token)
+                  if token.isdigit() and previous != '/' and rng.random() < 0.4 else token
+                  for previous, token in zip([None] + tokens, tokens)]
+        corpus.append(' '.join(tokens))
+    return corpus
+
+
+# Corpus standar: (nama, length, depth, operators)
+CORPORA = [
+    ('short', 4, 0, '+-*/'),
+    ('medium', 16, 1, '+-*/^'),
+    ('long', 64, 1, '+-*/^'),
+    ('nested', 8, 4, '+-*/'),
+    ('additive', 32, 0, '+-'),
+    ('multiplicative', 32, 0, '*/'),
+]
+
+
+# ============================================================================
+# PENGUKURAN & STATISTIK
+# ============================================================================
+
+def measure(func, repeat=7, warmup=2):
+    """
+    Mengukur waktu eksekusi func() beberapa kali.
+
+    Args:
+        func (callable): Fungsi tanpa argumen yang diukur
+        repeat (int): Jumlah pengukuran
+        warmup (int): Jumlah run awal yang tidak dihitung
+
+    Returns:
+        list: Waktu per run dalam nanosecond
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def summarize(samples, operations):
+    """
+    Menghitung statistik per operasi dari sampel waktu.
+
+    Args:
+        samples (list): Waktu per run (ns)
+        operations (int): Jumlah operasi per run
+
+    Returns:
+        dict: min, median, mean, stdev, p95 (ns per operasi) + jumlah sampel
+    """
+    per_op = sorted(sample / operations for sample in samples)
+    p95_index = min(len(per_op) - 1, int(round(0.95 * (len(per_op) - 1))))
+    return {
+        'min_ns': per_op[0],
+        'median_ns': statistics.median(per_op),
+        'mean_ns': statistics.mean(per_op),
+        'stdev_ns': statistics.stdev(per_op) if len(per_op) > 1 else 0.0,
+        'p95_ns': per_op[p95_index],
+        'samples': len(per_op),
+        'operations': operations,
+    }
+
+
+class NullWriter:
+    """
+    Stream yang membuang semua output (untuk benchmark Calculator.calculate).
+    """
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+# ============================================================================
+# REGISTRY BENCHMARK
+# ============================================================================
+
+# name → (group, factory, uses_corpus)
+BENCHMARKS = {}
+
+
+def register(name, group, uses_corpus=True):
+    """
+    Decorator untuk mendaftarkan benchmark.
+
+    Factory menerima corpus (list ekspresi) dan mengembalikan tuple
+    (func, operations): func() menjalankan satu run, operations = jumlah
+    operasi dalam satu run (untuk menghitung waktu per operasi).
+    Factory yang memakai resource (thread pool, direktori sementara)
+    mengembalikan (func, operations, cleanup): cleanup() dipanggil runner
+    setelah pengukuran selesai, juga jika pengukuran gagal.
+
+    Args:
+        name (str): Nama benchmark
+        group (str): Group, misal 'convert' atau 'evaluate'
+        uses_corpus (bool): False jika benchmark tidak tergantung corpus
+    """
+    def decorator(factory):
+        BENCHMARKS[name] = (group, factory, uses_corpus)
+        return factory
+    return decorator
+
+
+@register('stack.push_pop', 'stack', uses_corpus=False)
+def bench_stack_push_pop(corpus):
+    from Stack import Stack
+    items = list(range(1000))
+
+    def run():
+        stack = Stack()
+        for item in items:
+            stack.push(item)
+        while not stack.is_empty():
+            stack.pop()
+    return run, len(items)
+
+
+@register('convert.infix_to_postfix', 'convert')
+def bench_infix_to_postfix(corpus):
+    from Infix_to_Postfix import infix_to_postfix
+
+    def run():
+        for expression in corpus:
+            infix_to_postfix(expression)
+    return run, len(corpus)
+
+
+@register('convert.infix_to_program', 'convert')
+def bench_infix_to_program(corpus):
+    from Infix_to_Postfix import infix_to_program
+
+    def run():
+        for expression in corpus:
+            infix_to_program(expression)
+    return run, len(corpus)
+
+
+@register('convert.char_loop', 'convert')
+def bench_char_loop(corpus):
+    # Loop per karakter lama (sekarang hanya dipakai untuk step-by-step)
+    from Infix_to_Postfix import char_loop_to_program
+
+    def run():
+        for expression in corpus:
+            char_loop_to_program(expression)
+    return run, len(corpus)
+
+
+@register('convert.tokens_to_program', 'convert')
+def bench_tokens_to_program(corpus):
+    # Jalur dua tahap (list token lalu Shunting Yard), dipakai Bulk_Ingest
+    from Infix_to_Postfix import tokens_to_program
+    from Tokenizer import tokenize
+
+    def run():
+        for expression in corpus:
+            tokens_to_program(tokenize(expression))
+    return run, len(corpus)
+
+
+@register('convert.tokenize', 'convert')
+def bench_tokenize(corpus):
+    from Tokenizer import tokenize
+
+    def run():
+        for expression in corpus:
+            tokenize(expression)
+    return run, len(corpus)
+
+
+@register('evaluate.evaluate_postfix_str', 'evaluate')
+def bench_evaluate_postfix_str(corpus):
+    from Infix_to_Postfix import infix_to_postfix
+    from Postfix_Evaluator import evaluate_postfix
+    postfix = [infix_to_postfix(expression) for expression in corpus]
+
+    def run():
+        for expression in postfix:
+            evaluate_postfix(expression)
+    return run, len(corpus)
+
+
+@register('evaluate.evaluate_postfix_program', 'evaluate')
+def bench_evaluate_postfix_program(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_Evaluator import evaluate_postfix
+    programs = [infix_to_program(expression) for expression in corpus]
+
+    def run():
+        for program in programs:
+            evaluate_postfix(program)
+    return run, len(corpus)
+
+
+@register('evaluate.vm', 'evaluate')
+def bench_vm(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+    programs = [infix_to_program(expression) for expression in corpus]
+
+    def run():
+        for program in programs:
+            run_program(program)
+    return run, len(corpus)
+
+
+@register('evaluate.codegen', 'evaluate')
+def bench_codegen(corpus):
+    # Fungsi sudah di-compile (rumus panas); biaya compile ada di evaluate.codegen_cold
+    from Infix_to_Postfix import infix_to_program
+    from Codegen import compile_program
+    functions = [compile_program(infix_to_program(expression)) for expression in corpus]
+
+    def run():
+        for function in functions:
+            function()
+    return run, len(corpus)
+
+
+@register('evaluate.codegen_cold', 'evaluate')
+def bench_codegen_cold(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Codegen import compile_program
+    programs = [infix_to_program(expression) for expression in corpus]
+
+    def run():
+        for program in programs:
+            compile_program(program)()
+    return run, len(corpus)
+
+
+@register('evaluate.vm_optimized', 'evaluate')
+def bench_vm_optimized(corpus):
+    # Corpus hanya berisi angka, jadi optimizer mem-fold semuanya:
+    # ini batas atas keuntungan optimizer dibanding evaluate.vm
+    from Infix_to_Postfix import infix_to_program
+    from Optimizer import optimize
+    from Postfix_VM import run_program
+    programs = [optimize(infix_to_program(expression))[0] for expression in corpus]
+
+    def run():
+        for program in programs:
+            run_program(program)
+    return run, len(corpus)
+
+
+@register('cse.vm_plain', 'cse', uses_corpus=False)
+def bench_cse_plain(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+    programs = [infix_to_program(expression) for expression in build_redundant_corpus(200)]
+
+    def run():
+        for program in programs:
+            run_program(program, REDUNDANT_VARIABLES)
+    return run, len(programs)
+
+
+@register('cse.vm_shared', 'cse', uses_corpus=False)
+def bench_cse_shared(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Expression_Tree import eliminate_common_subexpressions
+    from Postfix_VM import run_program
+    programs = [eliminate_common_subexpressions(infix_to_program(expression))[0]
+                for expression in build_redundant_corpus(200)]
+
+    def run():
+        for program in programs:
+            run_program(program, REDUNDANT_VARIABLES)
+    return run, len(programs)
+
+
+@register('functions.convert', 'functions', uses_corpus=False)
+def bench_functions_convert(corpus):
+    from Infix_to_Postfix import infix_to_program
+    expressions = build_function_corpus(200)
+
+    def run():
+        for expression in expressions:
+            infix_to_program(expression)
+    return run, len(expressions)
+
+
+@register('functions.vm', 'functions', uses_corpus=False)
+def bench_functions_vm(corpus):
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+    programs = [infix_to_program(expression) for expression in build_function_corpus(200)]
+
+    def run():
+        for program in programs:
+            run_program(program)
+    return run, len(programs)
+
+
+def _bench_backend(corpus, backend):
+    from Infix_to_Postfix import infix_to_program
+    from Numeric_Backend import get_backend
+    run_backend = get_backend(backend).run
+    programs = [infix_to_program(expression) for expression in corpus]
+
+    def run():
+        for program in programs:
+            run_backend(program)
+    return run, len(corpus)
+
+
+@register('backend.float', 'backend')
+def bench_backend_float(corpus):
+    return _bench_backend(corpus, 'float')
+
+
+@register('backend.decimal', 'backend')
+def bench_backend_decimal(corpus):
+    return _bench_backend(corpus, 'decimal')
+
+
+@register('backend.fraction', 'backend')
+def bench_backend_fraction(corpus):
+    return _bench_backend(corpus, 'fraction')
+
+
+@register('end_to_end.calculate', 'end_to_end')
+def bench_calculate(corpus):
+    from Calculator import Calculator
+    # calculate() selalu menampilkan hasil, output dibuang ke NullWriter
+    calc = Calculator(output=NullWriter())
+
+    def run():
+        for expression in corpus:
+            calc.calculate(expression)
+        calc.history.clear()
+    return run, len(corpus)
+
+
+def _bench_calculate_stats(corpus, enabled):
+    from Calculator import Calculator
+    calc = Calculator(output=NullWriter(), stats=enabled)
+
+    def run():
+        for expression in corpus:
+            calc.calculate(expression)
+        calc.history.clear()
+        calc.stats(reset=True)
+    return run, len(corpus)
+
+
+@register('stats.calculate_off', 'stats')
+def bench_calculate_stats_off(corpus):
+    return _bench_calculate_stats(corpus, False)
+
+
+@register('stats.calculate_on', 'stats')
+def bench_calculate_stats_on(corpus):
+    return _bench_calculate_stats(corpus, True)
+
+
+def _bench_calculate_floor(enabled):
+    # calculate() asli pada jalur termurah: satu ekspresi konstan yang hasilnya
+    # dari result cache, jadi porsi kode timer per panggilan paling besar
+    from Calculator import Calculator
+    calc = Calculator(output=NullWriter(), stats=enabled, result_cache_size=1)
+    operations = 1000
+
+    def run():
+        for _ in range(operations):
+            calc.calculate("3 + 4")
+        calc.history.clear()
+        calc.stats(reset=True)
+    return run, operations
+
+
+@register('stats.guard_off', 'stats', uses_corpus=False)
+def bench_stats_guard_off(corpus):
+    return _bench_calculate_floor(False)
+
+
+@register('stats.guard_on', 'stats', uses_corpus=False)
+def bench_stats_guard_on(corpus):
+    return _bench_calculate_floor(True)
+
+
+@register('end_to_end.evaluate_cold', 'end_to_end')
+def bench_evaluate_cold(corpus):
+    from Calculator import Calculator
+
+    def run():
+        calc = Calculator(cache_size=0)
+        for expression in corpus:
+            calc.evaluate(expression)
+    return run, len(corpus)
+
+
+@register('end_to_end.evaluate_disk_warm', 'end_to_end')
+def bench_evaluate_disk_warm(corpus):
+    # Sama dengan evaluate_cold (Calculator baru, cache RAM kosong), tapi
+    # program dibaca dari cache di disk yang sudah diisi proses sebelumnya
+    import tempfile
+    from Calculator import Calculator
+    from Program_Disk_Cache import ProgramDiskCache
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, 'programs.cache')
+    warm_up = Calculator(cache_size=0, program_cache=ProgramDiskCache(path))
+    for expression in corpus:
+        warm_up.evaluate(expression)
+    warm_up.program_cache.close()
+
+    def run():
+        calc = Calculator(cache_size=0, program_cache=ProgramDiskCache(path))
+        for expression in corpus:
+            calc.evaluate(expression)
+    return run, len(corpus), directory.cleanup
+
+
+@register('end_to_end.evaluate_cached', 'end_to_end')
+def bench_evaluate_cached(corpus):
+    from Calculator import Calculator
+    calc = Calculator(cache_size=len(corpus))
+
+    def run():
+        for expression in corpus:
+            calc.evaluate(expression)
+    return run, len(corpus)
+
+
+@register('end_to_end.evaluate_metrics', 'end_to_end')
+def bench_evaluate_metrics(corpus):
+    # Sama dengan evaluate_cached + metrics Prometheus (counter + histogram)
+    from Calculator import Calculator
+    calc = Calculator(cache_size=len(corpus), metrics=True)
+
+    def run():
+        for expression in corpus:
+            calc.evaluate(expression)
+    return run, len(corpus)
+
+
+@register('end_to_end.evaluate_result_cached', 'end_to_end')
+def bench_evaluate_result_cached(corpus):
+    # Corpus hanya berisi konstanta: setelah warm-up semua hasil dari result cache
+    from Calculator import Calculator
+    calc = Calculator(cache_size=len(corpus), result_cache_size=len(corpus))
+
+    def run():
+        for expression in corpus:
+            calc.evaluate(expression)
+    return run, len(corpus)
+
+
+def _bench_threads(corpus, workers):
+    # Satu Calculator dipakai BERSAMA oleh semua thread (cache, history, output)
+    from Calculator import Calculator
+    calc = Calculator(output=NullWriter())
+    expected = [calc.evaluate(expression) for expression in corpus]
+    chunks = [corpus[i::workers] for i in range(workers)]
+    pool = ThreadPoolExecutor(max_workers=workers)
+
+    def work(chunk):
+        return [calc.calculate(expression) for expression in chunk]
+
+    def run():
+        results = list(pool.map(work, chunks))
+        # Hasil harus sama dengan evaluasi serial dan tidak ada history yang hilang
+        for i, chunk_results in enumerate(results):
+            if chunk_results != expected[i::workers]:
+                raise AssertionError(f"Hasil salah di {workers} thread (chunk {i})")
+        if calc.history.total != len(corpus):
+            raise AssertionError(f"History hilang: {calc.history.total} != {len(corpus)}")
+        calc.history.clear()
+    return run, len(corpus), pool.shutdown
+
+
+@register('threads.calculate_w1', 'threads')
+def bench_threads_w1(corpus):
+    return _bench_threads(corpus, 1)
+
+
+@register('threads.calculate_w2', 'threads')
+def bench_threads_w2(corpus):
+    return _bench_threads(corpus, 2)
+
+
+@register('threads.calculate_w4', 'threads')
+def bench_threads_w4(corpus):
+    return _bench_threads(corpus, 4)
+
+
+@register('threads.calculate_w8', 'threads')
+def bench_threads_w8(corpus):
+    return _bench_threads(corpus, 8)
+
+
+# Startup: setiap run = satu proses Python baru (interpreter + import + hasil).
+# PYTHONDONTWRITEBYTECODE dihapus supaya .pyc dipakai seperti instalasi biasa
+# (tanpa itu setiap run ikut meng-compile semua source).
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Budget mode one-shot di atas Python kosong (ms), lihat startup_report()
+STARTUP_BUDGET_MS = 10.0
+
+
+def _subprocess_env():
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def _bench_process(args, expected=None):
+    command = [sys.executable] + args
+    env = _subprocess_env()
+
+    def run():
+        done = subprocess.run(command, cwd=SOURCE_DIR, env=env, capture_output=True, text=True)
+        if done.returncode != 0 or (expected is not None and done.stdout != expected):
+            raise AssertionError(f"{' '.join(args)}: exit {done.returncode}, "
+                                 f"stdout {done.stdout!r}, stderr {done.stderr!r}")
+    return run, 1
+
+
+@register('startup.python_bare', 'startup', uses_corpus=False)
+def bench_startup_bare(corpus):
+    return _bench_process(['-c', 'pass'])
+
+
+@register('startup.one_shot', 'startup', uses_corpus=False)
+def bench_startup_one_shot(corpus):
+    # Lewat launcher calc.py: Calculator di-import dari .pyc
+    return _bench_process(['calc.py', '3 + 4 * 2'], expected='11.0\n')
+
+
+@register('startup.one_shot_script', 'startup', uses_corpus=False)
+def bench_startup_one_shot_script(corpus):
+    # Pembanding: Calculator.py sebagai __main__ selalu di-compile dari source
+    return _bench_process(['Calculator.py', '3 + 4 * 2'], expected='11.0\n')
+
+
+@register('startup.import_calculator', 'startup', uses_corpus=False)
+def bench_startup_import(corpus):
+    return _bench_process(['-c', 'import Calculator'])
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_benchmarks(corpus_size=200, repeat=7, warmup=2, group=None, name_filter=None,
+                   seed=2026):
+    """
+    Menjalankan semua benchmark yang cocok dengan filter.
+
+    Args:
+        corpus_size (int): Jumlah ekspresi per corpus
+        repeat (int): Jumlah pengukuran per benchmark
+        warmup (int): Jumlah warm-up run per benchmark
+        group (str, optional): Hanya jalankan group ini
+        name_filter (str, optional): Hanya benchmark yang namanya mengandung ini
+        seed (int): Seed generator corpus
+
+    Returns:
+        dict: Laporan lengkap (meta + results), siap di-dump ke JSON
+    """
+    corpora = {name: build_corpus(corpus_size, length, depth, operators, seed)
+               for name, length, depth, operators in CORPORA}
+
+    results = []
+    for name, (bench_group, factory, uses_corpus) in BENCHMARKS.items():
+        if group is not None and bench_group != group:
+            continue
+        if name_filter is not None and name_filter not in name:
+            continue
+
+        corpus_names = list(corpora) if uses_corpus else [None]
+        for corpus_name in corpus_names:
+            func, operations, *cleanup = factory(corpora.get(corpus_name, []))
+            try:
+                stats = summarize(measure(func, repeat, warmup), operations)
+            finally:
+                for release in cleanup:
+                    release()
+            results.append({'name': name, 'group': bench_group,
+                            'corpus': corpus_name, 'stats': stats})
+            label = f"{name} [{corpus_name}]" if corpus_name else name
+            print(f"  {label:55} {stats['median_ns']:12,.0f} ns/op", file=sys.stderr)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'gil_enabled': gil_enabled(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'corpus_size': corpus_size,
+            'repeat': repeat,
+            'warmup': warmup,
+            'seed': seed,
+            'corpora': {name: {'length': length, 'depth': depth, 'operators': operators}
+                        for name, length, depth, operators in CORPORA},
+        },
+        'results': results,
+    }
+
+
+def compare_reports(baseline, current, threshold=0.10):
+    """
+    Membandingkan dua laporan dan mencetak regresi.
+
+    Args:
+        baseline (dict): Laporan lama
+        current (dict): Laporan baru
+        threshold (float): Batas regresi (0.10 = lebih lambat 10%)
+
+    Returns:
+        int: Jumlah benchmark yang regresi
+    """
+    old = {(r['name'], r['corpus']): r['stats']['median_ns'] for r in baseline['results']}
+    regressions = 0
+    for result in current['results']:
+        key = (result['name'], result['corpus'])
+        if key not in old:
+            continue
+        ratio = result['stats']['median_ns'] / old[key]
+        marker = ''
+        if ratio > 1 + threshold:
+            marker = '  ❌ REGRESI'
+            regressions += 1
+        elif ratio < 1 - threshold:
+            marker = '  ✅ lebih cepat'
+        label = f"{key[0]} [{key[1]}]" if key[1] else key[0]
+        print(f"  {label:55} x{ratio:6.2f}{marker}", file=sys.stderr)
+    return regressions
+
+
+def backend_report(report):
+    """
+    Menghitung biaya setiap backend angka relatif terhadap float.
+
+    Args:
+        report (dict): Laporan dari run_benchmarks()
+
+    Returns:
+        dict: {backend: {corpus: rasio median_ns terhadap backend.float}},
+              kosong jika group backend tidak dijalankan
+    """
+    medians = {(r['name'], r['corpus']): r['stats']['median_ns'] for r in report['results']
+               if r['group'] == 'backend'}
+    costs = {}
+    for (name, corpus), median in medians.items():
+        baseline = medians.get(('backend.float', corpus))
+        if name == 'backend.float' or not baseline:
+            continue
+        costs.setdefault(name.split('.', 1)[1], {})[corpus] = round(median / baseline, 2)
+
+    for backend, ratios in costs.items():
+        summary = ', '.join(f"{corpus} x{ratio:.1f}" for corpus, ratio in ratios.items())
+        print(f"  {backend} vs float: {summary}", file=sys.stderr)
+    return costs
+
+
+def stats_report(report):
+    """
+    Menghitung biaya timer per tahap (Stage_Stats.py) di calculate().
+
+    Semua angka berasal dari calculate() yang sebenarnya, bukan dari salinan
+    kode instrumentasi:
+    - guard_off_ns: calculate() termurah dengan timer MATI. Biaya cek
+      timer (satu atribut + lima cek None) termasuk di angka ini, jadi ini
+      batas atasnya
+    - guard_on_ns: jalur yang sama dengan timer aktif; selisihnya
+      (on_cost_ns) = biaya absolut timer per panggilan
+    - per corpus: stats.calculate_off vs stats.calculate_on
+
+    Args:
+        report (dict): Laporan dari run_benchmarks()
+
+    Returns:
+        dict: {'guard_off_ns', 'guard_on_ns', 'on_cost_ns',
+               corpus: {'off_ns', 'on_ns', 'on_pct'}}, kosong jika group
+              stats tidak dijalankan
+    """
+    medians = {(r['name'], r['corpus']): r['stats']['median_ns'] for r in report['results']
+               if r['group'] == 'stats'}
+    costs = {}
+    guard_off = medians.get(('stats.guard_off', None))
+    guard_on = medians.get(('stats.guard_on', None))
+    if guard_off is not None and guard_on is not None:
+        costs['guard_off_ns'] = round(guard_off, 1)
+        costs['guard_on_ns'] = round(guard_on, 1)
+        costs['on_cost_ns'] = round(guard_on - guard_off, 1)
+        print(f"  stage stats jalur termurah: mati {guard_off:.0f} ns, aktif "
+              f"{guard_on:.0f} ns (+{guard_on - guard_off:.0f} ns/calculate)", file=sys.stderr)
+
+    for (name, corpus), off in medians.items():
+        on = medians.get(('stats.calculate_on', corpus))
+        if name != 'stats.calculate_off' or not on:
+            continue
+        costs[corpus] = {'off_ns': round(off, 1), 'on_ns': round(on, 1),
+                         'on_pct': round(100 * (on - off) / off, 1)}
+        print(f"  stage stats [{corpus}]: mati {off:.0f} ns, aktif "
+              f"{on:.0f} ns ({costs[corpus]['on_pct']:+.1f}%)", file=sys.stderr)
+    return costs
+
+
+def gil_enabled():
+    """
+    True jika interpreter berjalan dengan GIL (selalu True sebelum 3.13).
+    """
+    check = getattr(sys, '_is_gil_enabled', None)
+    return check() if check is not None else True
+
+
+def thread_report(report):
+    """
+    Menghitung throughput thread pool relatif terhadap 1 worker.
+
+    Args:
+        report (dict): Laporan dari run_benchmarks()
+
+    Returns:
+        dict: {workers: {corpus: speedup}} (>1 = lebih cepat dari 1 worker),
+              kosong jika group threads tidak dijalankan
+    """
+    medians = {(r['name'], r['corpus']): r['stats']['median_ns'] for r in report['results']
+               if r['group'] == 'threads'}
+    scaling = {}
+    for (name, corpus), median in medians.items():
+        baseline = medians.get(('threads.calculate_w1', corpus))
+        if not baseline:
+            continue
+        workers = name.rsplit('_w', 1)[1]
+        scaling.setdefault(workers, {})[corpus] = round(baseline / median, 2)
+
+    if scaling:
+        mode = 'GIL' if gil_enabled() else 'free-threaded'
+        for workers, ratios in scaling.items():
+            summary = ', '.join(f"{corpus} x{ratio:.2f}" for corpus, ratio in ratios.items())
+            print(f"  {workers} thread ({mode}): {summary}", file=sys.stderr)
+    return scaling
+
+
+def import_times(module):
+    """
+    Waktu import per module dari `python -X importtime -c "import <module>"`.
+
+    Module yang sudah di-import oleh interpreter kosong (`-c pass`) tidak
+    dihitung, jadi hasilnya hanya biaya import tambahan dari module ini.
+
+    Args:
+        module (str): Nama module, misal 'Calculator'
+
+    Returns:
+        dict: {module: (self_us, cumulative_us)}
+    """
+    def parse(code):
+        done = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=SOURCE_DIR,
+                              env=_subprocess_env(), capture_output=True, text=True, check=True)
+        times = {}
+        for line in done.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            own, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = (int(own), int(cumulative))
+        return times
+
+    parse(f'import {module}')   # Warm-up: .pyc ditulis dulu
+    bare = parse('pass')
+    return {name: value for name, value in parse(f'import {module}').items()
+            if name not in bare}
+
+
+def startup_report(report, budget_ms=STARTUP_BUDGET_MS):
+    """
+    Membandingkan startup mode one-shot dengan Python kosong.
+
+    Dua angka dicek terhadap budget:
+    - overhead_ms: min waktu proses `calc.py "3 + 4 * 2"` dikurangi
+      min waktu `python -c pass` (group startup)
+    - import_ms: total `-X importtime` untuk `import Calculator`
+
+    Args:
+        report (dict): Laporan dari run_benchmarks()
+        budget_ms (float): Batas (ms) untuk kedua angka
+
+    Returns:
+        dict: {'bare_ms', 'one_shot_ms', 'overhead_ms', 'import_ms',
+               'slowest_imports', 'budget_ms', 'within_budget'},
+              kosong jika group startup tidak dijalankan
+    """
+    minimums = {r['name']: r['stats']['min_ns'] / 1e6 for r in report['results']
+                if r['group'] == 'startup'}
+    bare = minimums.get('startup.python_bare')
+    one_shot = minimums.get('startup.one_shot')
+    if bare is None or one_shot is None:
+        return {}
+
+    times = import_times('Calculator')
+    import_ms = times['Calculator'][1] / 1e3
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:5]
+    overhead = one_shot - bare
+    within = overhead <= budget_ms and import_ms <= budget_ms
+
+    print(f"  startup one-shot: {one_shot:.1f} ms (python kosong {bare:.1f} ms, "
+          f"+{overhead:.1f} ms), import Calculator {import_ms:.1f} ms, "
+          f"budget {budget_ms:.0f} ms {'✅' if within else '❌'}", file=sys.stderr)
+    print("  import paling lambat: " +
+          ', '.join(f"{name} {own / 1e3:.1f} ms" for name, (own, _) in slowest), file=sys.stderr)
+    return {
+        'bare_ms': round(bare, 2),
+        'one_shot_ms': round(one_shot, 2),
+        'overhead_ms': round(overhead, 2),
+        'import_ms': round(import_ms, 2),
+        'slowest_imports': {name: round(own / 1e3, 2) for name, (own, _) in slowest},
+        'budget_ms': budget_ms,
+        'within_budget': within,
+    }
+
+
+def main(argv=None):
+    """
+    Entry point CLI benchmark.
+
+    Args:
+        argv (list, optional): Argumen command line (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code (1 jika ada regresi saat --compare atau startup
+             melebihi STARTUP_BUDGET_MS)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Stack Calculator.")
+    parser.add_argument('-o', '--output', help="Tulis laporan JSON ke file (default: stdout)")
+    parser.add_argument('--quick', action='store_true', help="Corpus kecil, repeat sedikit")
+    parser.add_argument('--corpus-size', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--group', help="Hanya jalankan satu group benchmark")
+    parser.add_argument('--filter', help="Hanya benchmark yang namanya mengandung teks ini")
+    parser.add_argument('--compare', help="Laporan JSON lama untuk deteksi regresi")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Batas regresi untuk --compare (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.corpus_size = min(args.corpus_size, 50)
+        args.repeat = min(args.repeat, 3)
+        args.warmup = min(args.warmup, 1)
+
+    report = run_benchmarks(args.corpus_size, args.repeat, args.warmup,
+                            args.group, args.filter, args.seed)
+
+    costs = backend_report(report)
+    if costs:
+        report['backend_costs'] = costs
+
+    overhead = stats_report(report)
+    if overhead:
+        report['stats_overhead'] = overhead
+
+    scaling = thread_report(report)
+    if scaling:
+        report['thread_scaling'] = scaling
+
+    startup = startup_report(report)
+    if startup:
+        report['startup'] = startup
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    # Kedua pemeriksaan selalu dijalankan (laporan regresi tetap dicetak
+    # walaupun startup melebihi budget)
+    status = 0
+    if startup and not startup['within_budget']:
+        status = 1
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_reports(baseline, report, args.threshold):
+            status = 1
+    return status
+
+
+# ============================================================================
+# MAIN PROGRAM
+# ============================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Bulk Ingest - Memory-Mapped Input untuk File Ekspresi Sangat Besar
+===================================================================
+
+File ini berisi mode "bulk ingest" untuk file ekspresi berukuran
+puluhan GB.
+
+KENAPA TIDAK PAKAI for line in file?
+Iterasi baris biasa membuat object str baru untuk SETIAP baris
+(copy + decode UTF-8), lalu tokenizer membaca per karakter lagi.
+Untuk file 10+ GB, copy dan decode inilah yang paling lama.
+
+CARA KERJA:
+1. File di-memory-map (mmap) secara read-only → isi file tidak di-copy
+   ke memory Python, OS yang mengatur paging
+2. Batas baris dicari langsung di buffer bytes dengan mmap.find(b'\\n')
+3. Token (angka, operator, kurung, variabel) dibaca langsung dari buffer
+   memakai regex bytes dengan pos/endpos (tanpa slicing baris)
+4. Token masuk ke tokens_to_program() → PostfixProgram → engine VM,
+   pipeline yang sama dengan infix_to_program/evaluate_postfix
+
+Setiap result record membawa OFFSET (posisi byte awal baris di file),
+sehingga baris yang error bisa langsung dicari dengan seek(offset)
+tanpa membaca ulang file dari awal.
+
+CARA PAKAI:
+    python Bulk_Ingest.py expressions.txt -o results.txt
+    python Bulk_Ingest.py                      # testing section
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import argparse
+import mmap
+import re
+import sys
+import time
+
+import Tokenizer
+from Infix_to_Postfix import tokens_to_program
+from Postfix_VM import run_program
+
+
+# Regex Tokenizer.TOKEN_PATTERN yang sama, di-compile untuk bytes (tidak
+# disalin, supaya kedua tokenizer tidak bisa berbeda). Group yang match
+# menentukan jenisnya:
+#   1 = angka biasa, 2 = angka lain, 3 = nama fungsi, 4 = nama variabel,
+#   5 = operator, 6 = '(', 7 = ')', 8 = ',', 9 = karakter lain,
+#   None = hanya whitespace di akhir baris
+TOKEN_PATTERN = re.compile(Tokenizer.TOKEN_PATTERN.pattern.encode('ascii'))
+
+# Baris kosong atau komentar ('#') dilewati
+BLANK_PATTERN = re.compile(rb'[ \t\r]*(?:#|$)')
+
+# Byte operator → simbol str (tanpa decode per token)
+OPERATOR_BYTES = {ord(symbol): symbol for symbol in '+-*/^'}
+
+
+def iter_line_spans(buffer):
+    """
+    Mencari batas setiap baris di buffer TANPA meng-copy isinya.
+
+    Args:
+        buffer: mmap atau bytes
+
+    Yields:
+        tuple: (start, end) posisi byte baris (end = posisi '\\n')
+    """
+    position = 0
+    size = len(buffer)
+    find = buffer.find
+    while position < size:
+        end = find(b'\n', position)
+        if end == -1:
+            end = size
+        yield position, end
+        position = end + 1
+
+
+def scan_tokens(buffer, start, end):
+    """
+    Tokenize satu baris langsung dari buffer bytes.
+
+    Args:
+        buffer: mmap atau bytes
+        start (int): Posisi awal baris
+        end (int): Posisi akhir baris (exclusive)
+
+    Yields:
+        tuple: (kind, value, offset) untuk tokens_to_program()
+
+    Raises:
+        ValueError: Jika ada angka invalid atau karakter yang tidak dikenal
+                    (pesan berisi offset byte karakter itu di buffer)
+    """
+    for match in TOKEN_PATTERN.finditer(buffer, start, end):
+        kind = match.lastindex
+        if kind is None:
+            break  # Hanya whitespace di akhir baris
+        offset = match.start(kind)
+        if kind == 1:
+            # Angka biasa: pasti valid untuk float(), tidak perlu validasi
+            yield 'number', match.group(1).decode('ascii'), offset
+        elif kind == 5:
+            yield 'operator', OPERATOR_BYTES[buffer[offset]], offset
+        elif kind == 6:
+            yield '(', '(', offset
+        elif kind == 7:
+            yield ')', ')', offset
+        elif kind == 4:
+            yield 'name', match.group(4).decode('ascii'), offset
+        elif kind == 3:
+            yield 'function', match.group(3).decode('ascii'), offset
+        elif kind == 8:
+            yield ',', ',', offset
+        elif kind == 2:
+            text = match.group(2)
+            try:
+                # float() bisa langsung mem-parse bytes (validasi tanpa decode)
+                float(text)
+            except ValueError:
+                raise ValueError(f"Error: Angka '{text.decode('ascii')}' tidak valid!")
+            yield 'number', text.decode('ascii'), offset
+        else:
+            char = match.group(9).decode('utf-8', 'replace')
+            raise ValueError(f"Error: Karakter '{char}' tidak dikenal (offset {offset})!")
+
+
+def ingest_buffer(buffer, variables=None):
+    """
+    Mengevaluasi setiap baris ekspresi di buffer.
+
+    Args:
+        buffer: mmap atau bytes berisi ekspresi (satu per baris)
+        variables (dict, optional): Nilai variabel untuk semua baris
+
+    Yields:
+        dict: Result record per baris:
+              line, offset, result, error, error_type
+    """
+    blank = BLANK_PATTERN.match
+    for line_number, (start, end) in enumerate(iter_line_spans(buffer), 1):
+        if blank(buffer, start, end):
+            continue
+        try:
+            program = tokens_to_program(scan_tokens(buffer, start, end))
+            result = run_program(program, variables)
+        except (ValueError, ArithmeticError) as e:
+            yield {'line': line_number, 'offset': start, 'result': None,
+                   'error': str(e), 'error_type': type(e).__name__}
+            continue
+        yield {'line': line_number, 'offset': start, 'result': result,
+               'error': None, 'error_type': None}
+
+
+def ingest_file(path, variables=None):
+    """
+    Memory-map file lalu evaluasi setiap baris (lihat ingest_buffer).
+
+    Args:
+        path (str): Path file ekspresi
+        variables (dict, optional): Nilai variabel untuk semua baris
+
+    Yields:
+        dict: Result record per baris (dengan offset byte di file)
+
+    Example:
+        for record in ingest_file("expressions.txt"):
+            if record['error']:
+                print(record['offset'], record['error'])
+    """
+    with open(path, 'rb') as f:
+        # mmap tidak bisa dibuat untuk file kosong
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from ingest_buffer(buffer, variables)
+
+
+def format_record(record):
+    """
+    Format result record menjadi satu baris output.
+
+    Args:
+        record (dict): Record dari ingest_buffer()
+
+    Returns:
+        str: Hasil, atau "ERROR offset N (line L): Type: pesan"
+    """
+    if record['error'] is None:
+        return str(record['result'])
+    return (f"ERROR offset {record['offset']} (line {record['line']}): "
+            f"{record['error_type']}: {record['error']}")
+
+
+def main(argv=None):
+    """
+    Entry point CLI bulk ingest.
+
+    Args:
+        argv (list, optional): Argumen command line (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code
+    """
+    from Stream_Evaluator import write_buffered
+
+    parser = argparse.ArgumentParser(
+        description="Evaluasi file ekspresi besar dengan memory-mapped input.")
+    parser.add_argument('input', help="File input (harus file, bukan stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="File output (default: '-' = stdout)")
+    args = parser.parse_args(argv)
+
+    output = (sys.stdout if args.output == '-'
+              else open(args.output, 'w', encoding='utf-8', buffering=1 << 20))
+
+    start = time.perf_counter()
+    try:
+        count = write_buffered(output, map(format_record, ingest_file(args.input)))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"{count} lines in {elapsed:.3f}s ({rate:,.0f} lines/sec)", file=sys.stderr)
+    return 0
+
+
+# ============================================================================
+# MAIN PROGRAM
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Dengan argumen: CLI bulk ingest (lihat main()).
+    Tanpa argumen: testing bulk ingest (dibandingkan dengan Tokenizer dan
+    pipeline infix_to_program → run_program per baris).
+    """
+    if len(sys.argv) > 1:
+        sys.exit(main())
+
+    import os
+    import tempfile
+    from Infix_to_Postfix import infix_to_program
+
+    print("\n" + "="*60)
+    print("TESTING BULK INGEST")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    def expected(expression):
+        try:
+            return run_program(infix_to_program(expression)), None
+        except (ValueError, ArithmeticError) as e:
+            return None, str(e)
+
+    # Test 1: Token sama dengan Tokenizer (jenis, nilai, posisi)
+    corpus = ["3 + 4 * 2", "3+4*2", "  ( 1.5e3 - x ) / 2  ", "max(1, sqrt (16), -y)",
+              "2 ^ -1e-2", "abs(-3) * min(4,5)", "x2 + _y\t* 1E2", ".5 + 1_000 * 2.E4"]
+    for expression in corpus:
+        data = expression.encode('ascii')
+        scanned = [(kind, value, offset)
+                   for kind, value, offset in scan_tokens(data, 0, len(data))]
+        check(f"Token sama dengan Tokenizer: {expression!r}",
+              scanned == Tokenizer.tokenize(expression))
+
+    # Test 2: Hasil per baris sama dengan pipeline biasa, baris kosong dilewati
+    lines = ["3 + 4 * 2", "", "# komentar", "( 1 + 2 ) * 3", "   ", "2 ^ 10 / 4",
+             "1 / 0", "sqrt(-1)", "3 $ 4", "1 +", "1..2 + 3", "max(2, -5, 7)"]
+    data = ('\n'.join(lines) + '\n').encode('ascii')
+    records = list(ingest_buffer(data))
+    expressions = [line for line in lines if line.strip() and not line.startswith('#')]
+    check("Baris kosong dan komentar dilewati", len(records) == len(expressions))
+    # (kecuali "3 $ 4": bulk ingest menyebut offset di file, lihat Test 4)
+    check("Hasil dan error sama dengan pipeline biasa",
+          [(r['result'], r['error']) for r in records if r['line'] != 9] ==
+          [expected(expression) for expression in expressions if '$' not in expression])
+
+    # Test 3: Offset dan nomor baris menunjuk ke baris yang benar
+    check("Offset = posisi byte awal baris",
+          all(data[r['offset']:].split(b'\n', 1)[0].decode('ascii') == lines[r['line'] - 1]
+              for r in records))
+
+    # Test 4: Karakter tidak dikenal menyebut offset byte di file
+    error = next(r for r in records if r['line'] == 9)
+    check("Karakter tidak dikenal berisi offset",
+          error['error'] == f"Error: Karakter '$' tidak dikenal (offset {data.index(b'$')})!")
+    check("format_record error",
+          format_record(error).startswith(f"ERROR offset {error['offset']} (line 9): ValueError"))
+
+    # Test 5: Variabel untuk semua baris
+    records = list(ingest_buffer(b"x * 2\nx + y\n", {'x': 3, 'y': 4}))
+    check("Variabel", [r['result'] for r in records] == [6.0, 7.0])
+
+    # Test 5b: ')' tanpa pasangan adalah error, baris berikutnya tetap jalan
+    unmatched = b"1 + 2\n3 + 4 )\n5\n"
+    records = list(ingest_buffer(unmatched))
+    check("Kurung tutup tanpa pasangan",
+          records[1]['error'] ==
+          f"Error: Kurung tutup tanpa pasangan (posisi {unmatched.index(b')')})!" and
+          [r['result'] for r in records] == [3.0, None, 5.0])
+
+    # Test 6: ingest_file (mmap) dan file kosong
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'expressions.txt')
+        with open(path, 'wb') as f:
+            f.write(data)
+        check("ingest_file sama dengan ingest_buffer",
+              list(ingest_file(path)) == list(ingest_buffer(data)))
+        open(path, 'wb').close()
+        check("File kosong", list(ingest_file(path)) == [])
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,492 @@
+"""
+Calculation Server - asyncio TCP / Unix Socket
+===============================================
+
+File ini berisi server kalkulator berbasis asyncio.
+
+PROTOKOL (newline-delimited):
+- Client mengirim satu ekspresi per baris:   "3 + 4\\n"
+- Server membalas satu baris per ekspresi:   "7.0\\n"
+- Jika error:                                "ERROR ZeroDivisionError: ...\\n"
+- Baris lebih panjang dari line_limit dibalas "ERROR ValueError: ...\\n",
+  lalu koneksi ditutup (sisa baris itu tidak bisa dipisahkan dari request
+  berikutnya)
+
+Balasan SELALU urut sesuai urutan request di koneksi yang sama.
+
+FITUR:
+1. PIPELINING - client boleh mengirim ribuan request tanpa menunggu
+   balasan; server terus membaca sambil mengevaluasi
+2. BACKPRESSURE - request yang sudah dibaca disimpan di queue yang
+   ukurannya terbatas. Jika queue penuh, server berhenti membaca dari
+   socket (TCP flow control yang menahan client), bukan menumpuk memory
+3. BATCH KE EXECUTOR - jika banyak request menumpuk sekaligus (batch
+   besar), evaluasinya dipindah ke thread executor supaya event loop
+   tetap bisa melayani koneksi lain
+4. Evaluasi memakai jalur compiled-expression yang sama dengan
+   Calculator.evaluate() (cache PostfixProgram + engine VM)
+
+5. METRICS (opsional) - --metrics-port menyalakan endpoint HTTP
+   Prometheus (GET /metrics, lihat Metrics.py); registry dipakai
+   bersama oleh semua thread
+6. CACHE PROGRAM DI DISK (opsional) - --program-cache PATH: server yang
+   baru start langsung memakai hasil konversi dari run sebelumnya (lihat
+   Program_Disk_Cache.py); program baru ditulis saat server berhenti
+
+CARA PAKAI:
+    python Calc_Server.py --port 8765
+    python Calc_Server.py --unix /tmp/calc.sock
+    python Calc_Server.py --port 8765 --metrics-port 9100
+    python Calc_Server.py --port 8765 --program-cache /tmp/calc-programs.cache
+    python Calc_Server.py --self-test
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Calculator import Calculator
+from Metrics import MetricsServer
+
+
+def format_response(calc, expression):
+    """
+    Mengevaluasi satu ekspresi dan membuat baris balasan.
+
+    Args:
+        calc (Calculator): Calculator untuk evaluasi
+        expression (str): Ekspresi infix
+
+    Returns:
+        str: Hasil atau "ERROR Type: pesan" (dengan newline)
+
+    Raises:
+        Exception: Selain ValueError/ArithmeticError (bug, bukan input yang
+                   salah) tidak dijadikan balasan; handle_connection lalu
+                   menutup koneksi itu
+    """
+    try:
+        return f"{calc.evaluate(expression)}\n"
+    except (ValueError, ArithmeticError) as e:
+        # Error karena ekspresinya (syntax, variabel, pembagian nol, ...)
+        return f"ERROR {type(e).__name__}: {e}\n"
+
+
+class CalcServer:
+    """
+    Server kalkulator asyncio dengan pipelining dan backpressure.
+
+    Attributes:
+        calc (Calculator): Calculator untuk evaluasi di event loop
+        queue_size (int): Jumlah request maksimal yang menunggu per koneksi
+        batch_size (int): Jumlah request maksimal yang dievaluasi sekaligus
+        executor_threshold (int): Batch sebesar ini atau lebih dikirim ke executor
+        line_limit (int): Panjang maksimal satu baris request (byte)
+
+    Example:
+        server = CalcServer()
+        asyncio.run(server.serve_tcp('127.0.0.1', 8765))
+        server.close()
+    """
+
+    def __init__(self, calc=None, queue_size=4096, batch_size=1024,
+                 executor_threshold=256, executor=None, line_limit=2 ** 16):
+        """
+        Membuat server.
+
+        Args:
+            calc (Calculator, optional): Calculator untuk event loop
+            queue_size (int): Batas queue request per koneksi (backpressure)
+            batch_size (int): Batas jumlah request per batch evaluasi
+            executor_threshold (int): Ukuran batch minimal untuk executor
+            executor (Executor, optional): Executor untuk batch besar
+                                           (default: ThreadPoolExecutor milik
+                                           server, dimatikan oleh close())
+            line_limit (int): Batas buffer baris StreamReader (default 64 KiB,
+                              sama dengan default asyncio)
+        """
+        self.calc = calc if calc is not None else Calculator()
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.executor_threshold = executor_threshold
+        self.line_limit = line_limit
+        # Executor dari luar tetap milik pemanggilnya (tidak dimatikan di close)
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+
+        # Setiap thread executor punya Calculator sendiri (cache tidak dibagi
+        # antar thread), tapi jalur compile + evaluate-nya tetap sama
+        self._local = threading.local()
+
+    def close(self):
+        """
+        Mematikan executor milik server (menunggu batch yang sedang jalan).
+
+        Dipanggil setelah server berhenti listening. Executor yang diberikan
+        lewat argumen `executor` tidak disentuh.
+        """
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    def _thread_calculator(self):
+        calc = getattr(self._local, 'calc', None)
+        if calc is None:
+            calc = Calculator(engine=self.calc.engine, backend=self.calc.backend)
+            # Result cache thread-safe: dipakai bersama oleh semua thread
+            calc.result_cache = self.calc.result_cache
+            # Metrics juga dibagi (counter dilindungi lock)
+            calc.metrics = self.calc.metrics
+            # Cache program di disk juga (satu file, satu pending)
+            calc.program_cache = self.calc.program_cache
+            self._local.calc = calc
+        return calc
+
+    def evaluate_batch(self, expressions):
+        """
+        Mengevaluasi batch ekspresi (dipanggil di thread executor).
+
+        Args:
+            expressions (list): Ekspresi infix
+
+        Returns:
+            str: Gabungan semua baris balasan
+        """
+        calc = self._thread_calculator()
+        return ''.join([format_response(calc, expression) for expression in expressions])
+
+    async def handle_connection(self, reader, writer):
+        """
+        Menangani satu koneksi client.
+
+        Reader dan evaluator berjalan sebagai dua task yang dihubungkan
+        oleh bounded queue (pipelining + backpressure). Jika evaluator
+        selesai lebih dulu (client putus saat balasan ditulis), reader
+        dibatalkan: tanpa itu reader menunggu selamanya di queue.put().
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        reading = asyncio.create_task(self._read_loop(reader, queue))
+        try:
+            if await self._evaluate_loop(queue, writer):
+                # Semua request sudah dibalas; reader sudah selesai (put None).
+                # Baris yang terlalu panjang dibalas terakhir, urut.
+                error = await reading
+                if error is not None:
+                    writer.write(error.encode('utf-8'))
+                    try:
+                        await writer.drain()
+                    except ConnectionError:
+                        pass
+        finally:
+            reading.cancel()
+            try:
+                await reading
+            except asyncio.CancelledError:
+                pass
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_loop(self, reader, queue):
+        """
+        Membaca request per baris ke queue, diakhiri None (akhir input).
+
+        Returns:
+            str: Baris balasan ERROR jika satu baris melebihi line_limit,
+                 None jika input selesai normal (EOF atau client reset)
+        """
+        error = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                expression = line.decode('utf-8', 'replace').strip()
+                if not expression:
+                    continue
+                # put() menunggu jika queue penuh → berhenti membaca socket
+                await queue.put(expression)
+        except ConnectionError:
+            # Client reset koneksi: diperlakukan sebagai akhir input
+            pass
+        except ValueError:
+            # Baris melebihi batas buffer StreamReader. Request itu dibalas
+            # ERROR; sisanya tidak dibaca lagi karena batas baris berikutnya
+            # tidak bisa ditentukan
+            error = (f"ERROR ValueError: Error: Baris request melebihi "
+                     f"{self.line_limit} byte!\n")
+        await queue.put(None)
+        return error
+
+    async def _evaluate_loop(self, queue, writer):
+        """
+        Mengambil request dari queue per batch, evaluasi, dan tulis balasan.
+
+        Returns:
+            bool: True jika semua request sudah dibalas (sampai None),
+                  False jika client putus saat balasan ditulis
+        """
+        loop = asyncio.get_running_loop()
+        finished = False
+        while not finished:
+            # Tunggu minimal satu request, lalu ambil yang sudah menumpuk
+            batch = []
+            expression = await queue.get()
+            while expression is not None:
+                batch.append(expression)
+                if len(batch) >= self.batch_size or queue.empty():
+                    break
+                expression = queue.get_nowait()
+            if expression is None:
+                finished = True
+            if not batch:
+                continue
+
+            if len(batch) >= self.executor_threshold:
+                # Batch besar: pindahkan ke executor, event loop tetap bebas
+                response = await loop.run_in_executor(self.executor, self.evaluate_batch, batch)
+            else:
+                calc = self.calc
+                response = ''.join([format_response(calc, expression) for expression in batch])
+
+            writer.write(response.encode('utf-8'))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                return False
+        return True
+
+    async def start_tcp(self, host='127.0.0.1', port=8765):
+        """
+        Menjalankan server TCP (tidak blocking).
+
+        Returns:
+            asyncio.Server: Server yang sudah listening
+        """
+        return await asyncio.start_server(self.handle_connection, host, port,
+                                          limit=self.line_limit)
+
+    async def start_unix(self, path):
+        """
+        Menjalankan server Unix socket (tidak blocking).
+
+        Returns:
+            asyncio.Server: Server yang sudah listening
+        """
+        return await asyncio.start_unix_server(self.handle_connection, path,
+                                               limit=self.line_limit)
+
+
+async def _serve_forever(server):
+    async with server:
+        await server.serve_forever()
+
+
+async def self_test(count=5000):
+    """
+    Test server di localhost: kirim banyak request sekaligus (pipelining)
+    lalu cek bahwa semua balasan benar dan urut.
+
+    Returns:
+        bool: True jika semua balasan sesuai
+    """
+    calc_server = CalcServer(executor_threshold=64)
+    server = await calc_server.start_tcp('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    expressions = []
+    expected = []
+    for i in range(count):
+        if i % 100 == 99:
+            expressions.append(f"{i} / 0")
+            expected.append("ERROR ZeroDivisionError")
+        else:
+            expressions.append(f"( {i} + 1 ) * 2")
+            expected.append(str(float((i + 1) * 2)))
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    # Kirim SEMUA request tanpa menunggu balasan (pipelining)
+    writer.write(''.join(e + '\n' for e in expressions).encode('utf-8'))
+    await writer.drain()
+    writer.write_eof()
+
+    responses = []
+    for _ in range(count):
+        responses.append((await reader.readline()).decode('utf-8').strip())
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    calc_server.close()
+
+    return all(response.startswith(want) for response, want in zip(responses, expected))
+
+
+async def self_test_disconnect(count=100000, timeout=10.0):
+    """
+    Test client yang mengirim banyak request tanpa membaca balasan
+    (server tertahan backpressure), lalu memutus koneksi (reset).
+
+    Handler koneksi harus selesai (tidak ada task yang tertinggal) dan
+    tidak ada exception yang tidak tertangani di event loop.
+
+    Returns:
+        bool: True jika server bersih setelah client putus
+    """
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    calc_server = CalcServer(queue_size=64, executor_threshold=64)
+    server = await calc_server.start_tcp('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    baseline = len(asyncio.all_tasks())
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    # Tulis tanpa drain() dan tanpa membaca balasan: server ikut tertahan
+    writer.write(''.join(f"{i} + 1\n" for i in range(count)).encode('utf-8'))
+    await asyncio.sleep(0.5)
+    writer.transport.abort()
+
+    deadline = loop.time() + timeout
+    while len(asyncio.all_tasks()) > baseline and loop.time() < deadline:
+        await asyncio.sleep(0.05)
+    clean = len(asyncio.all_tasks()) <= baseline
+
+    server.close()
+    await server.wait_closed()
+    calc_server.close()
+    loop.set_exception_handler(None)
+    return clean and not errors
+
+
+async def self_test_line_limit(limit=1024):
+    """
+    Test baris yang melebihi line_limit: request sebelumnya tetap dibalas,
+    baris itu dibalas ERROR, lalu koneksi ditutup server.
+
+    Returns:
+        bool: True jika balasan dan penutupan koneksi sesuai
+    """
+    calc_server = CalcServer(line_limit=limit)
+    server = await calc_server.start_tcp('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(("1 + 2\n" + "1 + " * limit + "1\n" + "3 + 4\n").encode('utf-8'))
+    await writer.drain()
+    responses = (await asyncio.wait_for(reader.read(), 10.0)).decode('utf-8').splitlines()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    calc_server.close()
+
+    return responses == ["3.0", f"ERROR ValueError: Error: Baris request melebihi {limit} byte!"]
+
+
+def self_test_close():
+    """
+    Test close(): executor milik server dimatikan, executor dari luar tidak.
+
+    Returns:
+        bool: True jika hanya executor milik server yang dimatikan
+    """
+    owned = CalcServer()
+    owned.close()
+    try:
+        owned.executor.submit(int)
+        return False
+    except RuntimeError:
+        pass  # Executor sudah shutdown
+
+    external = ThreadPoolExecutor(max_workers=1)
+    CalcServer(executor=external).close()
+    alive = external.submit(int, '7').result() == 7
+    external.shutdown()
+    return alive
+
+
+def main(argv=None):
+    """
+    Entry point CLI server.
+
+    Args:
+        argv (list, optional): Argumen command line (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Stack Calculator asyncio server.")
+    parser.add_argument('--host', default='127.0.0.1', help="Host TCP (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="Port TCP (default: 8765)")
+    parser.add_argument('--unix', help="Path Unix socket (menggantikan TCP)")
+    parser.add_argument('--queue-size', type=int, default=4096,
+                        help="Batas request yang menunggu per koneksi")
+    parser.add_argument('--result-cache', type=int, default=0,
+                        help="Jumlah hasil ekspresi konstan yang di-cache (default: 0 = off)")
+    parser.add_argument('--result-ttl', type=float,
+                        help="Umur maksimal hasil di result cache (detik)")
+    parser.add_argument('--metrics-port', type=int,
+                        help="Port endpoint Prometheus /metrics (default: tanpa metrics)")
+    parser.add_argument('--program-cache',
+                        help="File cache program di disk (default: tanpa cache di disk)")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Jalankan test pipelining di localhost lalu keluar")
+    args = parser.parse_args(argv)
+
+    if args.self_test:
+        ok = asyncio.run(self_test())
+        print("✅ PASS - Self test server" if ok else "❌ FAIL - Self test server")
+        clean = asyncio.run(self_test_disconnect())
+        print("✅ PASS - Client putus saat backpressure" if clean else
+              "❌ FAIL - Client putus saat backpressure")
+        limited = asyncio.run(self_test_line_limit())
+        print("✅ PASS - Baris melebihi line_limit dibalas ERROR" if limited else
+              "❌ FAIL - Baris melebihi line_limit dibalas ERROR")
+        closed = self_test_close()
+        print("✅ PASS - close() mematikan executor milik server" if closed else
+              "❌ FAIL - close() mematikan executor milik server")
+        return 0 if ok and clean and limited and closed else 1
+
+    program_cache = None
+    if args.program_cache:
+        from Program_Disk_Cache import ProgramDiskCache
+        program_cache = ProgramDiskCache(args.program_cache)
+    calc = Calculator(result_cache_size=args.result_cache, result_ttl=args.result_ttl,
+                      metrics=args.metrics_port is not None, program_cache=program_cache)
+    calc_server = CalcServer(calc=calc, queue_size=args.queue_size)
+    if args.metrics_port is not None:
+        MetricsServer(calc.metrics, args.host, args.metrics_port).start()
+        print(f"Metrics on http://{args.host}:{args.metrics_port}/metrics", file=sys.stderr)
+
+    async def run():
+        if args.unix:
+            server = await calc_server.start_unix(args.unix)
+            print(f"Listening on unix:{args.unix}", file=sys.stderr)
+        else:
+            server = await calc_server.start_tcp(args.host, args.port)
+            print(f"Listening on {args.host}:{args.port}", file=sys.stderr)
+        await _serve_forever(server)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        calc_server.close()
+        if program_cache is not None:
+            program_cache.close()
+    return 0
+
+
+# ============================================================================
+# MAIN PROGRAM
+# ============================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,20 +11,56 @@ CARA KERJA:
 4. Tampilkan hasil
 
 FITUR:
-- Support operator: +, -, *, /, ^
+- Support operator: +, -, *, /, ^ (dan minus unary: -x, -(a + b))
+- Support fungsi: sqrt, sin, cos, tan, log, exp, abs, min, max
 - Support tanda kurung: ( )
-- Support angka desimal
+- Support angka desimal dan notasi ilmiah (1.5e3)
+- Spasi antar token opsional
 - Error handling yang baik
 - Step-by-step visualization (optional)
+- Backend angka per Calculator: float (default), decimal, fraction
 
 Author: Fadli Ghafatul Hijriah
 Date: Februari 2026
 """
 
-# Import semua module yang ada
-from Stack import Stack
-from Infix_to_Postfix import infix_to_postfix
+# Import module yang dipakai di jalur hitung.
+# Module lain (cache, History, Stage_Stats, Trace_Sink, Numeric_Backend,
+# Optimizer, Codegen, Metrics, Tokenizer/re) baru di-import saat dipakai,
+# supaya mode one-shot (python Calculator.py "3 + 4") tidak membayar
+# import yang tidak perlu.
+# Lihat startup_report() di Benchmark.py untuk budget waktu import.
+import sys
+from time import perf_counter_ns
+
+from Postfix_Program import program_key
+from Infix_to_Postfix import infix_to_program, char_loop_to_program
 from Postfix_Evaluator import evaluate_postfix
+from Postfix_VM import run_program
+
+
+def run_compiled(program, variables=None):
+    """
+    Engine 'codegen' yang memuat Codegen.py saat pertama dipakai.
+
+    Setelah import, ENGINES['codegen'] langsung menunjuk ke
+    Codegen.run_compiled (panggilan berikutnya tanpa lapisan ini).
+    """
+    from Codegen import run_compiled as compiled_engine
+    ENGINES['codegen'] = compiled_engine
+    return compiled_engine(program, variables=variables)
+
+
+# Engine evaluasi yang bisa dipilih per Calculator
+# - 'stack': evaluate_postfix (berbasis class Stack, mendukung step-by-step)
+# - 'vm'   : run_program (stack machine + dispatch table, tanpa I/O)
+# - 'codegen': run_compiled (program di-compile menjadi fungsi Python sekali,
+#              lalu di-cache; paling cepat untuk rumus yang sering dipakai)
+ENGINES = {
+    'stack': evaluate_postfix,
+    'vm': run_program,
+    'codegen': run_compiled,
+}
 
 
 class Calculator:
@@ -32,31 +68,320 @@ class Calculator:
     Kelas Calculator yang mengintegrasikan semua komponen.
     
     Attributes:
-        history (list): Menyimpan riwayat perhitungan
+        history (CalculationHistory): Riwayat perhitungan (ring buffer di RAM,
+                                      opsional log di disk)
         show_steps (bool): Flag untuk menampilkan langkah-langkah detail
+        trace_sink (TraceSink): Sink opsional untuk structured step events
+        cache (ExpressionCache): Cache PostfixProgram per ekspresi infix
+        engine (str): Nama engine evaluasi ('vm', 'stack' atau 'codegen')
+        optimize (bool): Jalankan optimizer (constant folding + CSE) saat compile
+        last_optimization (list): Laporan optimizer dari konversi terakhir
+        backend (NumericBackend): Backend angka (lihat Numeric_Backend.py)
+        result_cache (ResultCache): Cache hasil ekspresi tanpa variabel
+                                    (None = tidak aktif)
+        output (file-like): Tujuan tampilan perhitungan (None = sys.stdout
+                            saat dipanggil)
+        stage_stats (StageStats): Timer per tahap calculate() (lihat
+                                  Stage_Stats.py); .enabled boleh diubah
+                                  kapan saja
+        metrics (MetricsRegistry): Metrics format Prometheus untuk
+                                   evaluate()/calculate() (None = tidak aktif)
+        program_cache (ProgramDiskCache): Cache program di disk, dibagi
+                                   antar proses (None = tidak aktif)
     """
     
-    def __init__(self, show_steps=False):
+    def __init__(self, show_steps=False, trace_sink=None, cache_size=1024, cache_bytes=None,
+                 engine='vm', optimize=False, backend='float', history_size=1000,
+                 history_log=None, result_cache_size=0, result_ttl=None,
+                 result_cache_bytes=None, output=None, stats=False, metrics=False,
+                 program_cache=None):
         """
         Initialize calculator.
         
         Args:
             show_steps (bool): Jika True, tampilkan step-by-step process
+            trace_sink (TraceSink, optional): Sink khusus untuk step events
+                                  (misal JsonLinesSink atau CollectSink).
+                                  Jika diisi, dipakai walaupun show_steps=False.
+            cache_size (int): Jumlah ekspresi maksimal di cache (0 = tanpa cache)
+            cache_bytes (int, optional): Batas estimasi memory cache dalam bytes
+            engine (str): Engine evaluasi, 'vm' (cepat), 'codegen' (compile
+                          ke fungsi Python, lihat Codegen.py) atau 'stack'.
+                          Saat step-by-step aktif, engine 'stack' selalu
+                          dipakai karena hanya engine itu yang mengirim events.
+            optimize (bool): Jika True, program di-optimasi (lihat Optimizer.py
+                             dan Expression_Tree.py) sebelum disimpan di cache
+            backend (str atau NumericBackend): 'float' (default, engine di atas),
+                          'decimal', 'fraction', atau instance misal
+                          DecimalBackend(precision=50). Backend selain float
+                          selalu memakai loop evaluasinya sendiri (engine dan
+                          step-by-step evaluasi tidak dipakai).
+            history_size (int): Jumlah entry history maksimal di RAM
+            history_log (str, optional): File log append-only untuk history
+                          lengkap (lihat History.py)
+            result_cache_size (int): Jumlah hasil ekspresi konstan yang
+                          di-cache (0 = tanpa result cache, lihat Result_Cache.py)
+            result_ttl (float, optional): Umur maksimal hasil di cache (detik)
+            result_cache_bytes (int, optional): Batas estimasi memory result cache
+            output (file-like, optional): Stream untuk tampilan perhitungan,
+                          history dan step-by-step (misal io.StringIO atau
+                          file). sys.stdout tidak pernah diganti: untuk
+                          membungkam output, beri stream sendiri.
+            stats (bool): Aktifkan timer per tahap calculate() dari awal
+                          (bisa dinyalakan nanti: calc.stage_stats.enabled)
+            metrics (bool): Catat throughput, error per jenis, histogram
+                          latency dan ukuran history/cache (lihat Metrics.py)
+            program_cache (ProgramDiskCache, optional): Cache hasil konversi
+                          di disk (lihat Program_Disk_Cache.py), dicek
+                          setelah cache di RAM. Program baru disimpan saat
+                          program_cache.flush()/close() dipanggil.
+        
+        Raises:
+            ValueError: Jika nama engine atau backend tidak dikenal
         """
-        # List untuk menyimpan history perhitungan
-        self.history = []
+        if engine not in ENGINES:
+            raise ValueError(f"Error: Engine '{engine}' tidak dikenal! Pilih: {', '.join(ENGINES)}")
+
+        from Expression_Cache import ExpressionCache
+        from Result_Cache import ResultCache
+        from Stage_Stats import StageStats
+        from History import CalculationHistory
+        from Numeric_Backend import get_backend
+        
+        # History perhitungan: dibatasi di RAM, lengkap di log (jika ada)
+        self.history = CalculationHistory(max_entries=history_size, log_path=history_log)
         
         # Flag untuk show/hide detailed steps
         self.show_steps = show_steps
+        
+        # Sink untuk structured step events (lihat Trace_Sink.py)
+        self.trace_sink = trace_sink
+        
+        # Cache hasil konversi infix → postfix (lihat Expression_Cache.py)
+        self.cache = ExpressionCache(max_entries=cache_size, max_bytes=cache_bytes)
+        
+        # Engine evaluasi default
+        self.engine = engine
+        
+        # Optimizer: program yang disimpan di cache sudah di-fold
+        self.optimize = optimize
+        self.last_optimization = []
+        
+        # Backend angka. Untuk float, evaluasi tetap lewat ENGINES (jalur cepat)
+        self.backend = get_backend(backend)
+        
+        # Cache hasil ekspresi murni (tanpa variabel), aman dipakai antar thread
+        self.result_cache = None
+        if result_cache_size:
+            self.result_cache = ResultCache(max_entries=result_cache_size, ttl=result_ttl,
+                                            max_bytes=result_cache_bytes)
+        
+        # Stream tampilan per instance (tidak mengubah state global)
+        self.output = output
+        
+        # Timer per tahap calculate(); saat mati tidak ada pemanggilan jam
+        self.stage_stats = StageStats(enabled=stats)
+        
+        # Cache program di disk: proses baru langsung memakai hasil konversi
+        # dari proses sebelumnya
+        self.program_cache = program_cache
+        
+        # Metrics service: hanya counter di jalur hitung, format saat scrape
+        self.metrics = None
+        if metrics:
+            from Metrics import MetricsRegistry, register_calculator
+            self.metrics = MetricsRegistry()
+            register_calculator(self.metrics, self)
+    
+    
+    def _write(self, lines):
+        """
+        Menulis beberapa baris ke stream output dalam SATU write().
+        
+        Satu blok = satu write, jadi blok dari thread lain yang memakai
+        stream yang sama tidak bisa menyisip di tengah blok.
+        
+        Args:
+            lines (list): Baris-baris teks (tanpa newline)
+        """
+        if lines:
+            stream = self.output if self.output is not None else sys.stdout
+            stream.write("\n".join(lines) + "\n")
     
     
-    def calculate(self, infix_expression):
+    def _get_tracer(self):
+        """
+        Menentukan sink yang dipakai untuk perhitungan saat ini.
+        
+        Returns:
+            TraceSink atau None: None berarti tidak ada step event sama sekali
+        """
+        if self.trace_sink is not None:
+            return self.trace_sink
+        if self.show_steps:
+            from Trace_Sink import TextSink
+            return TextSink(stream=self.output)
+        return None
+    
+    
+    def compile(self, infix_expression, tracer=None):
+        """
+        Mengkonversi infix → PostfixProgram, memakai cache jika bisa.
+        
+        Jika ada tracer (mode step-by-step), konversi tetap dijalankan
+        supaya langkah-langkahnya bisa ditampilkan, lalu hasilnya disimpan.
+        Cache di disk (program_cache) dicek setelah cache di RAM dan
+        menyimpan program SEBELUM optimasi. Jika optimize aktif, program
+        di-optimasi sekali sebelum masuk cache di RAM.
+        
+        Args:
+            infix_expression (str): Ekspresi infix
+            tracer (TraceSink, optional): Sink untuk step events
+        
+        Returns:
+            PostfixProgram: Program postfix (opcodes + konstanta)
+        """
+        if tracer is None:
+            program = self.cache.get(infix_expression)
+            if program is not None:
+                return program
+        
+        program = None
+        disk = self.program_cache
+        if tracer is None and disk is not None:
+            program = disk.get(infix_expression)
+        if program is None:
+            program = infix_to_program(infix_expression, tracer)
+            if disk is not None:
+                disk.put(infix_expression, program)
+        
+        if self.optimize:
+            from Optimizer import optimize as optimize_program
+            from Expression_Tree import eliminate_common_subexpressions
+            # Constant folding menghitung dengan float, jadi hanya untuk
+            # backend float (CSE tidak menghitung apa-apa, aman untuk semua)
+            folded = []
+            if self.backend.name == 'float':
+                program, folded = optimize_program(program)
+            program, shared = eliminate_common_subexpressions(program)
+            self.last_optimization = folded + shared
+        self.cache.put(infix_expression, program)
+        return program
+    
+    
+    def _result_key(self, program):
+        """
+        Key result cache untuk program tanpa variabel.
+
+        Backend Decimal/Fraction memakai teks literal juga: "3" dan "3.0"
+        (atau dua bilangan bulat panjang yang float-nya sama) memberi hasil
+        berbeda walaupun konstanta float-nya sama.
+        """
+        return program_key(program, literals=self.backend.name != 'float')
+    
+    
+    def evaluate(self, infix_expression, variables=None):
+        """
+        Menghitung hasil ekspresi TANPA output dan tanpa menyimpan history.
+        
+        Dipakai oleh mode batch/server yang hanya butuh hasilnya saja.
+        
+        Args:
+            infix_expression (str): Ekspresi infix
+            variables (dict, optional): Nilai variabel di ekspresi
+        
+        Returns:
+            float: Hasil perhitungan (Decimal/Fraction untuk backend lain)
+        
+        Raises:
+            ValueError: Jika expression invalid
+            ZeroDivisionError: Jika pembagian dengan nol
+        """
+        # Tanpa metrics: hanya satu cek None (lihat Metrics.py)
+        metrics = self.metrics
+        if metrics is not None:
+            started = perf_counter_ns()
+        
+        try:
+            if not infix_expression or infix_expression.strip() == "":
+                raise ValueError("Error: Expression kosong!")
+            
+            program = self.compile(infix_expression)
+            # Ekspresi tanpa variabel: hasil (atau error-nya) boleh dari cache
+            if self.result_cache is not None and not program.names:
+                result = self.result_cache.get_or_compute(self._result_key(program), self._run,
+                                                          program, None)
+            # Jalur float langsung ke engine (tanpa lapisan backend)
+            elif self.backend.name == 'float':
+                result = ENGINES[self.engine](program, variables=variables)
+            else:
+                result = self.backend.run(program, variables)
+        except Exception as error:
+            if metrics is not None:
+                metrics.observe(perf_counter_ns() - started, error)
+            raise
+        
+        if metrics is not None:
+            metrics.observe(perf_counter_ns() - started)
+        return result
+    
+    
+    def _run(self, program, variables, tracer=None):
+        """
+        Mengevaluasi program dengan engine/backend Calculator ini.
+        
+        Args:
+            program (PostfixProgram): Program hasil compile()
+            variables (dict): Nilai variabel (boleh None)
+            tracer (TraceSink, optional): Sink untuk step events (backend float)
+        
+        Returns:
+            Hasil evaluasi
+        """
+        if self.backend.name != 'float':
+            return self.backend.run(program, variables)
+        # Step-by-step butuh engine 'stack'; selain itu pakai engine pilihan
+        if tracer is not None:
+            return evaluate_postfix(program, tracer, variables)
+        return ENGINES[self.engine](program, variables=variables)
+    
+    
+    def calculate_many(self, expressions, workers=None, chunk_size=1000):
+        """
+        Menghitung banyak ekspresi secara paralel (process pool).
+        
+        Error per ekspresi (ZeroDivisionError, ValueError, dll) tidak
+        menghentikan batch, tapi dicatat di result record.
+        History tidak diisi (bisa berisi jutaan ekspresi).
+        
+        Args:
+            expressions (iterable): Ekspresi infix
+            workers (int, optional): Jumlah worker process (default: jumlah CPU)
+            chunk_size (int): Jumlah ekspresi per chunk
+        
+        Returns:
+            iterator: Result record (dict) per ekspresi, urut sesuai input.
+                      Keys: index, expression, result, error, error_type
+        
+        Example:
+            calc = Calculator()
+            results = list(calc.calculate_many(["3 + 4", "1 / 0"], workers=4))
+            results[0]['result']       # 7.0
+            results[1]['error_type']   # 'ZeroDivisionError'
+        """
+        from Parallel_Evaluator import evaluate_many
+        return evaluate_many(expressions, workers=workers, chunk_size=chunk_size,
+                             engine=self.engine, cache_size=self.cache.max_entries,
+                             backend=self.backend)
+    
+    
+    def calculate(self, infix_expression, variables=None):
         """
         Menghitung hasil dari ekspresi matematika.
         
         WORKFLOW:
         1. Validate input
-        2. Convert infix → postfix
+        2. Convert infix → postfix (atau ambil dari cache)
         3. Evaluate postfix → result
         4. Save to history
         5. Return result
@@ -64,6 +389,8 @@ class Calculator:
         Args:
             infix_expression (str): Ekspresi matematika dalam notasi infix
                                    Contoh: "3 + 4 * 2"
+            variables (dict, optional): Nilai variabel di ekspresi
+                                   Contoh: {"x": 2} untuk "x * 3"
         
         Returns:
             float: Hasil perhitungan
@@ -76,94 +403,159 @@ class Calculator:
             calc = Calculator()
             result = calc.calculate("3 + 4")      # Returns 7.0
             result = calc.calculate("(5+6) * 2")  # Returns 22.0
-        """
-        
-        print("\n" + "="*70)
-        print("STACK CALCULATOR - COMPUTATION")
-        print("="*70)
+            result = calc.calculate("x * 2", {"x": 4})  # Returns 8.0
         
-        # Step 1: Validate input
-        if not infix_expression or infix_expression.strip() == "":
-            raise ValueError("Error: Expression kosong!")
+        Thread safety:
+            Tidak ada state global yang diubah: tampilan ditulis ke
+            self.output per blok (satu write), tanpa step-by-step seluruh
+            tampilan satu perhitungan adalah SATU blok.
+        """
         
-        print(f"Input (Infix):  {infix_expression}")
+        # Timer per tahap hanya jika diaktifkan (lihat Stage_Stats.py)
+        # marks: jam saat setiap tahap dimulai (posisi = Stage_Stats.MARK_STAGES),
+        # hanya angka, tanpa pemanggilan method per tahap
+        stats = self.stage_stats
+        marks = [perf_counter_ns(), 0, 0, 0, 0, 0] if stats.enabled else None
+        tokens = 0
+        metrics = self.metrics
+        if metrics is not None:
+            started = perf_counter_ns()
         
-        # Step 2: Convert infix to postfix
-        # Jika show_steps=False, suppress output dari infix_to_postfix
-        if not self.show_steps:
-            # Temporary disable printing
-            import sys
-            from io import StringIO
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        # Baris tampilan dikumpulkan dulu, ditulis sekaligus (lihat _write)
+        lines = ["\n" + "="*70, "STACK CALCULATOR - COMPUTATION", "="*70]
         
         try:
-            postfix_expression = infix_to_postfix(infix_expression)
+            try:
+                # Step 1: Validate input
+                if not infix_expression or infix_expression.strip() == "":
+                    raise ValueError("Error: Expression kosong!")
+                
+                lines.append(f"Input (Infix):  {infix_expression}")
+                
+                # Step 2: Convert infix to postfix
+                # Step-by-step hanya dikirim ke sink jika ada (tanpa sink = tanpa biaya)
+                # Ekspresi yang sama tidak dikonversi ulang (diambil dari cache)
+                if marks is not None:
+                    marks[1] = perf_counter_ns()
+                tracer = self._get_tracer()
+                if tracer is not None:
+                    # Step events harus tampil SETELAH baris input
+                    self._write(lines)
+                    lines = []
+                program = self.compile(infix_expression, tracer)
+                
+                # Bentuk string postfix hanya untuk ditampilkan
+                postfix_expression = str(program)
+                lines.append(f"Postfix:        {postfix_expression}")
+                if tracer is not None:
+                    self._write(lines)
+                    lines = []
+                
+                # Step 3: Evaluate postfix program (angka sudah di-parse)
+                # Result cache hanya tanpa tracer (step-by-step harus tetap tampil)
+                if marks is not None:
+                    tokens = len(program)
+                    marks[2] = perf_counter_ns()
+                if tracer is None and self.result_cache is not None and not program.names:
+                    result = self.result_cache.get_or_compute(self._result_key(program), self._run,
+                                                              program, None)
+                else:
+                    result = self._run(program, variables, tracer)
+                
+                lines.append(f"Result:         {result}")
+                lines.append("="*70)
+            finally:
+                # Juga saat error: baris yang sudah ada tetap ditampilkan
+                if marks is not None:
+                    marks[3] = perf_counter_ns()
+                self._write(lines)
+            
+            # Step 4: Save to history
+            if marks is not None:
+                marks[4] = perf_counter_ns()
+            self.history.append(infix_expression, postfix_expression, result)
+        except Exception as error:
+            if metrics is not None:
+                metrics.observe(perf_counter_ns() - started, error)
+            raise
         finally:
-            if not self.show_steps:
-                # Restore stdout
-                sys.stdout = old_stdout
-        
-        print(f"Postfix:        {postfix_expression}")
+            # Perhitungan yang error juga direkam (sampai tahap yang gagal)
+            if marks is not None:
+                marks[5] = perf_counter_ns()
+                stats.record(marks, tokens)
         
-        # Step 3: Evaluate postfix expression
-        if not self.show_steps:
-            # Temporary disable printing
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
+        if metrics is not None:
+            metrics.observe(perf_counter_ns() - started)
         
-        try:
-            result = evaluate_postfix(postfix_expression)
-        finally:
-            if not self.show_steps:
-                # Restore stdout
-                sys.stdout = old_stdout
+        # Step 5: Return result
+        return result
+    
+    
+    def stats(self, reset=False):
+        """
+        Snapshot timer per tahap calculate() (lihat Stage_Stats.py).
         
-        print(f"Result:         {result}")
-        print("="*70)
+        Args:
+            reset (bool): Jika True, counter di-reset setelah snapshot
         
-        # Step 4: Save to history
-        self.history.append({
-            'infix': infix_expression,
-            'postfix': postfix_expression,
-            'result': result
-        })
+        Returns:
+            dict: {'enabled', 'calls', 'tokens', 'stages': {stage: {'count',
+                  'total_ms', 'mean_us', 'p50_us', 'p99_us'}}}
         
-        # Step 5: Return result
-        return result
+        Example:
+            calc = Calculator(stats=True)
+            calc.calculate("3 + 4")
+            calc.stats()['stages']['convert']['p99_us']
+        """
+        return self.stage_stats.snapshot(reset)
     
     
-    def show_history(self):
+    def show_history(self, page_size=None, prompt=input):
         """
         Menampilkan riwayat perhitungan.
         
+        Entry dibaca satu per satu (dari log di disk jika ada), jadi
+        history yang sangat panjang tidak pernah dimuat sekaligus ke RAM.
+        
+        Args:
+            page_size (int, optional): Jumlah entry per halaman. Setelah
+                                       setiap halaman, prompt() dipanggil;
+                                       jawaban 'q' menghentikan tampilan.
+                                       None = tampilkan semua.
+            prompt (callable): Fungsi untuk bertanya ke user (default: input)
+        
         Example:
             calc = Calculator()
             calc.calculate("3 + 4")
             calc.calculate("5 * 6")
-            calc.show_history()
+            calc.show_history(page_size=20)
         """
-        print("\n" + "="*70)
-        print("CALCULATION HISTORY")
-        print("="*70)
+        self._write(["\n" + "="*70, "CALCULATION HISTORY", "="*70])
         
-        if not self.history:
-            print("No history yet. Start calculating!")
-        else:
-            for i, entry in enumerate(self.history, 1):
-                print(f"\n{i}. Expression: {entry['infix']}")
-                print(f"   Postfix:    {entry['postfix']}")
-                print(f"   Result:     {entry['result']}")
+        # Setiap entry membawa nomor urutnya sendiri, jadi nomor tetap
+        # benar walaupun entry lama sudah terbuang dari ring buffer
+        shown = 0
+        for entry in self.history.entries():
+            if page_size and shown and shown % page_size == 0:
+                if prompt("\n-- Enter untuk lanjut, 'q' untuk berhenti -- ").strip().lower() == 'q':
+                    break
+            self._write([f"\n{entry.number}. Expression: {entry.infix}",
+                         f"   Postfix:    {entry.postfix}",
+                         f"   Result:     {entry.result}"])
+            shown += 1
         
-        print("\n" + "="*70)
+        if not shown:
+            self._write(["No history yet. Start calculating!"])
+        
+        self._write(["\n" + "="*70])
     
     
     def clear_history(self):
         """
         Menghapus semua riwayat perhitungan.
         """
-        self.history = []
-        print("History cleared!")
+        self.history.clear()
+        self._write(["History cleared!"])
 
 
 def print_banner():
@@ -177,11 +569,12 @@ def print_banner():
     print("\nFeatures:")
     print("  ✓ Support operators: +, -, *, /, ^")
     print("  ✓ Support parentheses: ( )")
+    print("  ✓ Support functions: sqrt, sin, cos, tan, log, exp, abs, min, max")
     print("  ✓ Support decimal numbers")
     print("  ✓ Step-by-step visualization")
     print("  ✓ Calculation history")
-    print("\nNote: Pisahkan angka dan operator dengan SPASI")
-    print("      Contoh: '3 + 4 * 2' atau '( 5 + 6 ) * 2'")
+    print("\nNote: Spasi antara angka dan operator opsional")
+    print("      Contoh: '3 + 4 * 2', '(5+6)*2' atau '1.5e3 / 2'")
     print("="*70 + "\n")
 
 
@@ -216,9 +609,11 @@ def interactive_mode():
         # Menu 1: Calculate
         if choice == '1':
             print("\nMasukkan ekspresi matematika:")
-            print("(Gunakan SPASI antara angka dan operator)")
+            print("(Spasi opsional)")
             print("Contoh: 3 + 4 * 2")
+            print("Contoh: 3+4*2")
             print("Contoh: ( 5 + 6 ) * ( 7 - 2 )")
+            print("Contoh: -sqrt(16) + max(1, 2, 3)")
             
             expression = input("\nExpression: ").strip()
             
@@ -237,7 +632,7 @@ def interactive_mode():
         
         # Menu 2: Show history
         elif choice == '2':
-            calc.show_history()
+            calc.show_history(page_size=20)
         
         # Menu 3: Clear history
         elif choice == '3':
@@ -279,7 +674,8 @@ def quick_test():
         "( 3 + 4 ) * 2",
         "10 / 5 + 3",
         "( 5 + 6 ) * ( 7 - 2 )",
-        "2 ^ 3 + 1"
+        "2 ^ 3 + 1",
+        "-2 ^ 2 + sqrt(16)"
     ]
     
     print("Testing the following expressions:\n")
@@ -299,6 +695,38 @@ def quick_test():
     calc.show_history()
 
 
+def one_shot(args):
+    """
+    Mode one-shot: hitung SATU ekspresi dari argv, cetak hasilnya saja.
+    
+    Untuk script yang memanggil kalkulator sekali per hasil. Tanpa banner,
+    menu, history, cache maupun tracing: ekspresi langsung dikonversi oleh
+    char_loop_to_program() (tanpa modul re) lalu dievaluasi oleh VM.
+    
+    Args:
+        args (list): Argumen command line, digabung dengan spasi
+                     (jadi tanda kutip opsional: 3 + 4 sama dengan "3 + 4")
+    
+    Returns:
+        int: Exit code (0 = berhasil, 1 = error, pesan error ke stderr)
+    
+    Example:
+        $ python calc.py "3 + 4 * 2"        # launcher, lihat calc.py
+        11.0
+        $ python Calculator.py "1 / 0"      # stderr: Error: ..., exit code 1
+    """
+    expression = " ".join(args)
+    try:
+        if expression.strip() == "":
+            raise ValueError("Error: Expression kosong!")
+        result = run_program(char_loop_to_program(expression))
+    except Exception as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    sys.stdout.write(f"{result}\n")
+    return 0
+
+
 # ============================================================================
 # MAIN PROGRAM
 # ============================================================================
@@ -307,10 +735,15 @@ if __name__ == "__main__":
     """
     Entry point program.
     
-    User bisa pilih:
+    Dengan argumen: mode one-shot, hanya hasilnya yang dicetak
+        python Calculator.py "3 + 4 * 2"
+    
+    Tanpa argumen, user bisa pilih:
     1. Interactive mode - input expression berulang kali
     2. Quick test mode - test beberapa expression otomatis
     """
+    if len(sys.argv) > 1:
+        sys.exit(one_shot(sys.argv[1:]))
     
     print("\n" + "="*70)
     print("STACK CALCULATOR - MODE SELECTION")
@@ -0,0 +1,420 @@
+"""
+Codegen - Compile PostfixProgram menjadi Fungsi Python
+=======================================================
+
+File ini berisi compiler yang mengubah program postfix menjadi SOURCE
+Python, lalu di-compile() sekali menjadi fungsi biasa.
+
+KENAPA PERLU CODEGEN?
+run_program() (Postfix_VM.py) sudah cepat, tapi tetap INTERPRETER: setiap
+token membayar loop, perbandingan opcode dan akses stack list. Untuk
+rumus "panas" yang dievaluasi jutaan kali, semua itu bisa dibayar SEKALI:
+
+    "( 3 + 4 ) * x"   →   postfix "3 4 + x *"
+
+    def compiled(variables=None):
+        try:
+            v0 = _lookup(variables, 'x')   # = lookup_variable
+        except (ValueError, TypeError):
+            return _run_program(_program, variables)
+        return ((3.0 + 4.0) * v0)
+
+Evaluasi berikutnya hanya satu pemanggilan fungsi; bytecode CPython yang
+mengerjakan aritmatika langsung.
+
+CARA KERJA (stack simbolik):
+- Stack berisi SOURCE (string), bukan angka: push "3.0", push "v0",
+  operator biner menggabungkan dua source menjadi "(a + b)"
+- +, -, * dan minus unary ditulis inline; /, ^ dan fungsi memanggil
+  fungsi yang SAMA dengan VM (DISPATCH di Postfix_VM.py), jadi pesan
+  error identik (misal ZeroDivisionError untuk pembagian nol)
+- Variabel di-resolve sekali di awal fungsi. Jika ada yang tidak
+  didefinisikan, program dijalankan oleh VM, jadi error-nya muncul di
+  urutan yang sama dengan evaluate_postfix (misal "1/0 + y" →
+  ZeroDivisionError)
+- Temp slot (=>$0 / $0) menjadi variabel lokal
+- Ekspresi yang terlalu dalam (lebih dari MAX_NESTING) di-"spill" ke
+  variabel lokal, karena parser Python membatasi kedalaman kurung.
+  Saat spill, semua entry di stack ditulis berurutan dari bawah, jadi
+  urutan evaluasi (dan error pertama yang muncul) tetap sama dengan VM.
+
+CACHE:
+compile() mahal (puluhan mikrodetik), jadi fungsi hasil codegen di-cache:
+- per object program (dict identity, jalur cepat untuk program dari
+  ExpressionCache Calculator)
+- per key ter-normalisasi (opcodes + konstanta + nama variabel), jadi
+  "3+4" dan "3 + 4" memakai fungsi yang sama
+
+Program yang invalid (operand kurang/berlebih) tidak di-codegen; fungsi
+hasilnya memanggil run_program(), jadi error-nya persis sama.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import math
+
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OP_ADD, OP_SUB,
+                             OP_MUL, OP_STORE, OP_FETCH, OP_NEG,
+                             OPCODE_ARITY, OPCODE_SYMBOLS, program_key)
+from Postfix_Evaluator import lookup_variable
+from Postfix_VM import DISPATCH, run_program
+from Expression_Cache import ExpressionCache
+
+
+# Kedalaman nesting maksimal satu ekspresi sebelum di-spill ke variabel lokal
+# (parser CPython menolak lebih dari 200 kurung bersarang)
+MAX_NESTING = 50
+
+# Operator yang ditulis inline di source (hasilnya identik dengan VM)
+INLINE_OPERATORS = {OP_ADD: '+', OP_SUB: '-', OP_MUL: '*'}
+
+# Nama fungsi di namespace kode hasil generate: opcode → nama
+HELPER_NAMES = {opcode: '_' + ('div' if symbol == '/' else 'pow' if symbol == '^' else symbol)
+                for opcode, symbol in OPCODE_SYMBOLS.items()
+                if opcode not in INLINE_OPERATORS and opcode != OP_NEG}
+
+# Namespace global untuk semua fungsi hasil codegen
+NAMESPACE = {name: DISPATCH[opcode] for opcode, name in HELPER_NAMES.items()}
+NAMESPACE['_lookup'] = lookup_variable
+NAMESPACE['_run_program'] = run_program
+
+
+def generate_source(program, name='compiled'):
+    """
+    Menghasilkan source Python untuk program postfix yang VALID.
+
+    Args:
+        program (PostfixProgram): Program tanpa error dengan depth akhir 1
+        name (str): Nama fungsi di source
+
+    Returns:
+        tuple: (source, constants) - constants adalah dict nama → nilai
+               untuk konstanta yang tidak punya literal (inf, nan)
+
+    Example:
+        generate_source(infix_to_program("( 3 + 4 ) * x"))[0]
+        # def compiled(variables=None):
+        #     try:
+        #         v0 = _lookup(variables, 'x')
+        #     except (ValueError, TypeError):
+        #         return _run_program(_program, variables)
+        #     return ((3.0 + 4.0) * v0)
+    """
+    lines = [f"def {name}(variables=None):"]
+    if program.names:
+        # Variabel yang tidak ada: VM yang melaporkan error di posisi
+        # OP_LOAD-nya (urutan error sama dengan evaluate_postfix)
+        lines.append("    try:")
+        for slot, variable in enumerate(program.names):
+            lines.append(f"        v{slot} = _lookup(variables, {variable!r})")
+        lines.append("    except (ValueError, TypeError):")
+        lines.append("        return _run_program(_program, variables)")
+
+    constants = {}
+    temps = {}
+    # Stack simbolik: [source, nesting]; nesting 0 = atom (literal/nama lokal)
+    stack = []
+    registers = 0
+
+    def assign(source):
+        # Variabel lokal baru (tidak pernah ditimpa, jadi referensi lama tetap benar)
+        nonlocal registers
+        local = f"r{registers}"
+        registers += 1
+        lines.append(f"    {local} = {source}")
+        return local
+
+    def spill():
+        # Tulis semua entry non-atom ke variabel lokal, dari bawah ke atas
+        for entry in stack:
+            if entry[1]:
+                entry[0], entry[1] = assign(entry[0]), 0
+
+    for index, (opcode, constant) in enumerate(zip(program.opcodes, program.constants)):
+        if opcode == OP_PUSH:
+            if not math.isfinite(constant):
+                source = f"_k{index}"
+                constants[source] = constant
+            elif constant < 0 or (constant == 0 and math.copysign(1, constant) < 0):
+                source = f"({constant!r})"
+            else:
+                source = repr(constant)
+            stack.append([source, 0])
+        elif opcode == OP_LOAD:
+            stack.append([f"v{int(constant)}", 0])
+        elif opcode == OP_STORE:
+            spill()
+            temps[int(constant)] = stack[-1][0]
+        elif opcode == OP_FETCH:
+            stack.append([temps[int(constant)], 0])
+        else:
+            arity = OPCODE_ARITY[opcode]
+            if max(entry[1] for entry in stack[-arity:]) >= MAX_NESTING:
+                spill()
+            operands = stack[-arity:]
+            del stack[-arity:]
+            nesting = max(entry[1] for entry in operands) + 1
+            sources = [entry[0] for entry in operands]
+
+            if opcode in INLINE_OPERATORS:
+                source = f"({sources[0]} {INLINE_OPERATORS[opcode]} {sources[1]})"
+            elif opcode == OP_NEG:
+                source = f"(-{sources[0]})"
+            else:
+                source = f"{HELPER_NAMES[opcode]}({', '.join(sources)})"
+            stack.append([source, nesting])
+
+    lines.append(f"    return {stack[-1][0]}")
+    return "\n".join(lines) + "\n", constants
+
+
+def compile_program(program):
+    """
+    Compile program menjadi fungsi Python (tanpa cache).
+
+    Args:
+        program (PostfixProgram atau str): Program, atau string postfix
+                                           hasil infix_to_postfix()
+
+    Returns:
+        callable: fungsi(variables=None) → float
+
+    Raises:
+        ValueError: Jika string postfix berisi token yang tidak dikenal
+
+    Example:
+        function = compile_program(infix_to_program("x * 2 + 1"))
+        function({"x": 3})    # 7.0
+    """
+    if isinstance(program, str):
+        program = PostfixProgram.from_tokens(program.split())
+
+    # Program invalid: serahkan ke VM supaya error-nya persis sama
+    if program.error is not None or program.depth != 1:
+        def compiled(variables=None):
+            return run_program(program, variables)
+        return compiled
+
+    source, constants = generate_source(program)
+    namespace = dict(NAMESPACE, _program=program, **constants)
+    exec(compile(source, "<codegen>", 'exec'), namespace)
+    function = namespace['compiled']
+    function.source = source
+    return function
+
+
+class CompiledCache:
+    """
+    Cache fungsi hasil codegen (per object program + per key ter-normalisasi).
+
+    Attributes:
+        max_entries (int): Jumlah fungsi maksimal per level cache
+        compiled (int): Berapa kali compile_program() benar-benar dijalankan
+
+    Example:
+        cache = CompiledCache()
+        cache.get(program)({"x": 2})    # compile sekali
+        cache.get(program)({"x": 3})    # langsung dari cache
+    """
+
+    def __init__(self, max_entries=4096):
+        """
+        Args:
+            max_entries (int): Jumlah fungsi maksimal yang disimpan
+        """
+        self.max_entries = max_entries
+        self.compiled = 0
+        # Object program → fungsi. Dict biasa: get/set atomic antar thread
+        self._by_program = {}
+        # Key ter-normalisasi → fungsi (LRU, thread-safe)
+        self._by_key = ExpressionCache(max_entries=max_entries)
+
+    def get(self, program):
+        """
+        Mengambil fungsi untuk program (compile jika belum ada).
+
+        Args:
+            program (PostfixProgram): Program hasil compile
+
+        Returns:
+            callable: fungsi(variables=None) → float
+        """
+        function = self._by_program.get(program)
+        if function is not None:
+            return function
+
+        key = (program_key(program), tuple(program.names))
+        function = self._by_key.get(key)
+        if function is None:
+            function = compile_program(program)
+            self.compiled += 1
+            self._by_key.put(key, function)
+
+        if len(self._by_program) >= self.max_entries:
+            # Program baru terus-menerus (tanpa ExpressionCache): mulai dari awal
+            self._by_program.clear()
+        self._by_program[program] = function
+        return function
+
+    def clear(self):
+        """
+        Mengosongkan cache.
+        """
+        self._by_program.clear()
+        self._by_key.clear()
+
+    def __len__(self):
+        return len(self._by_key)
+
+
+# Cache global yang dipakai engine 'codegen' di Calculator
+COMPILED_CACHE = CompiledCache()
+
+
+def run_compiled(program, variables=None):
+    """
+    Mengevaluasi program lewat fungsi hasil codegen (compile sekali, di-cache).
+
+    Signature sama dengan run_program(), jadi bisa dipakai sebagai engine.
+
+    Args:
+        program (PostfixProgram): Program hasil infix_to_program()
+        variables (dict, optional): Nilai variabel
+
+    Returns:
+        float: Hasil evaluasi
+
+    Raises:
+        ValueError: Jika program invalid atau variabel tidak didefinisikan
+        ZeroDivisionError: Jika terjadi pembagian dengan nol
+
+    Example:
+        run_compiled(infix_to_program("3 + 4 * 2"))   # Returns 11.0
+    """
+    return COMPILED_CACHE.get(program)(variables)
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing codegen: hasil dan error harus identik dengan evaluate_postfix().
+    """
+    import random
+    import timeit
+
+    from Infix_to_Postfix import infix_to_postfix, infix_to_program
+    from Postfix_Evaluator import evaluate_postfix
+    from Expression_Tree import eliminate_common_subexpressions
+
+    print("\n" + "="*60)
+    print("TESTING CODEGEN")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    def outcome(engine, program, variables):
+        # Bandingkan hasil ATAU jenis + pesan error
+        try:
+            return ('ok', engine(program, variables=variables))
+        except (ValueError, ZeroDivisionError, OverflowError) as e:
+            return (type(e).__name__, str(e))
+
+    def compiled_engine(program, variables=None):
+        return compile_program(program)(variables)
+
+    variables = {"x": 3, "y": 1.5}
+
+    # Test 1: Sama dengan evaluate_postfix (termasuk error), dari string postfix
+    test_cases = [
+        "3 4 +", "3 4 2 * +", "10 5 /", "2 3 ^", "10 0 /", "3 +", "3 4",
+        "x 2 * y +", "x z +", "0 8 - 0.5 ^", "x y + =>$0 $0 * $0 /",
+        "$0 1 +", "x neg 2 ^ sqrt y abs +", "1 4 2 max max 3 min",
+        "x neg log", "sqrt", "x 0 / 1 0 neg /", "1e308 10 *", "0 neg 1 /",
+        # Urutan error: variabel yang tidak ada baru error di OP_LOAD-nya
+        "1 0 / w +", "0 1 - sqrt w +", "w 1 0 / +",
+    ]
+    mismatches = [postfix for postfix in test_cases
+                  if outcome(compiled_engine, postfix, variables) !=
+                  outcome(evaluate_postfix, postfix, variables)]
+    check(f"{len(test_cases)} program postfix identik dengan evaluate_postfix", not mismatches)
+    for postfix in mismatches:
+        print(f"     {postfix}")
+
+    # Test 2: Source hasil generate
+    source = compile_program(infix_to_program("( 3 + 4 ) * x")).source
+    check("Source: ((3.0 + 4.0) * v0)", "return ((3.0 + 4.0) * v0)" in source)
+    check("Pembagian nol → ZeroDivisionError",
+          outcome(compiled_engine, infix_to_postfix("1 / ( x - 3 )"), variables)[0] ==
+          'ZeroDivisionError')
+
+    # Test 3: Ekspresi acak (fungsi, minus unary) vs evaluate_postfix
+    rng = random.Random(2026)
+    atoms = ["x", "y", "2", "0", "0.5", "-3"]
+
+    def random_expression(depth):
+        if depth == 0:
+            return rng.choice(atoms)
+        choice = rng.random()
+        if choice < 0.2:
+            return f"{rng.choice(['sqrt', 'abs', 'log', 'sin'])}({random_expression(depth - 1)})"
+        if choice < 0.3:
+            return f"max({random_expression(depth - 1)}, {random_expression(depth - 1)})"
+        if choice < 0.4:
+            return f"-({random_expression(depth - 1)})"
+        return (f"({random_expression(depth - 1)} {rng.choice('+-*/^')} "
+                f"{random_expression(depth - 1)})")
+
+    mismatches = 0
+    for _ in range(500):
+        program = infix_to_program(random_expression(4))
+        shared = eliminate_common_subexpressions(program)[0]
+        expected = outcome(evaluate_postfix, program, variables)
+        if (outcome(compiled_engine, program, variables) != expected or
+                outcome(compiled_engine, shared, variables) != expected):
+            mismatches += 1
+    check("500 ekspresi acak (+ versi CSE) identik", mismatches == 0)
+
+    # Test 4: Ekspresi sangat panjang / dalam tetap bisa di-compile (spill)
+    long_sum = " + ".join(["x"] * 2000)
+    deep = "(" * 150 + "x" + " + 1)" * 150
+    check("2000 suku (tanpa SyntaxError/RecursionError)",
+          compile_program(infix_to_program(long_sum))(variables) == 6000.0)
+    check("150 kurung bersarang", compile_program(infix_to_program(deep))(variables) == 153.0)
+
+    # Test 5: Cache (identity + key ter-normalisasi)
+    cache = CompiledCache()
+    program = infix_to_program("x * 2 + 1")
+    first = cache.get(program)
+    check("Cache: program yang sama = fungsi yang sama",
+          cache.get(program) is first and
+          cache.get(infix_to_program("x*2.0+1")) is first and cache.compiled == 1)
+    check("Cache: nama variabel berbeda = fungsi berbeda",
+          cache.get(infix_to_program("y * 2 + 1"))(variables) == 4.0 and cache.compiled == 2)
+
+    # Test 6: Lebih cepat dari VM untuk rumus panas
+    program = infix_to_program("( x + 1 ) * ( x - 1 ) / ( y * y + 1 ) + sqrt(x)")
+    run_compiled(program, variables)
+    vm_time = min(timeit.repeat(lambda: run_program(program, variables), number=20000, repeat=5))
+    codegen_time = min(timeit.repeat(lambda: run_compiled(program, variables),
+                                     number=20000, repeat=5))
+    print(f"\n   VM:      {vm_time / 20000 * 1e9:7.0f} ns/eval")
+    print(f"   codegen: {codegen_time / 20000 * 1e9:7.0f} ns/eval\n")
+    check("Codegen lebih cepat dari VM", codegen_time < vm_time)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
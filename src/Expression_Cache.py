@@ -0,0 +1,247 @@
+"""
+Compiled Expression Cache
+==========================
+
+File ini berisi cache untuk hasil konversi infix → postfix.
+
+KENAPA PERLU CACHE?
+Dalam pemakaian nyata, ekspresi yang SAMA dihitung berkali-kali.
+Tanpa cache, Shunting Yard dijalankan ulang setiap kali, padahal
+hasil konversinya pasti sama untuk string infix yang sama.
+
+CARA KERJA (LRU - Least Recently Used):
+- Key   = string infix (persis seperti input)
+- Value = PostfixProgram (hasil compile, bukan string yang di-join ulang)
+- Setiap akses (get/put) memindahkan entry ke posisi "paling baru"
+- Jika cache penuh (jumlah entry atau estimasi bytes), entry yang
+  paling lama tidak dipakai dibuang duluan (eviction)
+
+COUNTER:
+- hits      : berapa kali ekspresi ditemukan di cache
+- misses    : berapa kali ekspresi harus dikonversi ulang
+- evictions : berapa entry yang dibuang karena cache penuh
+
+THREAD SAFETY:
+get/put/clear dilindungi satu threading.Lock. Tanpa lock, entry bisa
+di-evict thread lain di antara get() dan move_to_end() (KeyError), dan
+total_bytes bisa salah hitung saat dua put() berjalan bersamaan.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(key, value):
+    """
+    Estimasi ukuran memory (bytes) dari satu entry cache.
+
+    Args:
+        key (str): String infix
+        value (PostfixProgram): Program postfix
+
+    Returns:
+        int: Perkiraan ukuran dalam bytes
+    """
+    # PostfixProgram.__sizeof__ sudah menghitung array di dalamnya
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class ExpressionCache:
+    """
+    LRU cache untuk PostfixProgram, dibatasi jumlah entry dan/atau bytes.
+
+    Attributes:
+        max_entries (int): Jumlah entry maksimal (None = tidak dibatasi)
+        max_bytes (int): Total estimasi bytes maksimal (None = tidak dibatasi)
+        hits (int): Jumlah cache hit
+        misses (int): Jumlah cache miss
+        evictions (int): Jumlah entry yang dibuang
+
+    Example:
+        cache = ExpressionCache(max_entries=2)
+        cache.put("3 + 4", infix_to_program("3 + 4"))
+        cache.get("3 + 4")   # PostfixProgram('3 4 +')  (hit)
+        cache.get("5 * 6")   # None                     (miss)
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        """
+        Membuat cache kosong.
+
+        Args:
+            max_entries (int): Jumlah entry maksimal (None = tidak dibatasi)
+            max_bytes (int): Total bytes maksimal (None = tidak dibatasi)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # OrderedDict: urutan = urutan pemakaian (awal = paling lama)
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Mengambil program postfix dari cache.
+
+        Args:
+            key (str): String infix
+
+        Returns:
+            PostfixProgram atau None: Program jika ada, None jika miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            # Tandai sebagai paling baru dipakai
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Menyimpan program postfix ke cache (dan evict jika penuh).
+
+        Args:
+            key (str): String infix
+            value (PostfixProgram): Program postfix
+        """
+        if self.max_entries == 0:
+            return
+
+        size = estimate_size(key, value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._sizes[key]
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.total_bytes += size
+
+            self._evict()
+
+    def _evict(self):
+        """
+        Membuang entry paling lama sampai batas entry dan bytes terpenuhi
+        (harus dipanggil dengan lock).
+        """
+        while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            # last=False → ambil entry paling lama (LRU)
+            key, _ = self._entries.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Mengosongkan cache (counter tidak di-reset).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """
+        Snapshot statistik cache.
+
+        Returns:
+            dict: entries, bytes, hits, misses, evictions
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing ExpressionCache (LRU, batas bytes, counter).
+    """
+    from Infix_to_Postfix import infix_to_program
+
+    print("\n" + "="*60)
+    print("TESTING EXPRESSION CACHE")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Hit dan miss
+    cache = ExpressionCache(max_entries=2)
+    cache.put("3 + 4", infix_to_program("3 + 4"))
+    check("Hit mengembalikan program", str(cache.get("3 + 4")) == "3 4 +")
+    check("Miss mengembalikan None", cache.get("5 * 6") is None)
+    check("Counter hit/miss", cache.hits == 1 and cache.misses == 1)
+
+    # Test 2: LRU eviction - entry paling lama dibuang
+    cache.put("1 + 1", infix_to_program("1 + 1"))
+    cache.get("3 + 4")                      # "3 + 4" jadi paling baru
+    cache.put("2 * 2", infix_to_program("2 * 2"))  # "1 + 1" harus di-evict
+    check("LRU eviction", "1 + 1" not in cache and "3 + 4" in cache)
+    check("Counter eviction", cache.evictions == 1)
+
+    # Test 3: Batas bytes
+    cache = ExpressionCache(max_entries=None, max_bytes=1)
+    cache.put("3 + 4", infix_to_program("3 + 4"))
+    check("Batas bytes", len(cache) == 0 and cache.total_bytes == 0)
+
+    # Test 4: Dipakai bersama oleh banyak thread (eviction terus-menerus)
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ExpressionCache(max_entries=8)
+    programs = {f"{i} + 1": infix_to_program(f"{i} + 1") for i in range(32)}
+
+    def worker(offset):
+        for i in range(3000):
+            key = f"{(i + offset) % 32} + 1"
+            if cache.get(key) is None:
+                cache.put(key, programs[key])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+    stats = cache.stats()
+    check("8 thread: tanpa error, counter dan bytes konsisten",
+          stats['hits'] + stats['misses'] == 24000 and stats['entries'] <= 8 and
+          stats['bytes'] == sum(estimate_size(k, v) for k, v in cache._entries.items()))
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,331 @@
+"""
+Expression Tree - DAG dengan Common-Subexpression Elimination
+==============================================================
+
+File ini berisi builder AST/DAG untuk ekspresi yang sudah dikonversi
+oleh Shunting Yard (PostfixProgram hasil infix_to_program).
+
+MASALAH:
+Formula hasil generator (rules engine) sering mengulang sub-ekspresi:
+    ( a + b ) * ( a + b ) / ( a + b )
+Program postfix biasa menghitung "a b +" TIGA kali.
+
+SOLUSI: HASH-CONSING
+Setiap node disimpan di tabel dengan key = (opcode, nilai, kiri, kanan).
+Jika node dengan key yang sama sudah ada, node lama dipakai ulang.
+Hasilnya bukan tree lagi tapi DAG (directed acyclic graph): sub-ekspresi
+yang identik hanya ada SATU kali.
+
+Saat DAG di-emit kembali menjadi PostfixProgram, node operator yang
+dipakai lebih dari satu kali dihitung sekali lalu disimpan ke TEMP SLOT:
+    a b + =>$0 $0 * $0 /
+    - "=>$0" : salin hasil (a + b) ke slot 0 (tetap di stack)
+    - "$0"   : push isi slot 0 (tidak dihitung ulang)
+
+Urutan perhitungan tetap sama dengan program asli (kemunculan pertama
+dihitung di posisi aslinya), jadi error pertama yang terjadi juga sama.
+
+Angka dan variabel tidak disimpan ke slot karena push-nya sudah murah.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OPCODE_SYMBOLS,
+                             OPCODE_ARITY, format_number)
+
+
+class ExpressionDAG:
+    """
+    DAG ekspresi dengan hash-consing (node identik hanya disimpan sekali).
+
+    Setiap node adalah tuple (opcode, value, left, right):
+    - OP_PUSH : value = angka, left/right = -1
+    - OP_LOAD : value = nama variabel, left/right = -1
+    - operator: value = None, left/right = index node child
+      (fungsi unary / minus unary: right = -1)
+
+    Attributes:
+        nodes (list): Semua node unik, child selalu sebelum parent
+        uses (list): Jumlah parent yang memakai setiap node
+        literals (dict): Index node OP_PUSH → teks literal di sumber
+                         (lihat PostfixProgram.literals)
+        root (int): Index node root (-1 jika DAG kosong)
+
+    Example:
+        dag = ExpressionDAG.from_program(infix_to_program("( a + b ) * ( a + b )"))
+        len(dag.nodes)        # 4 (a, b, a+b, *)
+        str(dag.to_program()) # "a b + =>$0 $0 *"
+    """
+
+    def __init__(self):
+        """
+        Membuat DAG kosong.
+        """
+        self.nodes = []
+        self.uses = []
+        self.literals = {}
+        self.root = -1
+        self._index = {}
+
+    def add(self, opcode, value=None, left=-1, right=-1, text=None):
+        """
+        Menambahkan node, atau mengembalikan node identik yang sudah ada.
+
+        Args:
+            opcode (int): OP_PUSH, OP_LOAD atau opcode operator
+            value: Angka (OP_PUSH) atau nama variabel (OP_LOAD)
+            left (int): Index child kiri (operator)
+            right (int): Index child kanan (operator biner)
+            text (str, optional): Teks literal angka (OP_PUSH)
+
+        Returns:
+            int: Index node
+        """
+        node = (opcode, value, left, right)
+        # 0.0 == -0.0 di Python, jadi angka dibedakan lewat hex(). Teks
+        # literal ikut di key: "10000000000000000000001" dan
+        # "10000000000000000000000" float-nya sama, tapi tidak untuk Decimal
+        key = (opcode, value.hex(), text) if opcode == OP_PUSH else node
+
+        index = self._index.get(key)
+        if index is not None:
+            return index
+
+        index = len(self.nodes)
+        self.nodes.append(node)
+        self.uses.append(0)
+        self._index[key] = index
+        if text is not None:
+            self.literals[index] = text
+        if left >= 0:
+            self.uses[left] += 1
+        if right >= 0:
+            self.uses[right] += 1
+        return index
+
+    @classmethod
+    def from_program(cls, program):
+        """
+        Membangun DAG dari PostfixProgram (output Shunting Yard).
+
+        Args:
+            program (PostfixProgram): Program hasil infix_to_program()
+
+        Returns:
+            ExpressionDAG: DAG dengan sub-ekspresi identik digabung
+
+        Raises:
+            ValueError: Jika program invalid (operand kurang/berlebih)
+        """
+        if program.error is not None:
+            raise ValueError(program.error)
+        if program.temps:
+            raise ValueError("Error: Program sudah memakai temp slot!")
+        if program.depth == 0:
+            raise ValueError("Error: Expression kosong atau invalid!")
+        if program.depth > 1:
+            raise ValueError(f"Error: Expression invalid! Stack masih berisi {program.depth} angka.")
+
+        dag = cls()
+        names = program.names
+        stack = []
+        literals = program.literals
+        for position, (opcode, constant) in enumerate(zip(program.opcodes, program.constants)):
+            if opcode == OP_PUSH:
+                stack.append(dag.add(OP_PUSH, constant, text=literals.get(position)))
+            elif opcode == OP_LOAD:
+                stack.append(dag.add(OP_LOAD, names[int(constant)]))
+            elif OPCODE_ARITY[opcode] == 1:
+                stack.append(dag.add(opcode, None, stack.pop()))
+            else:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(dag.add(opcode, None, left, right))
+        dag.root = stack[0]
+        return dag
+
+    def shared(self):
+        """
+        Node operator yang dipakai lebih dari satu kali.
+
+        Returns:
+            list: Index node (urut dari child ke parent)
+        """
+        return [index for index, node in enumerate(self.nodes)
+                if node[2] >= 0 and self.uses[index] > 1]
+
+    def render(self, index):
+        """
+        Render satu node (beserta child-nya) menjadi teks postfix TANPA slot.
+
+        Args:
+            index (int): Index node
+
+        Returns:
+            str: Contoh "a b +"
+        """
+        tokens = []
+        pending = [(index, False)]
+        while pending:
+            current, visited = pending.pop()
+            opcode, value, left, right = self.nodes[current]
+            if opcode == OP_PUSH:
+                tokens.append(format_number(value))
+            elif opcode == OP_LOAD:
+                tokens.append(value)
+            elif visited:
+                tokens.append(OPCODE_SYMBOLS[opcode])
+            else:
+                pending.append((current, True))
+                if right >= 0:
+                    pending.append((right, False))
+                pending.append((left, False))
+        return ' '.join(tokens)
+
+    def to_program(self):
+        """
+        Emit DAG menjadi PostfixProgram dengan OP_STORE/OP_FETCH.
+
+        Node operator yang dipakai lebih dari satu kali dihitung sekali,
+        disimpan ke temp slot, lalu kemunculan berikutnya memakai OP_FETCH.
+
+        Returns:
+            PostfixProgram: Program yang menghitung setiap sub-ekspresi sekali
+        """
+        program = PostfixProgram()
+        if self.root < 0:
+            return program
+
+        uses = self.uses
+        slot_of = {}
+        # Iteratif (post-order) supaya ekspresi panjang tidak kena batas rekursi
+        pending = [(self.root, False)]
+        while pending:
+            current, visited = pending.pop()
+            if current in slot_of:
+                program.add_fetch(slot_of[current])
+                continue
+            opcode, value, left, right = self.nodes[current]
+            if opcode == OP_PUSH:
+                program.add_number(value, self.literals.get(current))
+            elif opcode == OP_LOAD:
+                program.add_variable(value)
+            elif visited:
+                program.add_operator(OPCODE_SYMBOLS[opcode])
+                if uses[current] > 1:
+                    slot_of[current] = len(slot_of)
+                    program.add_store(slot_of[current])
+            else:
+                pending.append((current, True))
+                if right >= 0:
+                    pending.append((right, False))
+                pending.append((left, False))
+        return program
+
+
+def eliminate_common_subexpressions(program):
+    """
+    Menggabungkan sub-ekspresi identik di PostfixProgram.
+
+    Args:
+        program (PostfixProgram): Program hasil infix_to_program()
+
+    Returns:
+        tuple: (PostfixProgram baru, report)
+               report = list of dict {'kind', 'before', 'after', 'uses'}
+               (format sama dengan Optimizer.optimize, kind = 'shared')
+               untuk setiap sub-ekspresi yang dipakai ulang.
+               Program invalid atau tanpa pengulangan dikembalikan
+               apa adanya (report kosong), supaya error-nya tetap
+               dilaporkan oleh evaluator.
+
+    Example:
+        program, report = eliminate_common_subexpressions(
+            infix_to_program("( a + b ) * ( a + b ) / ( a + b )"))
+        str(program)   # "a b + =>$0 $0 * $0 /"
+        report         # [{'kind': 'shared', 'before': 'a b +', 'after': '$0', 'uses': 3}]
+    """
+    if program.error is not None or program.depth != 1 or program.temps:
+        return program, []
+
+    dag = ExpressionDAG.from_program(program)
+    shared = dag.shared()
+    if not shared:
+        return program, []
+
+    optimized = dag.to_program()
+    # Slot diberikan sesuai urutan perhitungan = urutan node di DAG
+    report = [{'kind': 'shared', 'before': dag.render(index), 'after': f"${slot}",
+               'uses': dag.uses[index]}
+              for slot, index in enumerate(shared)]
+    return optimized, report
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing DAG + CSE: hasil sama dengan program asli, program lebih pendek.
+    """
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_Evaluator import evaluate_postfix
+    from Postfix_VM import run_program
+
+    print("\n" + "="*60)
+    print("TESTING EXPRESSION TREE (CSE)")
+    print("="*60 + "\n")
+
+    # Test cases: (infix, expected_program_setelah_cse)
+    test_cases = [
+        ("( a + b ) * ( a + b ) / ( a + b )", "a b + =>$0 $0 * $0 /"),
+        ("a * b + a * b", "a b * =>$0 $0 +"),
+        ("( a + b ) * c + ( a + b ) * c", "a b + c * =>$0 $0 +"),
+        ("( a - 1 ) ^ 2 + ( a - 1 ) * ( b - 1 ) + ( b - 1 ) ^ 2",
+         "a 1 - =>$0 2 ^ $0 b 1 - =>$1 * + $1 2 ^ +"),
+        ("a + b + c", "a b + c +"),                    # Tidak ada pengulangan
+        ("( a / 0 ) + ( a / 0 )", "a 0 / =>$0 $0 +"),  # Error tetap sama
+        ("0 - 0 * 1", "0 0 1 * -"),
+        ("sqrt(a * a) + sqrt(a * a) - -c", "a a * sqrt =>$0 $0 + c neg -"),
+    ]
+
+    passed = 0
+    failed = 0
+    variables = {"a": 2.5, "b": -1.5, "c": 4.0}
+
+    def outcome(engine, program):
+        try:
+            return ('ok', engine(program, variables=variables))
+        except (ValueError, ArithmeticError) as e:
+            return (type(e).__name__, str(e))
+
+    for infix, expected in test_cases:
+        original = infix_to_program(infix)
+        shared, report = eliminate_common_subexpressions(original)
+
+        same = (outcome(run_program, original) == outcome(run_program, shared)
+                == outcome(evaluate_postfix, shared))
+        if str(shared) == expected and same:
+            print(f"✅ PASS - {infix[:40]:40} → {shared}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {infix}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {shared} (hasil sama: {same})")
+            failed += 1
+
+    # Report berisi sub-ekspresi yang dipakai ulang
+    _, report = eliminate_common_subexpressions(
+        infix_to_program("( a + b ) * ( a + b ) / ( a + b )"))
+    if report == [{'kind': 'shared', 'before': 'a b +', 'after': '$0', 'uses': 3}]:
+        print(f"✅ PASS - Report: {report}")
+        passed += 1
+    else:
+        print(f"❌ FAIL - Report: {report}")
+        failed += 1
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,323 @@
+"""
+Calculation History - Ring Buffer + Log di Disk
+================================================
+
+File ini berisi penyimpanan riwayat perhitungan Calculator.
+
+MASALAH:
+Dulu history adalah list of dict {'infix', 'postfix', 'result'} yang
+tidak pernah dibatasi. Di service yang berjalan lama, list ini terus
+tumbuh dan menjadi pemakai memory terbesar:
+- setiap dict ~200+ bytes (hash table) di luar isinya
+- string infix/postfix yang SAMA disimpan berulang kali
+
+SOLUSI:
+1. RING BUFFER: hanya N entry terakhir yang disimpan di RAM
+   (collections.deque dengan maxlen, entry lama otomatis terbuang)
+2. Entry memakai __slots__ (tanpa __dict__ per object)
+3. String infix dan postfix di-intern (sys.intern): ekspresi yang sama
+   dihitung 1000 kali tetap hanya punya SATU object string
+4. LOG DI DISK (opsional): setiap entry juga ditulis ke file
+   append-only (JSON Lines), jadi history lengkap tetap ada tanpa
+   disimpan di RAM. Saat dibaca, file di-scan baris per baris (lazy).
+
+THREAD SAFETY (append tanpa lock di RAM):
+- deque.append() dan next(itertools.count) masing-masing satu operasi C
+  yang atomic, jadi banyak thread bisa append bersamaan tanpa lock
+- Jumlah total dihitung per thread (threading.local), setiap counter
+  hanya diubah oleh thread pemiliknya; total = jumlah semua counter
+- Hanya penulisan ke file log yang memakai lock (I/O harus berurutan)
+
+Format log (satu baris per perhitungan):
+    ["3 + 4", "3 4 +", "7.0"]
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import itertools
+import json
+import sys
+import threading
+from collections import deque
+from itertools import islice
+
+
+class HistoryEntry:
+    """
+    Satu entry history (compact, tanpa __dict__).
+
+    Bisa diakses seperti dict lama: entry['result'] sama dengan entry.result.
+
+    Attributes:
+        infix (str): Ekspresi infix
+        postfix (str): Ekspresi postfix
+        result: Hasil perhitungan (string jika dibaca dari log di disk)
+        number (int): Nomor urut perhitungan (mulai dari 1)
+    """
+
+    __slots__ = ('infix', 'postfix', 'result', 'number')
+
+    def __init__(self, infix, postfix, result, number=0):
+        self.infix = infix
+        self.postfix = postfix
+        self.result = result
+        self.number = number
+
+    def __getitem__(self, key):
+        # Kompatibel dengan format lama (dict)
+        if key not in ('infix', 'postfix', 'result'):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"HistoryEntry({self.infix!r}, {self.postfix!r}, {self.result!r})"
+
+
+class CalculationHistory:
+    """
+    Riwayat perhitungan: ring buffer di RAM + log append-only di disk (opsional).
+
+    Attributes:
+        max_entries (int): Jumlah entry maksimal di RAM
+        log_path (str): Path file log (None = tanpa log di disk)
+        total (int): Jumlah entry yang pernah ditambahkan (sejak clear terakhir)
+                     (property, dihitung dari counter per thread)
+
+    Example:
+        history = CalculationHistory(max_entries=2, log_path="history.jsonl")
+        history.append("3 + 4", "3 4 +", 7.0)
+        history.append("5 * 6", "5 6 *", 30.0)
+        history.append("1 + 1", "1 1 +", 2.0)
+        len(history)              # 2 (entry pertama terbuang dari RAM)
+        len(list(history.entries()))   # 3 (dibaca dari log di disk)
+    """
+
+    def __init__(self, max_entries=1000, log_path=None):
+        """
+        Args:
+            max_entries (int): Jumlah entry maksimal di RAM (0 = tidak ada di RAM)
+            log_path (str, optional): File log append-only. Jika file sudah
+                                      ada, entry baru ditambahkan di akhir.
+        """
+        self.max_entries = max_entries
+        self.log_path = log_path
+        self._entries = deque(maxlen=max_entries)
+        self._reset_counters()
+        self._log = open(log_path, 'a', encoding='utf-8') if log_path else None
+        self._log_lock = threading.Lock()
+
+    def _reset_counters(self):
+        """
+        Nomor urut entry dan counter per thread dimulai dari awal.
+        """
+        self._numbers = itertools.count(1)
+        self._counters = []
+        self._local = threading.local()
+
+    @property
+    def total(self):
+        return sum(counter[0] for counter in list(self._counters))
+
+    def append(self, infix, postfix, result):
+        """
+        Menambahkan satu perhitungan.
+
+        Args:
+            infix (str): Ekspresi infix
+            postfix (str): Ekspresi postfix
+            result: Hasil perhitungan
+        """
+        infix = sys.intern(infix)
+        postfix = sys.intern(postfix)
+        # Tanpa lock: next(count) dan deque.append masing-masing atomic
+        self._entries.append(HistoryEntry(infix, postfix, result, next(self._numbers)))
+
+        # Counter milik thread ini saja (tidak ada thread lain yang mengubahnya)
+        local = self._local
+        counter = getattr(local, 'counter', None)
+        if counter is None:
+            counter = local.counter = [0]
+            self._counters.append(counter)
+        counter[0] += 1
+
+        if self._log is not None:
+            line = json.dumps([infix, postfix, str(result)]) + '\n'
+            # Ditulis lewat buffer file; flush() sebelum log dibaca
+            with self._log_lock:
+                self._log.write(line)
+
+    def entries(self):
+        """
+        Semua entry, dari yang paling lama (lazy).
+
+        Jika ada log di disk, history LENGKAP dibaca dari file baris per
+        baris; jika tidak, hanya entry yang masih ada di RAM.
+
+        Yields:
+            HistoryEntry: Entry history
+        """
+        if self._log is None:
+            yield from list(self._entries)
+            return
+        with self._log_lock:
+            self._log.flush()
+        with open(self.log_path, encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                infix, postfix, result = json.loads(line)
+                yield HistoryEntry(infix, postfix, result, number)
+
+    def page(self, number, size=20):
+        """
+        Mengambil satu halaman history (tanpa membaca seluruh log ke RAM).
+
+        Args:
+            number (int): Nomor halaman (mulai dari 1)
+            size (int): Jumlah entry per halaman
+
+        Returns:
+            list: HistoryEntry di halaman tersebut (kosong jika di luar batas)
+        """
+        start = (number - 1) * size
+        return list(islice(self.entries(), start, start + size))
+
+    def clear(self):
+        """
+        Menghapus semua history (di RAM dan isi log di disk).
+        """
+        self._entries.clear()
+        self._reset_counters()
+        if self._log is not None:
+            with self._log_lock:
+                self._log.close()
+                self._log = open(self.log_path, 'w', encoding='utf-8')
+
+    def close(self):
+        """
+        Menutup file log (entry di buffer ditulis ke disk).
+        """
+        if self._log is not None:
+            with self._log_lock:
+                self._log.close()
+                self._log = None
+
+    def __len__(self):
+        """
+        Jumlah entry di RAM.
+        """
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def __bool__(self):
+        return self.total > 0 or bool(self._entries)
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing history: batas RAM, interning, log di disk, paging.
+    """
+    import os
+    import tempfile
+    import tracemalloc
+
+    print("\n" + "="*60)
+    print("TESTING CALCULATION HISTORY")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Ring buffer
+    history = CalculationHistory(max_entries=3)
+    for i in range(5):
+        history.append(f"{i} + 1", f"{i} 1 +", i + 1.0)
+    check("Hanya 3 entry terakhir di RAM", [entry.result for entry in history] == [3.0, 4.0, 5.0])
+    check("Total tetap dihitung", history.total == 5)
+    check("Akses gaya dict lama", history[-1]['infix'] == "4 + 1")
+
+    # Test 2: String yang sama di-intern
+    history = CalculationHistory()
+    for _ in range(2):
+        history.append("".join(["3", " + ", "4"]), "".join(["3 4", " +"]), 7.0)
+    check("Infix yang sama = object yang sama", history[0].infix is history[1].infix)
+
+    # Test 3: Log di disk + paging lazy
+    path = os.path.join(tempfile.mkdtemp(), "history.jsonl")
+    history = CalculationHistory(max_entries=2, log_path=path)
+    for i in range(45):
+        history.append(f"{i} * 2", f"{i} 2 *", i * 2.0)
+    check("RAM dibatasi 2 entry", len(history) == 2)
+    check("Log berisi 45 entry", sum(1 for _ in history.entries()) == 45)
+    check("Halaman 3 (size 20) berisi 5 entry",
+          [entry.infix for entry in history.page(3)] == [f"{i} * 2" for i in range(40, 45)])
+    history.close()
+
+    # Log lama dilanjutkan saat dibuka lagi
+    history = CalculationHistory(log_path=path)
+    history.append("1 + 1", "1 1 +", 2.0)
+    check("Log dilanjutkan (append-only)", sum(1 for _ in history.entries()) == 46)
+    history.clear()
+    check("clear() mengosongkan RAM dan log", list(history.entries()) == [])
+    history.close()
+
+    # Test 4: Append dari banyak thread (tanpa lock di RAM)
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = os.path.join(tempfile.mkdtemp(), "threads.jsonl")
+    history = CalculationHistory(max_entries=100000, log_path=path)
+
+    def append_many(worker):
+        for i in range(2000):
+            history.append(f"{worker} + {i}", f"{worker} {i} +", float(worker + i))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(append_many, range(8)))
+    numbers = sorted(entry.number for entry in history)
+    check("8 thread x 2000 append: tidak ada entry hilang",
+          history.total == 16000 and numbers == list(range(1, 16001)))
+    check("8 thread: log berisi 16000 baris utuh", sum(1 for _ in history.entries()) == 16000)
+    history.close()
+
+    # Test 5: Memory dibanding list of dict (ekspresi berulang)
+    expressions = [(f"x * {i % 50} + 1", f"x {i % 50} * 1 +") for i in range(20000)]
+
+    tracemalloc.start()
+    old_history = []
+    for infix, postfix in expressions:
+        old_history.append({'infix': infix + "", 'postfix': postfix + "", 'result': 1.5})
+    old_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del old_history
+
+    tracemalloc.start()
+    history = CalculationHistory(max_entries=20000)
+    for infix, postfix in expressions:
+        history.append(infix + "", postfix + "", 1.5)
+    new_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"\n   list of dict: {old_bytes / 1024:8.0f} KB")
+    print(f"   ring buffer:  {new_bytes / 1024:8.0f} KB\n")
+    check("Memory lebih kecil dari list of dict", new_bytes < old_bytes)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
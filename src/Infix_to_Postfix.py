@@ -30,6 +30,65 @@ Date: Februari 2026
 
 # Import Stack class yang sudah kita buat
 from Stack import Stack
+from Postfix_Program import PostfixProgram, FUNCTION_OPCODES
+
+
+# Versi hasil konversi infix → PostfixProgram. Naikkan jika program hasil
+# konversi untuk ekspresi yang sama berubah (opcode baru, aturan precedence,
+# dll): cache program di disk (Program_Disk_Cache.py) dengan versi lain
+# otomatis diabaikan.
+PARSER_VERSION = 1
+
+# Tabel operator: simbol → (precedence, associativity, arity)
+# Dibuat SEKALI sebagai konstanta modul (bukan per panggilan).
+# 'neg' adalah minus unary (-x). Precedence-nya di antara * / dan ^,
+# jadi -2 ^ 2 = -(2 ^ 2) = -4 dan -2 * 3 = (-2) * 3.
+OPERATOR_TABLE = {
+    '+': (1, 'left', 2),     # Penjumlahan: precedence terendah
+    '-': (1, 'left', 2),     # Pengurangan: precedence terendah
+    '*': (2, 'left', 2),     # Perkalian: precedence menengah
+    '/': (2, 'left', 2),     # Pembagian: precedence menengah
+    'neg': (3, 'right', 1),  # Minus unary
+    '^': (4, 'right', 2),    # Pangkat: precedence tertinggi, 2 ^ 3 ^ 2 = 2 ^ (3 ^ 2)
+}
+
+# Precedence per simbol (dipakai get_precedence)
+PRECEDENCE = {symbol: info[0] for symbol, info in OPERATOR_TABLE.items()}
+
+# Semua karakter operator di infix
+OPERATORS = frozenset('+-*/^')
+
+# Operator di stack di-pop selama precedence-nya >= POP_LIMIT operator baru.
+# Left-associative: limit = precedence (yang sama ikut di-pop)
+# Right-associative: limit = precedence + 1 (yang sama TIDAK di-pop)
+POP_LIMIT = {symbol: precedence + (associativity == 'right')
+             for symbol, (precedence, associativity, arity) in OPERATOR_TABLE.items()
+             if arity == 2}
+
+# Precedence isi stack operator. '(' = 0 supaya tidak pernah di-pop oleh
+# operator, sehingga loop pop cukup satu lookup dict per iterasi
+STACK_PRECEDENCE = {**PRECEDENCE, '(': 0}
+
+# Fungsi yang didukung: nama → (argumen minimal, argumen maksimal)
+# None = tidak terbatas (min/max di-compile menjadi operasi biner berulang)
+FUNCTION_ARITY = {
+    'sqrt': (1, 1),
+    'sin': (1, 1),
+    'cos': (1, 1),
+    'tan': (1, 1),
+    'log': (1, 1),
+    'exp': (1, 1),
+    'abs': (1, 1),
+    'min': (1, None),
+    'max': (1, None),
+}
+
+# Nama yang tidak boleh dipakai sebagai variabel (dirender sebagai fungsi)
+RESERVED_NAMES = frozenset(FUNCTION_OPCODES)
+
+# TOKEN_PATTERN.finditer dari Tokenizer.py, diisi saat scan_to_program()
+# pertama kali dipanggil (modul re mahal di-import, lihat tokenize())
+_token_finditer = None
 
 
 def get_precedence(operator):
@@ -42,31 +101,22 @@ def get_precedence(operator):
     ATURAN MATEMATIKA:
     - Perkalian dan Pembagian (*, /) = precedence tinggi (2)
     - Penjumlahan dan Pengurangan (+, -) = precedence rendah (1)
-    - Pangkat (^) = precedence paling tinggi (3)
+    - Minus unary (neg) = precedence 3
+    - Pangkat (^) = precedence paling tinggi (4)
     
     Args:
-        operator (str): Operator matematika (+, -, *, /, ^)
+        operator (str): Operator matematika (+, -, *, /, ^) atau 'neg'
     
     Returns:
-        int: Tingkat precedence (1, 2, atau 3)
+        int: Tingkat precedence (1 sampai 4)
     
     Example:
         get_precedence('+')  # Returns 1
         get_precedence('*')  # Returns 2
-        get_precedence('^')  # Returns 3
+        get_precedence('^')  # Returns 4
     """
-    # Dictionary untuk mapping operator ke precedence
-    # Lebih mudah dibaca dan di-maintain daripada if-else
-    precedence = {
-        '+': 1,  # Penjumlahan: precedence terendah
-        '-': 1,  # Pengurangan: precedence terendah
-        '*': 2,  # Perkalian: precedence menengah
-        '/': 2,  # Pembagian: precedence menengah
-        '^': 3   # Pangkat: precedence tertinggi
-    }
-    
-    # Return precedence, default 0 jika operator tidak dikenal
-    return precedence.get(operator, 0)
+    # Return precedence dari tabel PRECEDENCE, default 0 jika operator tidak dikenal
+    return PRECEDENCE.get(operator, 0)
 
 
 def is_operator(char):
@@ -84,20 +134,156 @@ def is_operator(char):
         is_operator('5')  # False
         is_operator('(')  # False
     """
-    # List semua operator yang didukung
-    operators = ['+', '-', '*', '/', '^']
+    # Cek apakah char ada dalam set OPERATORS
+    return char in OPERATORS
+
+
+def is_identifier_start(char):
+    """
+    Mengecek apakah karakter bisa menjadi awal nama variabel.
+    
+    Args:
+        char (str): Karakter yang akan dicek
+    
+    Returns:
+        bool: True untuk huruf atau underscore
+    
+    Example:
+        is_identifier_start('x')  # True
+        is_identifier_start('_')  # True
+        is_identifier_start('5')  # False
+    """
+    return char.isalpha() or char == '_'
+
+
+def add_operand(program, text):
+    """
+    Tambahkan operand (angka atau variabel) dari buffer ke program.
+    
+    Angka di-parse SEKALI di sini. Token yang diawali huruf/underscore
+    dianggap nama variabel (misal "x", "rate_2").
+    
+    Args:
+        program (PostfixProgram): Program tujuan
+        text (str): Isi buffer, misal "45.6" atau "x"
+    
+    Raises:
+        ValueError: Jika token bukan angka yang valid (misal "1.2.3"),
+                    atau nama variabel sama dengan nama fungsi
+    """
+    if is_identifier_start(text[0]):
+        if text in RESERVED_NAMES:
+            raise ValueError(f"Error: '{text}' adalah nama fungsi, bukan variabel!")
+        program.add_variable(text)
+        return
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f"Error: Angka '{text}' tidak valid!")
+    program.add_number(value, text)
+
+
+def add_function_call(program, name, count):
+    """
+    Tambahkan pemanggilan fungsi ke program setelah semua argumennya.
+    
+    Fungsi variadik (min, max) di-compile menjadi operasi biner berulang:
+    max(a, b, c) → a b c max max
+    
+    Args:
+        program (PostfixProgram): Program tujuan
+        name (str): Nama fungsi, misal "sqrt"
+        count (int): Jumlah argumen (jumlah koma + 1)
+    
+    Raises:
+        ValueError: Jika jumlah argumen tidak sesuai
+    """
+    minimum, maximum = FUNCTION_ARITY[name]
+    if count < minimum or (maximum is not None and count > maximum):
+        expected = minimum if maximum == minimum else f"minimal {minimum}"
+        raise ValueError(f"Error: Fungsi '{name}' butuh {expected} argumen, diberikan {count}!")
+    if maximum is None:
+        for _ in range(count - 1):
+            program.add_operator(name)
+    else:
+        program.add_operator(name)
+
+
+def check_function(name):
+    """
+    Validasi nama fungsi yang dipanggil, misal "sqrt" pada "sqrt(x)".
     
-    # Cek apakah char ada dalam list operators
-    return char in operators
+    Raises:
+        ValueError: Jika fungsi tidak dikenal
+    """
+    if name not in FUNCTION_ARITY:
+        raise ValueError(f"Error: Fungsi '{name}' tidak dikenal!")
+
+
+def tokenize(expression):
+    """
+    tokenize() dari Tokenizer.py, di-import saat pertama dipakai.
+
+    Tokenizer memakai modul re (~8 ms import). Setelah panggilan pertama,
+    nama tokenize di modul ini langsung menunjuk ke Tokenizer.tokenize,
+    jadi jalur cepat tidak membayar lapisan tambahan.
+    """
+    global tokenize
+    from Tokenizer import tokenize
+    return tokenize(expression)
 
 
-def infix_to_postfix(expression):
+def infix_to_postfix(expression, tracer=None):
     """
-    Mengkonversi ekspresi infix menjadi postfix menggunakan Shunting Yard Algorithm.
+    Mengkonversi ekspresi infix menjadi string postfix.
+    
+    Wrapper dari infix_to_program() yang me-render program menjadi string.
+    Pakai infix_to_program() jika hasilnya akan langsung dievaluasi
+    (angka sudah di-parse, tidak perlu join lalu split lagi).
+    
+    Args:
+        expression (str): Ekspresi matematika dalam notasi infix
+        tracer (TraceSink, optional): Sink untuk step events
+    
+    Returns:
+        str: Ekspresi dalam notasi postfix, contoh: "3 4 2 * +"
+    """
+    return str(infix_to_program(expression, tracer))
+
+
+def infix_to_program(expression, tracer=None):
+    """
+    Mengkonversi ekspresi infix menjadi PostfixProgram.
+    
+    Tanpa tracer, dipakai scan_to_program() (regex Tokenizer.py, Shunting
+    Yard langsung per match). Dengan tracer, dipakai char_loop_to_program()
+    supaya setiap langkah bisa ditampilkan. Hasil kedua jalur sama.
+    
+    Args:
+        expression (str): Ekspresi matematika dalam notasi infix
+        tracer (TraceSink, optional): Sink untuk step events
+    
+    Returns:
+        PostfixProgram: Program postfix (lihat Postfix_Program.py)
+    
+    Raises:
+        ValueError: Jika ada angka yang tidak valid (misal "1.2.3"),
+                    karakter yang tidak dikenal, '(' yang tidak ditutup,
+                    atau ')' tanpa pasangan
+    """
+    if tracer is None:
+        return scan_to_program(expression)
+    return char_loop_to_program(expression, tracer)
+
+
+def char_loop_to_program(expression, tracer=None):
+    """
+    Mengkonversi ekspresi infix menjadi postfix menggunakan Shunting Yard Algorithm,
+    dengan scan per karakter (jalur step-by-step).
     
     ALGORITMA SHUNTING YARD:
     1. Scan expression dari kiri ke kanan
-    2. Jika operand (angka): langsung ke output
+    2. Jika operand (angka atau variabel): langsung ke output
     3. Jika '(': push ke stack
     4. Jika ')': pop sampai ketemu '('
     5. Jika operator:
@@ -108,129 +294,450 @@ def infix_to_postfix(expression):
     Args:
         expression (str): Ekspresi matematika dalam notasi infix
                          Contoh: "3 + 4 * 2"
+        tracer (TraceSink, optional): Sink untuk step events (lihat Trace_Sink.py).
+                         Jika None, tidak ada event yang dibuat sama sekali.
     
     Returns:
-        str: Ekspresi dalam notasi postfix
-             Contoh: "3 4 2 * +"
+        PostfixProgram: Program postfix (lihat Postfix_Program.py)
+                        str(program) → "3 4 2 * +"
+    
+    Raises:
+        ValueError: Jika ada angka yang tidak valid (misal "1.2.3"),
+                    karakter yang tidak dikenal, '(' yang tidak ditutup,
+                    atau ')' tanpa pasangan
     
     Example:
-        infix_to_postfix("3 + 4")           # Returns "3 4 +"
-        infix_to_postfix("3 + 4 * 2")       # Returns "3 4 2 * +"
-        infix_to_postfix("(5 + 6) * 2")     # Returns "5 6 + 2 *"
+        str(char_loop_to_program("3+4"))          # "3 4 +" (spasi opsional)
+        str(char_loop_to_program("3 + 4 * 2"))    # "3 4 2 * +"
+        str(char_loop_to_program("(5 + 6) * 2"))  # "5 6 + 2 *"
+        str(char_loop_to_program("x * 2 + y"))    # "x 2 * y +"
+        char_loop_to_program("3 + 4", tracer=TextSink())  # Tampilkan step-by-step
     """
     
     # Stack untuk menyimpan operator sementara
     stack = Stack()
     
-    # String untuk menyimpan hasil postfix
-    postfix = []
+    # Program untuk menyimpan hasil postfix (opcodes + konstanta angka)
+    program = PostfixProgram()
     
     # Variabel untuk menyimpan angka multi-digit (misal: 123, 45.6)
+    # atau nama variabel/fungsi (misal: x, rate_2, sqrt)
     current_number = ""
     
-    print(f"\n{'='*60}")
-    print(f"KONVERSI INFIX KE POSTFIX")
-    print(f"{'='*60}")
-    print(f"Infix expression: {expression}")
-    print(f"{'='*60}\n")
+    # True jika token berikutnya harus operand (di awal, setelah operator,
+    # '(' atau ','). '-' pada posisi ini adalah minus unary.
+    expect_operand = True
+    
+    # Jumlah argumen untuk setiap pemanggilan fungsi yang masih terbuka
+    arg_counts = []
+    
+    # PENTING: Semua event dibungkus "if tracer is not None" supaya
+    # tanpa sink tidak ada formatting/snapshot stack yang dikerjakan
+    if tracer is not None:
+        tracer.emit('infix', 'start', expression=expression)
     
     # Scan setiap karakter dalam expression
     for i, char in enumerate(expression):
         
-        print(f"Step {i+1}: Membaca karakter '{char}'")
+        if tracer is not None:
+            tracer.emit('infix', 'read', step=i + 1, char=char)
         
         # CASE 1: Karakter adalah DIGIT atau TITIK (bagian dari angka)
-        if char.isdigit() or char == '.':
+        # Tanda +/- setelah "e" pada angka adalah bagian notasi ilmiah (1e-5)
+        if (char.isdigit() or char == '.' or
+                (char in '+-' and current_number[-1:] in ('e', 'E') and
+                 current_number[:1].isdigit())):
             # Tambahkan ke current_number untuk handle multi-digit
             current_number += char
-            print(f"  → Digit/Decimal point, tambah ke number buffer: '{current_number}'")
+            if tracer is not None:
+                tracer.emit('infix', 'digit', buffer=current_number)
+        
+        # CASE 1b: Karakter adalah HURUF/UNDERSCORE (bagian dari nama variabel)
+        elif is_identifier_start(char):
+            current_number += char
+            if tracer is not None:
+                tracer.emit('infix', 'letter', buffer=current_number)
         
-        # CASE 2: Karakter adalah SPASI (separator)
-        elif char == ' ':
+        # CASE 2: Karakter adalah SPASI/TAB (separator)
+        elif char.isspace():
+            # Nama yang diikuti '(' adalah nama fungsi: tunggu '(' dulu
+            if (current_number and is_identifier_start(current_number[0]) and
+                    expression[i + 1:].lstrip().startswith('(')):
+                continue
             # Jika ada current_number, selesaikan dan tambah ke output
             if current_number:
-                postfix.append(current_number)
-                print(f"  → Spasi ditemukan, finalisasi number: {current_number}")
-                print(f"  → Tambah '{current_number}' ke postfix")
-                print(f"  → Postfix sekarang: {' '.join(postfix)}")
+                add_operand(program, current_number)
+                if tracer is not None:
+                    tracer.emit('infix', 'number', number=current_number,
+                                reason='space', postfix=program.tokens())
                 current_number = ""  # Reset number buffer
+                expect_operand = False
         
         # CASE 3: Karakter adalah KURUNG BUKA '('
         elif char == '(':
+            # Nama tepat sebelum '(' adalah FUNGSI, misal "sqrt(" atau "max ("
+            if current_number and is_identifier_start(current_number[0]):
+                check_function(current_number)
+                stack.push(current_number)
+                arg_counts.append(1)
+                if tracer is not None:
+                    tracer.emit('infix', 'function', name=current_number,
+                                stack=list(stack.items))
+                current_number = ""
+            elif current_number:
+                add_operand(program, current_number)
+                current_number = ""
+            
             # Kurung buka langsung di-push ke stack
             stack.push(char)
-            print(f"  → Kurung buka '(', push ke stack")
-            print(f"  → Stack sekarang: {stack}")
+            expect_operand = True
+            if tracer is not None:
+                tracer.emit('infix', 'lparen', stack=list(stack.items))
         
-        # CASE 4: Karakter adalah KURUNG TUTUP ')'
-        elif char == ')':
+        # CASE 4: Karakter adalah KURUNG TUTUP ')' atau KOMA ','
+        elif char == ')' or char == ',':
             # Finalisasi current_number jika ada
             if current_number:
-                postfix.append(current_number)
-                print(f"  → Finalisasi number sebelum ')': {current_number}")
+                add_operand(program, current_number)
+                if tracer is not None:
+                    tracer.emit('infix', 'number', number=current_number,
+                                reason='paren', postfix=program.tokens())
                 current_number = ""
             
             # Pop semua operator sampai ketemu '('
-            print(f"  → Kurung tutup ')', pop operator sampai ketemu '('")
+            if tracer is not None:
+                if char == ')':
+                    tracer.emit('infix', 'rparen')
+                else:
+                    tracer.emit('infix', 'comma', count=arg_counts[-1] + 1 if arg_counts else 2)
             while not stack.is_empty() and stack.peek() != '(':
                 popped = stack.pop()
-                postfix.append(popped)
-                print(f"     - Pop operator '{popped}' dari stack ke postfix")
+                program.add_operator(popped)
+                if tracer is not None:
+                    tracer.emit('infix', 'pop', operator=popped, reason='paren')
+            
+            # Koma: pindah ke argumen berikutnya, '(' tetap di stack
+            if char == ',':
+                items = stack.items
+                if len(items) < 2 or items[-2] not in FUNCTION_ARITY:
+                    raise ValueError(f"Error: Koma di luar pemanggilan fungsi (posisi {i})!")
+                arg_counts[-1] += 1
+                expect_operand = True
+                continue
+            
+            # Stack habis tanpa '(' berarti ')' tidak punya pasangan
+            if stack.is_empty():
+                raise ValueError(f"Error: Kurung tutup tanpa pasangan (posisi {i})!")
             
             # Pop '(' dari stack (tapi tidak masuk ke postfix)
-            if not stack.is_empty():
-                stack.pop()  # Buang '('
-                print(f"  → Buang '(' dari stack")
+            stack.pop()  # Buang '('
+            if tracer is not None:
+                tracer.emit('infix', 'discard_paren')
             
-            print(f"  → Postfix sekarang: {' '.join(postfix)}")
+            # Jika '(' milik fungsi, fungsi dipanggil sekarang
+            if not stack.is_empty() and stack.peek() in FUNCTION_ARITY:
+                name = stack.pop()
+                count = arg_counts.pop()
+                add_function_call(program, name, count)
+                if tracer is not None:
+                    tracer.emit('infix', 'call', name=name, count=count,
+                                postfix=program.tokens())
+            elif tracer is not None:
+                tracer.emit('infix', 'postfix', postfix=program.tokens())
+            
+            expect_operand = False
         
         # CASE 5: Karakter adalah OPERATOR (+, -, *, /, ^)
         elif is_operator(char):
             # Finalisasi current_number jika ada
             if current_number:
-                postfix.append(current_number)
-                print(f"  → Finalisasi number sebelum operator: {current_number}")
+                add_operand(program, current_number)
+                if tracer is not None:
+                    tracer.emit('infix', 'number', number=current_number,
+                                reason='operator', postfix=program.tokens())
                 current_number = ""
+                expect_operand = False
+            
+            # Operator di posisi operand adalah operator UNARY
+            if expect_operand:
+                if char == '-':
+                    # Minus unary: push 'neg' tanpa pop (operator prefix)
+                    stack.push('neg')
+                    if tracer is not None:
+                        tracer.emit('infix', 'operator', operator='neg',
+                                    precedence=get_precedence('neg'))
+                        tracer.emit('infix', 'push', operator='neg', stack=list(stack.items))
+                    continue
+                if char == '+':
+                    # Plus unary tidak mengubah nilai, dilewati
+                    continue
             
             # Pop operator dari stack yang precedence-nya >= operator sekarang
-            print(f"  → Operator '{char}' (precedence: {get_precedence(char)})")
+            # (untuk '^' yang right-associative: hanya yang > operator sekarang)
+            if tracer is not None:
+                tracer.emit('infix', 'operator', operator=char,
+                            precedence=get_precedence(char))
             
-            while (not stack.is_empty() and 
-                   stack.peek() != '(' and 
-                   get_precedence(stack.peek()) >= get_precedence(char)):
+            limit = POP_LIMIT[char]
+            while (not stack.is_empty() and
+                   STACK_PRECEDENCE[stack.peek()] >= limit):
                 
                 popped = stack.pop()
-                postfix.append(popped)
-                print(f"     - Pop '{popped}' (precedence: {get_precedence(popped)}) dari stack ke postfix")
+                program.add_operator(popped)
+                if tracer is not None:
+                    tracer.emit('infix', 'pop', operator=popped, reason='operator',
+                                precedence=get_precedence(popped))
             
             # Push operator sekarang ke stack
             stack.push(char)
-            print(f"  → Push operator '{char}' ke stack")
-            print(f"  → Stack sekarang: {stack}")
-            print(f"  → Postfix sekarang: {' '.join(postfix)}")
+            expect_operand = True
+            if tracer is not None:
+                tracer.emit('infix', 'push', operator=char, stack=list(stack.items))
+                tracer.emit('infix', 'postfix', postfix=program.tokens())
+        
+        # CASE 6: Karakter lain tidak dikenal (sama dengan tokenize())
+        else:
+            raise ValueError(f"Error: Karakter '{char}' tidak dikenal (posisi {i})!")
     
     # Jangan lupa: finalisasi current_number terakhir jika ada
     if current_number:
-        postfix.append(current_number)
-        print(f"\nFinalisasi number terakhir: {current_number}")
+        add_operand(program, current_number)
+        if tracer is not None:
+            tracer.emit('infix', 'number', number=current_number,
+                        reason='end', postfix=program.tokens())
     
     # Pop semua operator yang tersisa di stack
-    print(f"\nPop semua operator tersisa di stack:")
+    if tracer is not None:
+        tracer.emit('infix', 'flush')
     while not stack.is_empty():
         popped = stack.pop()
-        postfix.append(popped)
-        print(f"  - Pop '{popped}' dari stack ke postfix")
+        # '(' yang tersisa berarti kurung tidak pernah ditutup
+        if popped == '(':
+            raise ValueError("Error: Tanda kurung '(' tidak ditutup!")
+        program.add_operator(popped)
+        if tracer is not None:
+            tracer.emit('infix', 'pop', operator=popped, reason='end')
     
-    # Gabungkan list postfix menjadi string dengan spasi sebagai separator
-    result = ' '.join(postfix)
+    if tracer is not None:
+        tracer.emit('infix', 'done', expression=expression, postfix=str(program))
+    
+    return program
+
+
+def tokens_to_program(tokens):
+    """
+    Shunting Yard untuk token yang SUDAH dipecah (tanpa scan per karakter).
     
-    print(f"\n{'='*60}")
-    print(f"HASIL KONVERSI:")
-    print(f"Infix:   {expression}")
-    print(f"Postfix: {result}")
-    print(f"{'='*60}\n")
+    Dipakai oleh tokenize() (Tokenizer.py) dan tokenizer lain (misal
+    Bulk_Ingest yang membaca langsung dari buffer bytes) supaya hasilnya
+    tetap masuk ke PostfixProgram yang sama.
+    Versi ini tidak mengirim step events (tanpa tracer).
     
-    return result
+    Args:
+        tokens (iterable): Tuple (kind, value, position):
+                           ('number', '3', 0), ('name', 'x', 4),
+                           ('operator', '+', 2), ('function', 'sqrt', 0),
+                           ('(', '(', 0), (')', ')', 6), (',', ',', 3)
+    
+    Returns:
+        PostfixProgram: Program postfix
+    
+    Raises:
+        ValueError: Jika ada '(' yang tidak ditutup, ')' tanpa pasangan,
+                    fungsi tidak dikenal, jumlah argumen salah, atau koma
+                    di luar fungsi
+    
+    Example:
+        str(tokens_to_program(tokenize("3+4")))          # "3 4 +"
+        str(tokens_to_program(tokenize("-2^3^2")))       # "2 3 2 ^ ^ neg"
+        str(tokens_to_program(tokenize("max(1, x, 3)"))) # "1 x 3 max max"
+    """
+    program = PostfixProgram()
+    # List biasa sebagai stack operator (tanpa overhead method Stack)
+    operators = []
+    # Jumlah argumen untuk setiap pemanggilan fungsi yang masih terbuka
+    arg_counts = []
+    # Lookup tabel lewat variabel lokal (lebih cepat dari global per token)
+    pop_limit = POP_LIMIT
+    stack_precedence = STACK_PRECEDENCE
+    functions = FUNCTION_ARITY
+    reserved = RESERVED_NAMES
+    # True jika token berikutnya harus operand ('-' di sini = minus unary)
+    expect_operand = True
+    
+    # Urutan cabang: token yang paling sering (angka, operator) dicek dulu
+    for kind, value, position in tokens:
+        if kind == 'number':
+            # value = teks angka yang sudah divalidasi tokenizer
+            program.add_number(float(value), value)
+            expect_operand = False
+        elif kind == 'operator':
+            if expect_operand:
+                if value == '-':
+                    operators.append('neg')  # Prefix: push tanpa pop
+                    continue
+                if value == '+':
+                    continue  # Plus unary tidak mengubah nilai
+            limit = pop_limit[value]
+            while operators and stack_precedence[operators[-1]] >= limit:
+                program.add_operator(operators.pop())
+            operators.append(value)
+            expect_operand = True
+        elif kind == 'name':
+            if value in reserved:
+                raise ValueError(f"Error: '{value}' adalah nama fungsi, bukan variabel!")
+            program.add_variable(value)
+            expect_operand = False
+        elif kind == '(':
+            operators.append('(')
+            expect_operand = True
+        elif kind == ')':
+            while operators and operators[-1] != '(':
+                program.add_operator(operators.pop())
+            if not operators:
+                raise ValueError(f"Error: Kurung tutup tanpa pasangan (posisi {position})!")
+            operators.pop()  # Buang '('
+            if operators and operators[-1] in functions:
+                add_function_call(program, operators.pop(), arg_counts.pop())
+            expect_operand = False
+        elif kind == ',':
+            while operators and operators[-1] != '(':
+                program.add_operator(operators.pop())
+            if len(operators) < 2 or operators[-2] not in functions:
+                raise ValueError(f"Error: Koma di luar pemanggilan fungsi (posisi {position})!")
+            arg_counts[-1] += 1
+            expect_operand = True
+        else:
+            # 'function': nama yang langsung diikuti '('
+            check_function(value)
+            operators.append(value)
+            arg_counts.append(1)
+            expect_operand = True
+    
+    while operators:
+        popped = operators.pop()
+        if popped == '(':
+            raise ValueError("Error: Tanda kurung '(' tidak ditutup!")
+        program.add_operator(popped)
+    
+    return program
+
+
+def scan_to_program(expression):
+    """
+    Shunting Yard langsung di atas match regex TOKEN_PATTERN (Tokenizer.py).
+    
+    Hasilnya sama dengan tokens_to_program(tokenize(expression)), tetapi
+    tanpa membuat tuple token dan list token lalu membacanya lagi: setiap
+    match langsung diproses berdasarkan nomor group-nya. Untuk ekspresi
+    pendek (~7 token) biaya itu sebanding dengan biaya scan-nya sendiri,
+    sehingga jalur dua tahap tidak lebih cepat dari char_loop_to_program().
+    Ini jalur infix_to_program() tanpa tracer.
+    
+    Error dilaporkan sesuai urutan token di ekspresi (sama dengan
+    char_loop_to_program).
+    
+    Args:
+        expression (str): Ekspresi matematika dalam notasi infix
+    
+    Returns:
+        PostfixProgram: Program postfix
+    
+    Raises:
+        ValueError: Sama dengan tokenize() dan tokens_to_program()
+    
+    Example:
+        str(scan_to_program("3+4*2"))         # "3 4 2 * +"
+        str(scan_to_program("max(1, x, 3)"))  # "1 x 3 max max"
+    """
+    global _token_finditer
+    if _token_finditer is None:
+        from Tokenizer import TOKEN_PATTERN
+        _token_finditer = TOKEN_PATTERN.finditer
+    
+    program = PostfixProgram()
+    operators = []
+    arg_counts = []
+    pop_limit = POP_LIMIT
+    stack_precedence = STACK_PRECEDENCE
+    functions = FUNCTION_ARITY
+    reserved = RESERVED_NAMES
+    expect_operand = True
+    
+    # Nomor group lihat TOKEN_PATTERN: 1 = angka biasa, 2 = angka lain,
+    # 3 = nama fungsi, 4 = nama variabel, 5 = operator, 6 = '(', 7 = ')',
+    # 8 = ',', 9 = karakter lain. Urutan cabang: yang paling sering dulu.
+    for match in _token_finditer(expression):
+        group = match.lastindex
+        if group == 1:
+            text = match.group(1)
+            program.add_number(float(text), text)
+            expect_operand = False
+        elif group == 5:
+            value = match.group(5)
+            if expect_operand:
+                if value == '-':
+                    operators.append('neg')  # Prefix: push tanpa pop
+                    continue
+                if value == '+':
+                    continue  # Plus unary tidak mengubah nilai
+            limit = pop_limit[value]
+            while operators and stack_precedence[operators[-1]] >= limit:
+                program.add_operator(operators.pop())
+            operators.append(value)
+            expect_operand = True
+        elif group == 6:
+            operators.append('(')
+            expect_operand = True
+        elif group == 7:
+            while operators and operators[-1] != '(':
+                program.add_operator(operators.pop())
+            if not operators:
+                raise ValueError(f"Error: Kurung tutup tanpa pasangan (posisi {match.start(7)})!")
+            operators.pop()  # Buang '('
+            if operators and operators[-1] in functions:
+                add_function_call(program, operators.pop(), arg_counts.pop())
+            expect_operand = False
+        elif group == 4:
+            value = match.group(4)
+            if value in reserved:
+                raise ValueError(f"Error: '{value}' adalah nama fungsi, bukan variabel!")
+            program.add_variable(value)
+            expect_operand = False
+        elif group == 3:
+            value = match.group(3)
+            check_function(value)
+            operators.append(value)
+            arg_counts.append(1)
+            expect_operand = True
+        elif group == 8:
+            while operators and operators[-1] != '(':
+                program.add_operator(operators.pop())
+            if len(operators) < 2 or operators[-2] not in functions:
+                raise ValueError(f"Error: Koma di luar pemanggilan fungsi (posisi {match.start(8)})!")
+            arg_counts[-1] += 1
+            expect_operand = True
+        elif group == 2:
+            text = match.group(2)
+            try:
+                value = float(text)
+            except ValueError:
+                raise ValueError(f"Error: Angka '{text}' tidak valid!")
+            program.add_number(value, text)
+            expect_operand = False
+        elif group == 9:
+            raise ValueError(f"Error: Karakter '{match.group(9)}' tidak dikenal "
+                             f"(posisi {match.start(9)})!")
+        else:
+            break  # Hanya whitespace di akhir ekspresi
+    
+    while operators:
+        popped = operators.pop()
+        if popped == '(':
+            raise ValueError("Error: Tanda kurung '(' tidak ditutup!")
+        program.add_operator(popped)
+    
+    return program
 
 
 # ============================================================================
@@ -241,6 +748,9 @@ if __name__ == "__main__":
     """
     Testing Infix to Postfix Converter dengan berbagai kasus.
     """
+    import io
+    
+    from Trace_Sink import TextSink
     
     print("\n" + "="*60)
     print("TESTING INFIX TO POSTFIX CONVERTER")
@@ -256,6 +766,15 @@ if __name__ == "__main__":
         ("( 3 + 4 ) * ( 5 - 6 )", "3 4 + 5 6 - *"),
         ("10 + 20 * 30", "10 20 30 * +"),
         ("( 5 + 6 ) * ( 7 + 8 )", "5 6 + 7 8 + *"),
+        ("x * 2 + rate_2", "x 2 * rate_2 +"),
+        ("(3+4)*2^x", "3 4 + 2 x ^ *"),
+        ("1.5e3 - 2E-4", "1500 0.0002 -"),
+        ("2 ^ 3 ^ 2", "2 3 2 ^ ^"),
+        ("-2 ^ 2", "2 2 ^ neg"),
+        ("-x*3", "x neg 3 *"),
+        ("2 * -(1 - x)", "2 1 x - neg *"),
+        ("sqrt(x)+max(1,2,3)", "x sqrt 1 2 3 max max +"),
+        ("min(a, b) ^ 2", "a b min 2 ^"),
     ]
     
     print("\nMenjalankan test cases...\n")
@@ -264,20 +783,54 @@ if __name__ == "__main__":
     failed = 0
     
     for infix, expected in test_cases:
-        result = infix_to_postfix(infix)
+        # TextSink menampilkan langkah-langkah konversi ke layar
+        result = infix_to_postfix(infix, tracer=TextSink())
+        
+        # Jalur cepat (tokenizer) harus memberi hasil yang sama
+        fast_result = infix_to_postfix(infix)
         
         # Cek apakah hasil sesuai expected
-        if result == expected:
+        if result == expected and fast_result == expected:
             print(f"✅ PASS")
             passed += 1
         else:
             print(f"❌ FAIL")
             print(f"   Expected: {expected}")
-            print(f"   Got:      {result}")
+            print(f"   Got:      {result} (tokenizer: {fast_result})")
             failed += 1
         
         print()
     
+    # Error: harus sama di jalur trace dan jalur tokenizer
+    error_cases = [
+        ("sqrt(1, 2)", "butuh 1 argumen"),
+        ("foo(2)", "tidak dikenal"),
+        ("1, 2", "Koma di luar"),
+        ("max(1, 2", "tidak ditutup"),
+        ("3 + 4 )", "Kurung tutup tanpa pasangan (posisi 6)"),
+        ("(1 + 2)) * 3", "Kurung tutup tanpa pasangan (posisi 7)"),
+        ("max(1, 2))", "Kurung tutup tanpa pasangan (posisi 9)"),
+        (")", "Kurung tutup tanpa pasangan (posisi 0)"),
+        # Dua error: yang pertama di ekspresi dilaporkan
+        ("1 , 2 $", "Koma di luar"),
+        ("3 ) + 1..2", "Kurung tutup tanpa pasangan (posisi 2)"),
+        ("sin + 1", "nama fungsi"),
+    ]
+    for infix, message in error_cases:
+        errors = []
+        for tracer in (None, TextSink(stream=io.StringIO())):
+            try:
+                infix_to_postfix(infix, tracer=tracer)
+                errors.append(None)
+            except ValueError as e:
+                errors.append(str(e))
+        if errors[0] is not None and errors[0] == errors[1] and message in errors[0]:
+            print(f"✅ PASS - Error untuk {infix!r}: {errors[0]}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - Error untuk {infix!r}: {errors}")
+            failed += 1
+    
     print("="*60)
     print(f"SUMMARY: {passed} passed, {failed} failed")
     print("="*60)
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Live Expression - Re-evaluasi Inkremental
+==========================================
+
+File ini berisi LiveExpression: formula yang nilainya SELALU up-to-date
+ketika salah satu variabelnya berubah.
+
+MASALAH:
+Dashboard mengevaluasi ulang formula yang sama setiap kali SATU input
+berubah. Dengan run_program(), setiap update = evaluasi ulang seluruh
+ekspresi (O(panjang ekspresi)), walaupun sebagian besar sub-ekspresi
+tidak terpengaruh.
+
+SOLUSI: MEMOIZED NODES + DIRTY PATH
+1. Ekspresi dibangun menjadi DAG (lihat Expression_Tree.py)
+2. Nilai SETIAP node disimpan (memoized)
+3. Saat set(var, value), hanya node di jalur dari variabel tersebut
+   ke root yang dihitung ulang ("dirty path"). Node lain memakai nilai
+   yang sudah disimpan.
+4. Jika nilai sebuah node ternyata tidak berubah, parent-nya tidak perlu
+   dihitung ulang (early cutoff). "Tidak berubah" berarti bit-nya sama:
+   0.0 → -0.0 dianggap berubah (1 / -0.0 beda dengan 1 / 0.0)
+
+Biaya update = O(kedalaman), bukan O(panjang ekspresi).
+
+Contoh: "( a + b ) * ( c + d )", lalu set("a", 5)
+    Yang dihitung ulang hanya: (a + b) dan (* root)
+    (c + d) tetap memakai nilai lama
+
+Jika update menghasilkan error (misal pembagian dengan nol), state
+tidak berubah: variabel dan semua nilai node tetap seperti sebelumnya.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import heapq
+from math import copysign
+
+from Postfix_Program import PostfixProgram, OP_PUSH, OP_LOAD
+from Postfix_Evaluator import lookup_variable
+from Postfix_VM import DISPATCH
+from Expression_Tree import ExpressionDAG
+
+
+class LiveExpression:
+    """
+    Ekspresi dengan nilai node yang di-memoize dan update inkremental.
+
+    Attributes:
+        dag (ExpressionDAG): DAG ekspresi (node identik digabung)
+        values (list): Nilai terakhir setiap node (index sama dengan dag.nodes)
+        variables (dict): Nilai variabel saat ini
+        recomputed (int): Jumlah node yang dihitung ulang pada update terakhir
+
+    Example:
+        live = LiveExpression("( a + b ) * ( c + d )", {"a": 1, "b": 2, "c": 3, "d": 4})
+        live.value          # 21.0
+        live.set("a", 5)    # 49.0 (hanya a, a + b dan root yang dihitung ulang)
+    """
+
+    def __init__(self, expression, variables=None):
+        """
+        Membangun DAG dan menghitung nilai awal semua node.
+
+        Args:
+            expression (str atau PostfixProgram): Ekspresi infix atau program
+            variables (dict, optional): Nilai awal variabel
+
+        Raises:
+            ValueError: Jika ekspresi invalid atau ada variabel yang tidak didefinisikan
+            ZeroDivisionError: Jika evaluasi awal membagi dengan nol
+        """
+        if isinstance(expression, PostfixProgram):
+            program = expression
+        else:
+            from Infix_to_Postfix import infix_to_program
+            program = infix_to_program(expression)
+
+        self.dag = ExpressionDAG.from_program(program)
+        self.variables = dict(variables) if variables else {}
+        self.recomputed = 0
+
+        nodes = self.dag.nodes
+
+        # parents[i] = node yang memakai node i (tanpa duplikat, misal x * x)
+        self._parents = [[] for _ in nodes]
+        # Node variabel per nama (hash-consing → tepat satu node per nama)
+        self._variable_nodes = {}
+        for index, (opcode, value, left, right) in enumerate(nodes):
+            if opcode == OP_LOAD:
+                self._variable_nodes[value] = index
+            elif left >= 0:
+                self._parents[left].append(index)
+                if right >= 0 and right != left:
+                    self._parents[right].append(index)
+
+        # Evaluasi awal: child selalu sebelum parent di dag.nodes
+        self.values = [0.0] * len(nodes)
+        for index in range(len(nodes)):
+            self.values[index] = self._compute(index, self.values.__getitem__)
+        self.recomputed = len(nodes)
+
+    def _compute(self, index, value_of):
+        """
+        Menghitung nilai satu node dari nilai child-nya.
+
+        Args:
+            index (int): Index node
+            value_of (callable): Fungsi index node → nilai node saat ini
+
+        Returns:
+            float: Nilai node
+        """
+        opcode, value, left, right = self.dag.nodes[index]
+        if opcode == OP_PUSH:
+            return value
+        if opcode == OP_LOAD:
+            return lookup_variable(self.variables, value)
+        if right < 0:
+            # Fungsi unary / minus unary
+            return DISPATCH[opcode](value_of(left))
+        return DISPATCH[opcode](value_of(left), value_of(right))
+
+    @property
+    def value(self):
+        """
+        Nilai ekspresi saat ini (tanpa menghitung ulang).
+        """
+        return self.values[self.dag.root]
+
+    def get(self, name):
+        """
+        Mengambil nilai variabel saat ini.
+
+        Args:
+            name (str): Nama variabel
+
+        Returns:
+            float: Nilai variabel
+
+        Raises:
+            ValueError: Jika variabel tidak didefinisikan
+        """
+        return lookup_variable(self.variables, name)
+
+    def set(self, name, value):
+        """
+        Mengubah satu variabel dan menghitung ulang jalur yang terpengaruh.
+
+        Args:
+            name (str): Nama variabel
+            value (float): Nilai baru
+
+        Returns:
+            float: Nilai ekspresi setelah update
+
+        Raises:
+            ZeroDivisionError / ValueError: Jika nilai baru membuat evaluasi
+                error (state tidak berubah)
+        """
+        return self.update({name: value})
+
+    def update(self, changes):
+        """
+        Mengubah beberapa variabel sekaligus (satu kali propagasi).
+
+        Args:
+            changes (dict): Mapping nama variabel → nilai baru
+
+        Returns:
+            float: Nilai ekspresi setelah update
+
+        Raises:
+            ZeroDivisionError / ValueError: Jika nilai baru membuat evaluasi
+                error (state tidak berubah)
+        """
+        old_variables = self.variables
+        self.variables = dict(old_variables)
+        self.variables.update(changes)
+
+        # Perubahan ditampung dulu, baru di-commit jika tidak ada error
+        changed = {}
+        values = self.values
+
+        def value_of(index):
+            # Nilai yang sudah berubah diambil dari `changed`, sisanya dari cache
+            return changed[index] if index in changed else values[index]
+
+        parents = self._parents
+
+        # Min-heap index node: child selalu punya index lebih kecil dari
+        # parent, jadi setiap node diproses setelah semua child-nya
+        heap = [self._variable_nodes[name] for name in changes if name in self._variable_nodes]
+        heapq.heapify(heap)
+        queued = set(heap)
+        recomputed = 0
+
+        try:
+            while heap:
+                index = heapq.heappop(heap)
+                new_value = self._compute(index, value_of)
+                recomputed += 1
+                old_value = values[index]
+                # 0.0 == -0.0 tapi tanda nol tetap harus diteruskan ke parent
+                if new_value == old_value and (new_value or
+                                               copysign(1.0, new_value) == copysign(1.0, old_value)):
+                    continue  # Early cutoff: parent tidak terpengaruh
+                changed[index] = new_value
+                for parent in parents[index]:
+                    if parent not in queued:
+                        queued.add(parent)
+                        heapq.heappush(heap, parent)
+        except (ValueError, ArithmeticError):
+            self.variables = old_variables
+            raise
+
+        for index, new_value in changed.items():
+            values[index] = new_value
+        self.recomputed = recomputed
+        return self.value
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing LiveExpression: hasil harus sama dengan evaluasi penuh,
+    dan jumlah node yang dihitung ulang sebanding dengan kedalaman.
+    """
+    import random
+
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+
+    print("\n" + "="*60)
+    print("TESTING LIVE EXPRESSION")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Nilai awal dan update sederhana
+    live = LiveExpression("( a + b ) * ( c + d )", {"a": 1, "b": 2, "c": 3, "d": 4})
+    check("Nilai awal 21.0", live.value == 21.0)
+    check("set a=5 → 49.0", live.set("a", 5) == 49.0)
+    check("Hanya jalur a → root dihitung ulang (3 node)", live.recomputed == 3)
+
+    # Test 2: Hasil selalu sama dengan run_program setelah update acak
+    infix = "a * b + ( c - a ) / ( d + 10 ) - b ^ 2 + a * b"
+    program = infix_to_program(infix)
+    variables = {"a": 1.0, "b": 2.0, "c": 3.0, "d": 4.0}
+    live = LiveExpression(infix, variables)
+    rng = random.Random(2026)
+    same = True
+    for _ in range(200):
+        name = rng.choice("abcd")
+        variables[name] = rng.uniform(-5, 5)
+        if live.set(name, variables[name]) != run_program(program, variables):
+            same = False
+    check("200 update acak sama dengan run_program", same)
+
+    # Test 3: Update O(depth) pada ekspresi panjang
+    terms = " + ".join(f"k{i} * {i}" for i in range(500))
+    live = LiveExpression(terms, {f"k{i}": 1 for i in range(500)})
+    live.set("k499", 2)
+    check(f"Ekspresi 1500 node: update hanya {live.recomputed} node", live.recomputed <= 4)
+
+    # Test 4: Early cutoff (nilai tidak berubah → parent tidak dihitung)
+    live = LiveExpression("( a * 0 ) + b", {"a": 1, "b": 2})
+    live.set("a", 7)
+    check("Early cutoff a * 0", live.recomputed == 2 and live.value == 2.0)
+
+    # Test 4b: 0.0 → -0.0 bukan "tidak berubah" (tanda nol ikut ke hasil)
+    live = LiveExpression("x * 2 + y", {"x": 0.0, "y": -0.0})
+    result = live.set("x", -0.0)
+    check("set x=-0.0 → -0.0", result == 0.0 and copysign(1.0, result) == -1.0)
+    live = LiveExpression("( a * 0 ) * -1", {"a": 1})
+    result = live.set("a", -1)
+    check("a * 0 berubah tanda → parent dihitung ulang",
+          copysign(1.0, result) == 1.0 and live.recomputed == 3)
+    live = LiveExpression("( a * b ) + c", {"a": 2, "b": 0.0, "c": 1})
+    live.set("a", 3)
+    check("Early cutoff tetap untuk 0.0 → 0.0", live.recomputed == 2)
+
+    # Test 5: Error → state tidak berubah
+    live = LiveExpression("10 / ( a - b )", {"a": 3, "b": 1})
+    try:
+        live.set("a", 1)
+        check("Pembagian nol menghasilkan error", False)
+    except ZeroDivisionError:
+        check("Pembagian nol menghasilkan error",
+              live.value == 5.0 and live.get("a") == 3.0)
+
+    # Test 6: Fungsi dan minus unary
+    live = LiveExpression("sqrt(a) + max(b, -a)", {"a": 4, "b": 1})
+    check("sqrt(a) + max(b, -a) = 3.0", live.value == 3.0)
+    check("set b=5 → 7.0", live.set("b", 5) == 7.0)
+    try:
+        live.set("a", -1)
+        check("sqrt negatif menghasilkan error", False)
+    except ValueError:
+        check("sqrt negatif menghasilkan error", live.value == 7.0)
+
+    # Test 7: Variabel tidak didefinisikan saat dibuat
+    try:
+        LiveExpression("x + 1")
+        check("Variabel tidak didefinisikan", False)
+    except ValueError:
+        check("Variabel tidak didefinisikan", True)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
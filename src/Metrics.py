@@ -0,0 +1,415 @@
+"""
+Metrics - Registry + Endpoint Format Prometheus
+================================================
+
+File ini berisi metrics untuk Calculator yang berjalan lama (service).
+
+YANG DIUKUR:
+- calculator_evaluations_total            : jumlah evaluasi (throughput
+                                            = rate() dari counter ini)
+- calculator_errors_total{kind, type}     : error per jenis, misal
+                                            division_by_zero, operand_count,
+                                            unknown_operator
+- calculator_evaluation_duration_seconds  : histogram latency
+- gauge/counter dari komponen lain (history, ExpressionCache, ResultCache),
+  dibaca SAAT SCRAPE lewat callback
+
+JALUR PERHITUNGAN TIDAK PERNAH MEMFORMAT:
+observe() hanya menambah beberapa integer (di bawah satu lock): cari
+bucket dengan bisect, tambah count/sum. Semua string Prometheus dibuat
+di render(), yaitu saat endpoint di-scrape.
+
+ENDPOINT HTTP (opsional, stdlib saja):
+    server = MetricsServer(calc.metrics, port=9100)
+    server.start()              # thread daemon, GET /metrics
+    curl localhost:9100/metrics
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import bisect
+import threading
+
+
+# Batas bucket histogram latency (detik), mirip default client Prometheus
+# tapi mulai dari mikrodetik (satu evaluasi biasanya 1-100 µs)
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4,
+                   5e-4, 1e-3, 2.5e-3, 1e-2, 1e-1, 1.0)
+
+# Jenis error: (kind, potongan pesan). Dicocokkan berurutan, hanya di jalur
+# error. ZeroDivisionError selalu 'division_by_zero'.
+ERROR_KINDS = (
+    ('operand_count', ("Tidak cukup operand", "Stack masih berisi",
+                       "kosong atau invalid", "Tidak ada nilai")),
+    ('unknown_operator', ("tidak dikenal",)),
+    ('undefined_variable', ("tidak didefinisikan", "bukan variabel", "belum diisi")),
+    ('empty_expression', ("Expression kosong!",)),
+    ('syntax', ("kurung", "Koma", "tidak valid", "argumen")),
+    ('domain', ("negatif", "positif", "bukan bilangan real", "eksak")),
+)
+
+# Content-Type format teks Prometheus
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def classify_error(error):
+    """
+    Menentukan jenis error untuk label metrics.
+
+    Args:
+        error (Exception): Error dari evaluasi
+
+    Returns:
+        str: Contoh 'division_by_zero', 'operand_count', 'unknown_operator',
+             atau 'other'
+
+    Example:
+        classify_error(ZeroDivisionError("..."))   # 'division_by_zero'
+    """
+    if isinstance(error, ZeroDivisionError):
+        return 'division_by_zero'
+    message = str(error)
+    for kind, fragments in ERROR_KINDS:
+        if any(fragment in message for fragment in fragments):
+            return kind
+    return 'other'
+
+
+def format_value(value):
+    """
+    Render angka sesuai format teks Prometheus.
+    """
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return 'NaN'
+    if value in (float('inf'), float('-inf')):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Registry metrics Calculator (counter, histogram latency, gauge callback).
+
+    Attributes:
+        namespace (str): Prefix nama metric
+        buckets (tuple): Batas bucket histogram (detik)
+        evaluations (int): Jumlah evaluasi (berhasil + error)
+
+    Example:
+        metrics = MetricsRegistry()
+        metrics.observe(1500)                          # 1.5 µs, berhasil
+        metrics.observe(900, ZeroDivisionError("x"))   # error
+        print(metrics.render())
+    """
+
+    def __init__(self, namespace='calculator', buckets=LATENCY_BUCKETS):
+        """
+        Args:
+            namespace (str): Prefix nama metric
+            buckets (tuple): Batas bucket histogram latency (detik, naik)
+        """
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        # Batas dalam nanodetik: observe() tidak perlu konversi float
+        self._bounds_ns = [int(bound * 1e9) for bound in self.buckets]
+        self._lock = threading.Lock()
+        self._gauges = []
+        self.reset()
+
+    def reset(self):
+        """
+        Mengosongkan semua counter dan histogram (gauge tetap terdaftar).
+        """
+        with self._lock:
+            self.evaluations = 0
+            self._errors = {}
+            self._bucket_counts = [0] * (len(self.buckets) + 1)
+            self._sum_ns = 0
+
+    def observe(self, elapsed_ns, error=None):
+        """
+        Merekam satu evaluasi (dipanggil di jalur perhitungan).
+
+        Args:
+            elapsed_ns (int): Durasi dalam nanodetik (perf_counter_ns)
+            error (Exception, optional): Error jika evaluasi gagal
+        """
+        index = bisect.bisect_left(self._bounds_ns, elapsed_ns)
+        key = None
+        if error is not None:
+            # Jalur error saja: klasifikasi pesan
+            key = (classify_error(error), type(error).__name__)
+        with self._lock:
+            self.evaluations += 1
+            self._bucket_counts[index] += 1
+            self._sum_ns += elapsed_ns
+            if key is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def add_gauge(self, name, help_text, callback, kind='gauge'):
+        """
+        Mendaftarkan metric yang nilainya dibaca saat render (scrape).
+
+        Args:
+            name (str): Nama tanpa namespace, misal 'history_entries'
+            help_text (str): Deskripsi untuk baris # HELP
+            callback (callable): Fungsi tanpa argumen → angka
+            kind (str): 'gauge' atau 'counter' (untuk counter milik
+                        komponen lain, misal hits cache)
+        """
+        self._gauges.append((name, help_text, callback, kind))
+
+    def errors(self):
+        """
+        Snapshot jumlah error.
+
+        Returns:
+            dict: {(kind, type): jumlah}
+        """
+        with self._lock:
+            return dict(self._errors)
+
+    def render(self):
+        """
+        Render semua metric dalam format teks Prometheus (exposition 0.0.4).
+
+        Returns:
+            str: Teks siap dikirim ke Prometheus
+        """
+        with self._lock:
+            evaluations = self.evaluations
+            errors = dict(self._errors)
+            bucket_counts = list(self._bucket_counts)
+            sum_ns = self._sum_ns
+
+        prefix = self.namespace
+        lines = [
+            f"# HELP {prefix}_evaluations_total Evaluations, successful or not.",
+            f"# TYPE {prefix}_evaluations_total counter",
+            f"{prefix}_evaluations_total {evaluations}",
+            f"# HELP {prefix}_errors_total Failed evaluations by error kind and exception type.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        for (kind, type_name), count in sorted(errors.items()):
+            lines.append(f'{prefix}_errors_total{{kind="{kind}",type="{type_name}"}} {count}')
+
+        name = f"{prefix}_evaluation_duration_seconds"
+        lines.append(f"# HELP {name} Evaluation latency.")
+        lines.append(f"# TYPE {name} histogram")
+        cumulative = 0
+        for bound, count in zip(self.buckets, bucket_counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{format_value(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {evaluations}')
+        lines.append(f"{name}_sum {format_value(sum_ns / 1e9)}")
+        lines.append(f"{name}_count {evaluations}")
+
+        for gauge_name, help_text, callback, kind in self._gauges:
+            lines.append(f"# HELP {prefix}_{gauge_name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{gauge_name} {kind}")
+            lines.append(f"{prefix}_{gauge_name} {format_value(callback())}")
+        return "\n".join(lines) + "\n"
+
+
+def register_calculator(metrics, calc):
+    """
+    Mendaftarkan ukuran history dan cache sebuah Calculator sebagai gauge.
+
+    Args:
+        metrics (MetricsRegistry): Registry tujuan
+        calc (Calculator): Calculator yang diukur
+    """
+    history = calc.history
+    cache = calc.cache
+    metrics.add_gauge('history_entries', "History entries held in memory.",
+                      lambda: len(history))
+    metrics.add_gauge('history_appends_total', "Calculations appended to history.",
+                      lambda: history.total, 'counter')
+    metrics.add_gauge('cache_entries', "Compiled programs in the expression cache.",
+                      lambda: len(cache))
+    metrics.add_gauge('cache_bytes', "Estimated bytes held by the expression cache.",
+                      lambda: cache.total_bytes)
+    metrics.add_gauge('cache_hits_total', "Expression cache hits.",
+                      lambda: cache.hits, 'counter')
+    metrics.add_gauge('cache_misses_total', "Expression cache misses.",
+                      lambda: cache.misses, 'counter')
+    result_cache = calc.result_cache
+    if result_cache is not None:
+        metrics.add_gauge('result_cache_entries', "Cached results of constant expressions.",
+                          lambda: len(result_cache))
+        metrics.add_gauge('result_cache_hits_total', "Result cache hits.",
+                          lambda: result_cache.hits, 'counter')
+
+
+class MetricsServer:
+    """
+    Endpoint HTTP kecil (stdlib) untuk scrape: GET /metrics.
+
+    Attributes:
+        metrics (MetricsRegistry): Registry yang di-render
+        address (tuple): (host, port) setelah start() (port 0 = dipilih OS)
+
+    Example:
+        server = MetricsServer(calc.metrics, port=9100).start()
+        ...
+        server.stop()
+    """
+
+    def __init__(self, metrics, host='127.0.0.1', port=9100):
+        """
+        Args:
+            metrics (MetricsRegistry): Registry yang di-render
+            host (str): Alamat bind (default hanya lokal)
+            port (int): Port (0 = pilih port bebas)
+        """
+        self.metrics = metrics
+        self.address = (host, port)
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """
+        Mulai melayani di thread daemon.
+
+        Returns:
+            MetricsServer: self (supaya bisa dirangkai)
+        """
+        # Di-import di sini: http.server mahal (~50 ms) dan tidak dibutuhkan
+        # Calculator yang tidak membuka endpoint
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrape setiap beberapa detik tidak perlu di-log
+                pass
+
+        self._server = ThreadingHTTPServer(self.address, Handler)
+        self._server.daemon_threads = True
+        self.address = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='metrics-http', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Menghentikan server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing metrics (klasifikasi error, histogram, format teks, endpoint).
+    """
+    import io
+    import urllib.request
+
+    from Calculator import Calculator
+
+    print("\n" + "="*60)
+    print("TESTING METRICS")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Klasifikasi error dari pesan asli
+    calc = Calculator(metrics=True, output=io.StringIO())
+    kinds = {}
+    for expression in ["1 / 0", "3 +", "3 $ 4", "x + 1", "foo(2)", "sqrt(0 - 4)"]:
+        try:
+            calc.evaluate(expression)
+        except (ValueError, ZeroDivisionError) as e:
+            kinds[expression] = classify_error(e)
+    check("Jenis error", kinds == {
+        "1 / 0": 'division_by_zero', "3 +": 'operand_count', "3 $ 4": 'unknown_operator',
+        "x + 1": 'undefined_variable', "foo(2)": 'unknown_operator', "sqrt(0 - 4)": 'domain'})
+
+    # Test 2: Counter dan histogram dari evaluate() + calculate()
+    for i in range(20):
+        calc.evaluate(f"{i} * 2")
+    calc.calculate("3 + 4")
+    errors = calc.metrics.errors()
+    check("Evaluasi dihitung (6 error + 21 berhasil)", calc.metrics.evaluations == 27)
+    check("Error per jenis", errors[('division_by_zero', 'ZeroDivisionError')] == 1 and
+          errors[('operand_count', 'ValueError')] == 1)
+
+    # Test 3: Format teks Prometheus
+    text = calc.metrics.render()
+    lines = text.splitlines()
+    check("Counter evaluasi", "calculator_evaluations_total 27" in lines)
+    check("Label error",
+          'calculator_errors_total{kind="division_by_zero",type="ZeroDivisionError"} 1' in lines)
+    buckets = [int(line.rsplit(' ', 1)[1]) for line in lines
+               if line.startswith("calculator_evaluation_duration_seconds_bucket")]
+    check("Bucket histogram kumulatif, +Inf = count",
+          buckets == sorted(buckets) and buckets[-1] == 27 and
+          "calculator_evaluation_duration_seconds_count 27" in lines)
+    check("Gauge history/cache", "calculator_history_entries 1" in lines and
+          any(line.startswith("calculator_cache_entries ") for line in lines))
+    typed = {line.split()[2] for line in lines if line.startswith("# TYPE")}
+
+    def family(sample):
+        name = sample.split('{')[0].split(' ')[0]
+        for suffix in ('_bucket', '_sum', '_count'):
+            if name.endswith(suffix) and name[:-len(suffix)] in typed:
+                return name[:-len(suffix)]
+        return name
+    check("Setiap sample punya # TYPE",
+          all(family(line) in typed for line in lines if not line.startswith('#')))
+
+    # Test 4: Tanpa metrics = tidak ada registry
+    check("Default tanpa metrics", Calculator().metrics is None)
+
+    # Test 5: Endpoint HTTP
+    server = MetricsServer(calc.metrics, port=0).start()
+    url = f"http://{server.address[0]}:{server.address[1]}/metrics"
+    with urllib.request.urlopen(url) as response:
+        body = response.read().decode('utf-8')
+        content_type = response.headers['Content-Type']
+    check("GET /metrics", "calculator_evaluations_total 27" in body and
+          content_type.startswith('text/plain; version=0.0.4'))
+    try:
+        urllib.request.urlopen(url.replace('/metrics', '/other'))
+        not_found = False
+    except urllib.error.HTTPError as e:
+        not_found = e.code == 404
+    check("Path lain → 404", not_found)
+    server.stop()
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,508 @@
+"""
+Numeric Backend - Float, Decimal dan Fraction
+==============================================
+
+File ini berisi BACKEND ANGKA yang bisa dipilih per Calculator.
+
+KENAPA PERLU BACKEND?
+Semua engine menghitung dengan float (IEEE 754 double). Untuk billing,
+hasil seperti 0.1 + 0.2 = 0.30000000000000004 tidak bisa diterima.
+Backend menentukan TIPE ANGKA dan IMPLEMENTASI setiap opcode:
+
+- 'float'    : float biasa. Evaluasi langsung memakai run_program()
+               (Postfix_VM.py), jadi jalur cepat tidak berubah sama sekali
+- 'decimal'  : decimal.Decimal dengan Context yang bisa diatur
+               (presisi, rounding). Cocok untuk uang.
+- 'fraction' : fractions.Fraction, hasil EKSAK (1 / 3 tetap 1/3)
+
+CARA KERJA:
+Setiap backend punya dispatch table sendiri (opcode → fungsi), sama
+seperti DISPATCH di Postfix_VM.py. Program postfix yang sama (hasil
+infix_to_program, bisa dari cache) dijalankan oleh loop stack machine
+dengan dispatch table backend tersebut.
+
+Konstanta di PostfixProgram disimpan sebagai float, tapi float sudah
+dibulatkan. Backend membangun angka dari TEKS literal di sumber
+(program.literals, lihat Postfix_Program.py), jadi "0.1" menjadi
+Decimal('0.1') / Fraction(1, 10), "10000000000000000000001" tetap eksak,
+dan "3 + 4 * 2" menghasilkan Decimal('11') (bukan '11.00' dari teks "3.0").
+Konstanta tanpa teks memakai format_number().
+
+FUNGSI YANG TIDAK EKSAK:
+- Decimal tidak punya sin/cos/tan → ValueError (bukan diam-diam float)
+- Fraction hanya mendukung neg, abs, min, max, dan pangkat bilangan
+  bulat. sqrt, log, 2 ^ 0.5, dll → ValueError
+
+Contoh:
+    backend = DecimalBackend(precision=50)
+    backend.run(infix_to_program("0.1 + 0.2"))    # Decimal('0.3')
+    FractionBackend().run(infix_to_program("1 / 3 + 1 / 6"))   # Fraction(1, 2)
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import decimal
+import functools
+from fractions import Fraction
+
+from Postfix_Program import (OP_PUSH, OP_LOAD, OP_ADD, OP_SUB, OP_MUL, OP_DIV,
+                             OP_POW, OP_STORE, OP_FETCH, OP_MIN, FUNCTION_OPCODES)
+from Postfix_VM import DISPATCH, run_program
+
+
+class NumericBackend:
+    """
+    Base class backend angka.
+
+    Subclass cukup mengisi `name`, convert() dan _operations().
+
+    Attributes:
+        name (str): Nama backend ('float', 'decimal', 'fraction')
+        dispatch (list): Dispatch table opcode → fungsi (None = tidak didukung)
+    """
+
+    name = None
+
+    def __init__(self):
+        """
+        Membangun dispatch table dari _operations().
+        """
+        self._prepare()
+
+    def _prepare(self):
+        """
+        Membangun dispatch table dan cache konversi konstanta.
+        """
+        self.dispatch = [None] * (max(FUNCTION_OPCODES.values()) + 1)
+        for opcode, function in self._operations().items():
+            self.dispatch[opcode] = function
+        # Konstanta yang sama (0, 1, 100, ...) muncul di banyak program.
+        # Decimal()/Fraction() dari teks jauh lebih mahal dari lookup cache
+        self._constant = functools.lru_cache(maxsize=4096)(self.convert)
+
+    def __getstate__(self):
+        # Dispatch table dan cache berisi closure (tidak bisa di-pickle),
+        # jadi dibangun ulang setelah dikirim ke worker process
+        state = self.__dict__.copy()
+        del state['dispatch'], state['_constant']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._prepare()
+
+    def _operations(self):
+        """
+        Implementasi operator dan fungsi untuk backend ini.
+
+        Returns:
+            dict: opcode → callable
+        """
+        raise NotImplementedError
+
+    def convert(self, value):
+        """
+        Mengubah angka (konstanta program atau nilai variabel) ke tipe backend.
+
+        Args:
+            value: float, int, str, atau angka bertipe backend
+
+        Returns:
+            Angka bertipe backend
+
+        Raises:
+            ValueError: Jika value bukan angka yang valid
+        """
+        raise NotImplementedError
+
+    def run(self, program, variables=None):
+        """
+        Mengevaluasi PostfixProgram dengan tipe angka backend ini.
+
+        Args:
+            program (PostfixProgram): Program hasil infix_to_program()
+            variables (dict, optional): Nilai variabel, misal {"harga": "19.99"}
+
+        Returns:
+            Hasil evaluasi (bertipe backend)
+
+        Raises:
+            ValueError: Jika program invalid, variabel tidak didefinisikan,
+                        atau fungsi tidak didukung backend
+            ZeroDivisionError: Jika terjadi pembagian dengan nol
+        """
+        # Operand kurang saat compile: tidak perlu dijalankan
+        if program.error is not None:
+            raise ValueError(program.error)
+
+        convert = self.convert
+        constant_of = self._constant
+        literal = program.literal
+        # Variabel di-resolve saat OP_LOAD pertamanya, supaya urutan error
+        # sama dengan evaluate_postfix (misal "1/0 + y" → ZeroDivisionError)
+        slots = [None] * len(program.names)
+
+        stack = [None] * program.max_depth
+        temps = [None] * program.temps
+        top = -1
+        dispatch = self.dispatch
+
+        for index, (opcode, constant) in enumerate(zip(program.opcodes, program.constants)):
+            if opcode == OP_PUSH:
+                top += 1
+                # Dari teks literal, bukan dari float yang sudah dibulatkan
+                stack[top] = constant_of(literal(index))
+            elif opcode == OP_LOAD:
+                slot = int(constant)
+                value = slots[slot]
+                if value is None:
+                    name = program.names[slot]
+                    if variables is None or name not in variables:
+                        raise ValueError(f"Error: Variabel '{name}' tidak didefinisikan!")
+                    value = slots[slot] = convert(variables[name])
+                top += 1
+                stack[top] = value
+            elif opcode == OP_STORE:
+                temps[int(constant)] = stack[top]
+            elif opcode == OP_FETCH:
+                top += 1
+                stack[top] = temps[int(constant)]
+            else:
+                function = dispatch[opcode]
+                if function is None:
+                    raise ValueError(f"Error: Fungsi '{FUNCTION_NAMES[opcode]}' "
+                                     f"tidak didukung backend '{self.name}'!")
+                if opcode < OP_LOAD or opcode >= OP_MIN:
+                    right = stack[top]
+                    top -= 1
+                    stack[top] = function(stack[top], right)
+                else:
+                    stack[top] = function(stack[top])
+
+        if top < 0:
+            raise ValueError("Error: Expression kosong atau invalid!")
+        if top > 0:
+            raise ValueError(f"Error: Expression invalid! Stack masih berisi {top + 1} angka.")
+
+        return stack[0]
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+# Opcode fungsi → nama (untuk pesan error)
+FUNCTION_NAMES = {opcode: name for name, opcode in FUNCTION_OPCODES.items()}
+
+
+def _check_divisor(operand2):
+    """
+    Pesan error pembagian nol yang sama dengan engine float.
+
+    Raises:
+        ZeroDivisionError: Jika operand2 == 0
+    """
+    if operand2 == 0:
+        raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
+
+
+class FloatBackend(NumericBackend):
+    """
+    Backend float: evaluasi diserahkan ke run_program() (jalur cepat).
+    """
+
+    name = 'float'
+
+    def _operations(self):
+        return {opcode: function for opcode, function in enumerate(DISPATCH)
+                if function is not None}
+
+    def convert(self, value):
+        return float(value)
+
+    def run(self, program, variables=None):
+        return run_program(program, variables=variables)
+
+
+class DecimalBackend(NumericBackend):
+    """
+    Backend decimal.Decimal dengan Context yang bisa diatur.
+
+    Setiap operasi memakai method Context (context.add, context.divide, ...),
+    jadi presisi dan rounding TIDAK bergantung pada context global thread.
+
+    Attributes:
+        context (decimal.Context): Context untuk semua operasi
+
+    Example:
+        backend = DecimalBackend(precision=10, rounding=decimal.ROUND_HALF_UP)
+        backend.run(infix_to_program("2 / 3"))   # Decimal('0.6666666667')
+    """
+
+    name = 'decimal'
+
+    def __init__(self, context=None, precision=None, rounding=None):
+        """
+        Args:
+            context (decimal.Context, optional): Context dasar
+                                     (default: salinan decimal.DefaultContext)
+            precision (int, optional): Jumlah digit signifikan (override context)
+            rounding (str, optional): Mode rounding, misal decimal.ROUND_HALF_UP
+        """
+        context = (context or decimal.DefaultContext).copy()
+        if precision is not None:
+            context.prec = precision
+        if rounding is not None:
+            context.rounding = rounding
+        self.context = context
+        super().__init__()
+
+    def _operations(self):
+        context = self.context
+
+        def divide(operand1, operand2):
+            _check_divisor(operand2)
+            return context.divide(operand1, operand2)
+
+        def power(operand1, operand2):
+            if operand1 == 0 and operand2 < 0:
+                raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
+            try:
+                return context.power(operand1, operand2)
+            except decimal.InvalidOperation:
+                # Misal (-8) ^ 0.5: hasil bukan bilangan real
+                raise ValueError("Error: Hasil pangkat bukan bilangan real!")
+
+        def square_root(operand):
+            if operand < 0:
+                raise ValueError("Error: Akar kuadrat dari bilangan negatif!")
+            return context.sqrt(operand)
+
+        def natural_log(operand):
+            if operand <= 0:
+                raise ValueError("Error: Logaritma hanya untuk bilangan positif!")
+            return context.ln(operand)
+
+        return {
+            OP_ADD: context.add,
+            OP_SUB: context.subtract,
+            OP_MUL: context.multiply,
+            OP_DIV: divide,
+            OP_POW: power,
+            FUNCTION_OPCODES['neg']: context.minus,
+            FUNCTION_OPCODES['abs']: context.abs,
+            FUNCTION_OPCODES['sqrt']: square_root,
+            FUNCTION_OPCODES['log']: natural_log,
+            FUNCTION_OPCODES['exp']: context.exp,
+            FUNCTION_OPCODES['min']: context.min,
+            FUNCTION_OPCODES['max']: context.max,
+        }
+
+    def convert(self, value):
+        if isinstance(value, decimal.Decimal):
+            return value
+        if isinstance(value, float):
+            # repr() = representasi terpendek: 0.1 → '0.1'
+            value = repr(value)
+        elif isinstance(value, Fraction):
+            return self.context.divide(decimal.Decimal(value.numerator),
+                                       decimal.Decimal(value.denominator))
+        try:
+            return decimal.Decimal(value)
+        except (decimal.InvalidOperation, TypeError, ValueError):
+            raise ValueError(f"Error: Angka '{value}' tidak valid!")
+
+    def __repr__(self):
+        return f"DecimalBackend(precision={self.context.prec}, rounding={self.context.rounding!r})"
+
+
+class FractionBackend(NumericBackend):
+    """
+    Backend fractions.Fraction: hasil eksak untuk + - * / dan pangkat bulat.
+
+    Example:
+        FractionBackend().run(infix_to_program("1 / 3 * 3"))   # Fraction(1, 1)
+    """
+
+    name = 'fraction'
+
+    def _operations(self):
+        def divide(operand1, operand2):
+            _check_divisor(operand2)
+            return operand1 / operand2
+
+        def power(operand1, operand2):
+            if operand2.denominator != 1:
+                # Fraction ** pecahan menghasilkan float (tidak eksak lagi)
+                raise ValueError("Error: Pangkat pecahan tidak eksak di backend 'fraction'!")
+            if operand1 == 0 and operand2 < 0:
+                raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
+            return operand1 ** operand2.numerator
+
+        return {
+            OP_ADD: Fraction.__add__,
+            OP_SUB: Fraction.__sub__,
+            OP_MUL: Fraction.__mul__,
+            OP_DIV: divide,
+            OP_POW: power,
+            FUNCTION_OPCODES['neg']: Fraction.__neg__,
+            FUNCTION_OPCODES['abs']: Fraction.__abs__,
+            FUNCTION_OPCODES['min']: min,
+            FUNCTION_OPCODES['max']: max,
+        }
+
+    def convert(self, value):
+        if isinstance(value, Fraction):
+            return value
+        if isinstance(value, float):
+            value = repr(value)
+        try:
+            return Fraction(value)
+        except (TypeError, ValueError, ZeroDivisionError):
+            raise ValueError(f"Error: Angka '{value}' tidak valid!")
+
+
+# Backend yang bisa dipilih lewat nama
+BACKENDS = {
+    'float': FloatBackend,
+    'decimal': DecimalBackend,
+    'fraction': FractionBackend,
+}
+
+
+def get_backend(backend):
+    """
+    Mengambil backend dari nama atau instance.
+
+    Args:
+        backend (str atau NumericBackend): 'float', 'decimal', 'fraction',
+                                           atau instance backend (misal
+                                           DecimalBackend(precision=50))
+
+    Returns:
+        NumericBackend: Instance backend
+
+    Raises:
+        ValueError: Jika nama backend tidak dikenal
+    """
+    if isinstance(backend, NumericBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Error: Backend '{backend}' tidak dikenal! Pilih: {', '.join(BACKENDS)}")
+    return BACKENDS[backend]()
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing backend: hasil eksak, pesan error sama dengan engine float.
+    """
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_Program import PostfixProgram
+
+    print("\n" + "="*60)
+    print("TESTING NUMERIC BACKEND")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    def outcome(backend, infix, variables=None):
+        try:
+            return get_backend(backend).run(infix_to_program(infix), variables)
+        except (ValueError, ArithmeticError) as e:
+            return (type(e).__name__, str(e))
+
+    D = decimal.Decimal
+
+    # Hasil eksak
+    check("decimal: 0.1 + 0.2 = 0.3", outcome('decimal', "0.1 + 0.2") == D('0.3'))
+    check("fraction: 1/3 + 1/6 = 1/2", outcome('fraction', "1 / 3 + 1 / 6") == Fraction(1, 2))
+    check("fraction: -2 ^ 3 = -8", outcome('fraction', "-2 ^ 3") == Fraction(-8))
+    check("float tetap float", outcome('float', "0.1 + 0.2") == 0.1 + 0.2)
+
+    # Konstanta dari teks literal, bukan dari float yang sudah dibulatkan
+    big = "10000000000000000000001 - 10000000000000000000000"
+    check("decimal: bilangan bulat panjang", str(outcome('decimal', big)) == '1')
+    check("fraction: bilangan bulat panjang", outcome('fraction', big) == Fraction(1))
+    check("decimal: 12345678901234567890123 + 1",
+          str(outcome('decimal', "12345678901234567890123 + 1")) == '12345678901234567890124')
+    check("decimal: 3 + 4 * 2 = 11 (bukan 11.00)", str(outcome('decimal', "3 + 4 * 2")) == '11')
+    check("decimal: 1.50 * 2 = 3.00", str(outcome('decimal', "1.50 * 2")) == '3.00')
+    check("decimal: 1e400 tetap terbatas", str(outcome('decimal', "1e400 / 1e399")) == '1E+1')
+    program = PostfixProgram.from_tokens("10000000000000000000001 1 -".split())
+    check("fraction: program dari token postfix",
+          FractionBackend().run(program) == 10 ** 22)
+    from Calculator import Calculator
+    calc = Calculator(backend='decimal', result_cache_size=8)
+    check("decimal: result cache membedakan teks literal",
+          [str(calc.evaluate(e)) for e in ("10000000000000000000000 + 1",
+                                           "10000000000000000000001 + 1", "3 + 4", "3.0 + 4")]
+          == ['10000000000000000000001', '10000000000000000000002', '7', '7.0'])
+    from Infix_to_Postfix import char_loop_to_program
+    check("decimal: jalur loop per karakter",
+          str(DecimalBackend().run(char_loop_to_program(big))) == '1')
+
+    # Variabel: string, float dan Decimal
+    check("decimal: harga * qty (string)",
+          outcome('decimal', "harga * qty", {"harga": "19.99", "qty": 3}) == D('59.97'))
+    check("fraction: x * 3 (float 0.1)",
+          outcome('fraction', "x * 3", {"x": 0.1}) == Fraction(3, 10))
+
+    # Context: presisi dan rounding
+    backend = DecimalBackend(precision=5, rounding=decimal.ROUND_HALF_UP)
+    check("decimal precision=5: 2 / 3", backend.run(infix_to_program("2 / 3")) == D('0.66667'))
+    check("decimal: sqrt(2) presisi 50",
+          len(str(DecimalBackend(precision=50).run(infix_to_program("sqrt(2)")))) == 51)
+
+    # Temp slot (hasil CSE) juga didukung
+    from Expression_Tree import eliminate_common_subexpressions
+    program, _ = eliminate_common_subexpressions(infix_to_program("(a + 0.1) * (a + 0.1)"))
+    check("fraction: program dengan temp slot",
+          FractionBackend().run(program, {"a": "0.2"}) == Fraction(9, 100))
+    program, _ = eliminate_common_subexpressions(infix_to_program(
+        "(a + 10000000000000000000001) * (a + 10000000000000000000001) - "
+        "(a + 10000000000000000000000) * (a + 10000000000000000000000)"))
+    check("fraction: CSE tidak menggabungkan literal yang float-nya sama",
+          FractionBackend().run(program, {"a": 0}) == 2 * 10 ** 22 + 1)
+
+    # Error: pesan sama dengan engine float
+    for backend in ('decimal', 'fraction'):
+        check(f"{backend}: pembagian nol sama dengan float",
+              outcome(backend, "1 / (2 - 2)") == outcome('float', "1 / (2 - 2)"))
+        check(f"{backend}: variabel tidak didefinisikan sama dengan float",
+              outcome(backend, "x + 1") == outcome('float', "x + 1"))
+        check(f"{backend}: urutan error sama dengan float (1/0 + y)",
+              outcome(backend, "1 / 0 + y") == outcome('float', "1 / 0 + y") and
+              outcome(backend, "y + 1 / 0") == outcome('float', "y + 1 / 0"))
+    check("decimal: sin tidak didukung",
+          outcome('decimal', "sin(1)") == ('ValueError', "Error: Fungsi 'sin' tidak didukung backend 'decimal'!"))
+    check("fraction: 2 ^ 0.5 tidak eksak", outcome('fraction', "2 ^ 0.5")[0] == 'ValueError')
+    check("decimal: (-8) ^ 0.5", outcome('decimal', "(0 - 8) ^ 0.5") == outcome('float', "(0 - 8) ^ 0.5"))
+
+    import pickle
+    restored = pickle.loads(pickle.dumps(DecimalBackend(precision=5)))
+    check("Backend bisa di-pickle (untuk worker process)",
+          restored.run(infix_to_program("1 / 7")) == D('0.14286'))
+
+    try:
+        get_backend('complex')
+        check("Backend tidak dikenal", False)
+    except ValueError:
+        check("Backend tidak dikenal", True)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,297 @@
+"""
+Postfix Optimizer - Constant Folding & Algebraic Simplification
+================================================================
+
+File ini berisi optimizer yang dijalankan di antara konversi
+(infix_to_program) dan evaluasi (run_program / evaluate_postfix).
+
+KENAPA PERLU OPTIMIZER?
+Banyak formula berisi sub-ekspresi konstan, misal ( 60 * 60 * 24 ).
+Tanpa optimizer, sub-ekspresi itu dihitung ulang SETIAP evaluasi.
+Jika program di-cache (ExpressionCache) atau memakai variabel,
+program yang lebih pendek = evaluasi yang lebih cepat setiap kali.
+
+OPTIMASI YANG DILAKUKAN:
+1. CONSTANT FOLDING - sub-ekspresi yang semua operand-nya angka
+   dihitung saat compile:   60 60 * 24 *  →  86400
+2. IDENTITAS ALJABAR yang aman (x tetap dievaluasi, hasil sama):
+   x * 1, 1 * x, x - 0, x / 1, x ^ 1  →  x
+   Fungsi dengan argumen konstan juga di-fold:  sqrt(16) → 4
+
+YANG SENGAJA TIDAK DILAKUKAN:
+- Folding yang menghasilkan error (misal 1 / 0): dibiarkan supaya
+  error tetap muncul saat evaluasi, sama seperti tanpa optimizer
+- x * 0 → 0 atau x ^ 0 → 1: membuang x bisa menyembunyikan error
+  (misal ( 1 / 0 ) * 0) atau mengubah hasil NaN/inf
+- x + 0 dan 0 + x → x: untuk x = -0.0 hasilnya 0.0, bukan -0.0
+  (x - 0 tetap aman, tapi x - -0 tidak)
+- Folding yang menghasilkan NaN (misal 1e999 - 1e999): NaN tidak bisa
+  ditulis sebagai token postfix, jadi str(program) tidak bisa di-parse
+  kembali (inf tetap di-fold, dirender "1e999")
+
+CARA KERJA:
+Program postfix disimulasikan dengan stack berisi NODE (bukan angka):
+- ('const', nilai, teks literal atau None jika hasil folding)
+- ('var', nama)
+- ('op', opcode, node_kiri, node_kanan)
+  (fungsi unary / minus unary: node_kanan = None)
+Setiap operator langsung dicoba di-fold/disederhanakan, lalu tree
+hasil di-emit kembali menjadi PostfixProgram baru.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import math
+
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OP_ADD, OP_SUB,
+                             OP_MUL, OP_DIV, OP_POW, OPCODE_SYMBOLS, OPCODE_ARITY,
+                             format_number)
+from Postfix_VM import DISPATCH
+
+
+# Identitas: (opcode, posisi konstanta, nilai konstanta)
+# posisi 'right' → x OP c = x, posisi 'left' → c OP x = x
+# Konstanta 0 hanya +0.0 (lihat is_identity): -0.0 == 0.0 di dalam set
+IDENTITIES = {
+    (OP_MUL, 'right', 1.0), (OP_MUL, 'left', 1.0),
+    (OP_SUB, 'right', 0.0),
+    (OP_DIV, 'right', 1.0),
+    (OP_POW, 'right', 1.0),
+}
+
+
+def is_identity(opcode, side, constant):
+    """
+    Cek apakah (opcode, posisi, konstanta) adalah identitas di IDENTITIES.
+
+    -0.0 dianggap sama dengan 0.0 oleh set, jadi tanda nol dicek terpisah:
+    x - -0 sama dengan x + 0, yang mengubah -0.0 menjadi 0.0.
+
+    Args:
+        opcode (int): Opcode operator
+        side (str): Posisi konstanta, 'left' atau 'right'
+        constant (float): Nilai konstanta
+
+    Returns:
+        bool: True jika operasi bisa diganti dengan operand lainnya
+    """
+    if constant == 0.0 and math.copysign(1.0, constant) < 0:
+        return False
+    return (opcode, side, constant) in IDENTITIES
+
+
+def emit(node, program):
+    """
+    Menulis node (dan semua child-nya) ke program dalam urutan postfix.
+
+    Iteratif (bukan rekursif) supaya ekspresi yang sangat panjang tidak
+    terkena batas rekursi Python.
+
+    Args:
+        node (tuple): Root node
+        program (PostfixProgram): Program tujuan
+    """
+    # (node, sudah_dikunjungi): child di-emit dulu, baru operatornya
+    pending = [(node, False)]
+    while pending:
+        current, visited = pending.pop()
+        kind = current[0]
+        if kind == 'const':
+            program.add_number(current[1], current[2])
+        elif kind == 'var':
+            program.add_variable(current[1])
+        elif visited:
+            program.add_operator(OPCODE_SYMBOLS[current[1]])
+        else:
+            pending.append((current, True))
+            if current[3] is not None:
+                pending.append((current[3], False))
+            pending.append((current[2], False))
+
+
+def render(node):
+    """
+    Render node menjadi teks postfix (untuk laporan).
+
+    Args:
+        node (tuple): Node
+
+    Returns:
+        str: Contoh "60 60 *"
+    """
+    program = PostfixProgram()
+    emit(node, program)
+    return str(program)
+
+
+def simplify(opcode, left, right, report):
+    """
+    Mencoba fold / menyederhanakan satu operator.
+
+    Args:
+        opcode (int): Opcode operator
+        left (tuple): Node operand kiri (satu-satunya operand jika unary)
+        right (tuple): Node operand kanan (None jika unary)
+        report (list): Laporan optimasi (ditambah jika ada perubahan)
+
+    Returns:
+        tuple: Node hasil (bisa node baru, left/right, atau node operator)
+    """
+    node = ('op', opcode, left, right)
+
+    # Fungsi unary / minus unary: hanya constant folding
+    if right is None:
+        if left[0] != 'const':
+            return node
+        try:
+            value = DISPATCH[opcode](left[1])
+        except (ValueError, ArithmeticError):
+            return node
+        if value != value:
+            return node   # NaN tidak punya bentuk token (lihat format_number)
+        report.append({'kind': 'fold', 'before': render(node), 'after': format_number(value)})
+        return ('const', value, None)
+
+    # 1. Constant folding
+    if left[0] == 'const' and right[0] == 'const':
+        try:
+            value = DISPATCH[opcode](left[1], right[1])
+        except (ValueError, ArithmeticError):
+            # Biarkan error terjadi saat evaluasi (perilaku tidak berubah)
+            return node
+        if value != value:
+            # NaN (misal inf - inf) tidak punya bentuk token: program hasil
+            # optimasi harus tetap bisa di-render lalu di-parse kembali
+            return node
+        folded = ('const', value, None)
+        report.append({'kind': 'fold', 'before': render(node), 'after': format_number(value)})
+        return folded
+
+    # 2. Identitas aljabar
+    if right[0] == 'const' and is_identity(opcode, 'right', right[1]):
+        report.append({'kind': 'identity', 'before': render(node), 'after': render(left)})
+        return left
+    if left[0] == 'const' and is_identity(opcode, 'left', left[1]):
+        report.append({'kind': 'identity', 'before': render(node), 'after': render(right)})
+        return right
+
+    return node
+
+
+def optimize(program):
+    """
+    Mengoptimasi PostfixProgram (constant folding + identitas aman).
+
+    Args:
+        program (PostfixProgram): Program hasil infix_to_program()
+
+    Returns:
+        tuple: (PostfixProgram baru, report)
+               report = list of dict {'kind', 'before', 'after'},
+               kind = 'fold' atau 'identity'.
+               Program invalid (atau yang sudah memakai temp slot)
+               dikembalikan apa adanya (report kosong),
+               supaya error-nya tetap dilaporkan oleh evaluator.
+
+    Example:
+        program, report = optimize(infix_to_program("x * ( 60 * 60 * 24 )"))
+        str(program)   # "x 86400 *"
+        report[0]      # {'kind': 'fold', 'before': '60 60 *', 'after': '3600'}
+    """
+    # Program dengan temp slot (hasil Expression_Tree) tidak di-optimasi lagi
+    if program.error is not None or program.depth != 1 or program.temps:
+        return program, []
+
+    report = []
+    stack = []
+    names = program.names
+    literals = program.literals
+    for index, (opcode, constant) in enumerate(zip(program.opcodes, program.constants)):
+        if opcode == OP_PUSH:
+            stack.append(('const', constant, literals.get(index)))
+        elif opcode == OP_LOAD:
+            stack.append(('var', names[int(constant)]))
+        elif OPCODE_ARITY[opcode] == 1:
+            stack.append(simplify(opcode, stack.pop(), None, report))
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            stack.append(simplify(opcode, left, right, report))
+
+    if not report:
+        return program, report
+
+    optimized = PostfixProgram()
+    emit(stack[0], optimized)
+    return optimized, report
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing optimizer: hasil evaluasi harus sama, program lebih pendek.
+    """
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+
+    print("\n" + "="*60)
+    print("TESTING OPTIMIZER")
+    print("="*60 + "\n")
+
+    # Test cases: (infix, expected_postfix_setelah_optimasi)
+    test_cases = [
+        ("x * ( 60 * 60 * 24 )", "x 86400 *"),
+        ("x * 1 - 0", "x"),
+        ("x + 0", "x 0 +"),                  # -0.0 + 0 = 0.0, dibiarkan
+        ("0 + x * 1", "0 x +"),
+        ("x - -0", "x -0 -"),                # -0.0 - -0.0 = 0.0, dibiarkan
+        ("1 * x ^ 1 - 0", "x"),
+        ("( 2 + 3 ) * x / 1", "5 x *"),
+        ("x + 10 / 0", "x 10 0 / +"),        # Error tidak di-fold
+        ("x * 0", "x 0 *"),                  # Tidak aman, dibiarkan
+        ("3 + 4 * 2", "11"),
+        ("x * sqrt(16) - -2", "x 4 * -2 -"),
+        ("max(x, 2 ^ 3) + log(-1)", "x 8 max -1 log +"),
+        ("x + 2 * 1e999", "x 1e999 +"),       # inf di-fold, dirender 1e999
+        ("1e999 - 1e999 + x", "1e999 1e999 - x +"),   # NaN tidak di-fold
+    ]
+
+    passed = 0
+    failed = 0
+    # x = -0.0: identitas tidak boleh mengubah tanda nol (repr membedakannya)
+    variable_sets = [{"x": 7.5}, {"x": -0.0}]
+
+    for infix, expected in test_cases:
+        original = infix_to_program(infix)
+        optimized, report = optimize(original)
+
+        def outcome(program):
+            results = []
+            for variables in variable_sets:
+                try:
+                    results.append(run_program(program, variables))
+                except (ValueError, ArithmeticError) as e:
+                    results.append(type(e).__name__)
+            return results
+
+        # repr(): NaN != NaN. Teks postfix hasil optimasi juga harus bisa
+        # di-parse kembali (seperti yang ditampilkan dan disimpan di history)
+        reparsed = PostfixProgram.from_tokens(str(optimized).split())
+        same_result = (repr(outcome(original)) == repr(outcome(optimized)) ==
+                       repr(outcome(reparsed)))
+        if str(optimized) == expected and same_result:
+            print(f"✅ PASS - {infix:25} → {optimized}  ({len(report)} simplifikasi)")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {infix}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {optimized} (hasil sama: {same_result})")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,222 @@
+"""
+Parallel Evaluator - Banyak Ekspresi dengan Process Pool
+=========================================================
+
+File ini berisi mode batch untuk mengevaluasi BANYAK ekspresi infix
+yang saling independen (misal puluhan juta baris di job malam).
+
+CARA KERJA:
+1. Input (iterable of str) dipotong menjadi CHUNK (misal 1000 ekspresi)
+2. Setiap chunk dikirim ke worker process (ProcessPoolExecutor)
+3. Worker mem-parse dan mengevaluasi chunk dengan Calculator miliknya
+   sendiri (cache program per process, tanpa print)
+4. Hasil dikembalikan SESUAI URUTAN INPUT
+
+Jumlah chunk yang sedang diproses dibatasi (window), jadi input yang
+sangat besar tidak dimuat ke memory sekaligus.
+
+ERROR PER ITEM:
+Error seperti ZeroDivisionError atau ValueError "Tidak cukup operand"
+TIDAK menghentikan batch. Error dicatat di result record:
+
+    {'index': 3, 'expression': '10 / 0', 'result': None,
+     'error': 'Error: Pembagian dengan nol tidak diperbolehkan!',
+     'error_type': 'ZeroDivisionError'}
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+# Calculator milik worker process (dibuat sekali per process)
+_worker_calculator = None
+
+
+def make_record(index, expression, result=None, error=None):
+    """
+    Membuat result record untuk satu ekspresi.
+
+    Args:
+        index (int): Posisi ekspresi di input (mulai dari 0)
+        expression (str): Ekspresi infix
+        result (float, optional): Hasil jika sukses
+        error (Exception, optional): Error jika gagal
+
+    Returns:
+        dict: index, expression, result, error, error_type
+    """
+    return {
+        'index': index,
+        'expression': expression,
+        'result': result,
+        'error': str(error) if error is not None else None,
+        'error_type': type(error).__name__ if error is not None else None,
+    }
+
+
+def evaluate_record(calc, index, expression):
+    """
+    Mengevaluasi satu ekspresi dan membungkus hasil/error menjadi record.
+
+    Args:
+        calc (Calculator): Calculator yang dipakai
+        index (int): Posisi ekspresi di input
+        expression (str): Ekspresi infix
+
+    Returns:
+        dict: Result record (lihat make_record)
+    """
+    try:
+        return make_record(index, expression, result=calc.evaluate(expression))
+    except (ValueError, ArithmeticError) as e:
+        # ArithmeticError mencakup ZeroDivisionError dan OverflowError
+        return make_record(index, expression, error=e)
+
+
+def _init_worker(engine, cache_size, backend='float'):
+    """
+    Initializer worker process: buat Calculator sekali per process.
+    """
+    global _worker_calculator
+    from Calculator import Calculator
+    _worker_calculator = Calculator(engine=engine, cache_size=cache_size, backend=backend)
+
+
+def evaluate_chunk(start, expressions):
+    """
+    Mengevaluasi satu chunk ekspresi di worker process.
+
+    Args:
+        start (int): Index ekspresi pertama di chunk
+        expressions (list): List ekspresi infix
+
+    Returns:
+        list: Result records, urut sesuai chunk
+    """
+    calc = _worker_calculator
+    return [evaluate_record(calc, start + offset, expression)
+            for offset, expression in enumerate(expressions)]
+
+
+def iter_chunks(expressions, chunk_size):
+    """
+    Memotong iterable menjadi chunk (start_index, list).
+
+    Args:
+        expressions (iterable): Ekspresi infix
+        chunk_size (int): Jumlah ekspresi per chunk
+
+    Yields:
+        tuple: (start_index, list of expressions)
+    """
+    iterator = iter(expressions)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def evaluate_many(expressions, workers=None, chunk_size=1000, engine='vm', cache_size=1024,
+                  backend='float'):
+    """
+    Mengevaluasi banyak ekspresi secara paralel, hasil urut sesuai input.
+
+    Args:
+        expressions (iterable): Ekspresi infix (list, generator, file, dll)
+        workers (int, optional): Jumlah worker process (default: jumlah CPU).
+                                 workers=1 → dijalankan di process ini saja.
+        chunk_size (int): Jumlah ekspresi per chunk yang dikirim ke worker
+        engine (str): Engine evaluasi untuk worker ('vm', 'codegen' atau 'stack')
+        cache_size (int): Ukuran cache program per worker
+        backend (str atau NumericBackend): Backend angka untuk worker
+
+    Yields:
+        dict: Result record per ekspresi (lihat make_record)
+
+    Example:
+        for record in evaluate_many(["3 + 4", "10 / 0"], workers=2):
+            print(record['result'], record['error'])
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Mode tanpa pool: lebih cepat untuk input kecil / debugging
+    if workers <= 1:
+        from Calculator import Calculator
+        calc = Calculator(engine=engine, cache_size=cache_size, backend=backend)
+        for index, expression in enumerate(expressions):
+            yield evaluate_record(calc, index, expression)
+        return
+
+    # Window: maksimal 2 chunk per worker yang sedang diproses,
+    # supaya memory tetap terbatas walaupun input sangat besar
+    max_in_flight = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine, cache_size, backend)) as pool:
+        pending = deque()
+        for start, chunk in iter_chunks(expressions, chunk_size):
+            pending.append(pool.submit(evaluate_chunk, start, chunk))
+            if len(pending) >= max_in_flight:
+                # Ambil chunk PALING AWAL dulu → urutan hasil terjaga
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing evaluate_many (urutan hasil, error per item, speedup).
+    """
+    import time
+
+    print("\n" + "="*60)
+    print("TESTING PARALLEL EVALUATOR")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    expressions = ["3 + 4", "10 / 0", "3 +", "( 5 + 6 ) * 2"] * 2500
+    records = list(evaluate_many(expressions, workers=2, chunk_size=500))
+
+    check("Jumlah hasil sama dengan input", len(records) == len(expressions))
+    check("Urutan hasil sesuai input",
+          [r['index'] for r in records] == list(range(len(expressions))))
+    check("Hasil sukses", records[0]['result'] == 7.0 and records[3]['result'] == 22.0)
+    check("ZeroDivisionError dicatat", records[1]['error_type'] == 'ZeroDivisionError')
+    check("ValueError dicatat", records[2]['error_type'] == 'ValueError')
+
+    # Demo throughput: 1 worker vs semua CPU
+    expressions = [f"( {i} + 6 ) * ( 7 - 2 ) / 3 ^ 2" for i in range(200_000)]
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        for _ in evaluate_many(expressions, workers=workers, chunk_size=5000):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"  workers={workers:3}: {len(expressions) / elapsed:12,.0f} ekspresi/detik")
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
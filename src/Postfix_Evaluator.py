@@ -12,7 +12,10 @@ CARA KERJA EVALUASI POSTFIX:
    - Pop 2 angka dari stack (operand2, operand1)
    - Hitung: operand1 OPERATOR operand2
    - Push hasil ke stack
-4. Di akhir: angka terakhir di stack = hasil akhir
+4. Jika ketemu FUNGSI / MINUS UNARY (neg, sqrt, sin, ...):
+   - Pop 1 angka, hitung fungsi, push hasil
+   (min dan max memakai 2 angka, seperti operator biner)
+5. Di akhir: angka terakhir di stack = hasil akhir
 
 CONTOH:
 Postfix: 3 4 +
@@ -25,8 +28,53 @@ Author: Fadli Ghafatul Hijriah
 Date: January 2025
 """
 
+import math
+import operator
+
 # Import Stack class
-from Stack import Stack
+from Stack import FloatStack
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OP_STORE, OP_FETCH,
+                             OPCODE_SYMBOLS, OPCODE_ARITY)
+
+
+def square_root(operand):
+    """
+    Akar kuadrat untuk bilangan real.
+
+    Raises:
+        ValueError: Jika operand negatif
+    """
+    if operand < 0:
+        raise ValueError("Error: Akar kuadrat dari bilangan negatif!")
+    return math.sqrt(operand)
+
+
+def natural_log(operand):
+    """
+    Logaritma natural (basis e).
+
+    Raises:
+        ValueError: Jika operand <= 0
+    """
+    if operand <= 0:
+        raise ValueError("Error: Logaritma hanya untuk bilangan positif!")
+    return math.log(operand)
+
+
+# Implementasi fungsi: nama → callable
+# (dipakai juga oleh dispatch table di Postfix_VM.py)
+FUNCTIONS = {
+    'neg': operator.neg,
+    'sqrt': square_root,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': natural_log,
+    'exp': math.exp,
+    'abs': abs,
+    'min': min,
+    'max': max,
+}
 
 
 def is_number(string):
@@ -55,7 +103,7 @@ def is_number(string):
         return False
 
 
-def apply_operator(operand1, operand2, operator):
+def apply_operator(operand1, operand2, operator, tracer=None):
     """
     Melakukan operasi matematika antara dua operand dengan operator tertentu.
     
@@ -70,13 +118,15 @@ def apply_operator(operand1, operand2, operator):
     Args:
         operand1 (float): Operand pertama (yang di-pop kedua)
         operand2 (float): Operand kedua (yang di-pop pertama)
-        operator (str): Operator matematika (+, -, *, /, ^)
+        operator (str): Operator matematika (+, -, *, /, ^) atau
+                        fungsi biner (min, max)
+        tracer (TraceSink, optional): Sink untuk event 'apply'
     
     Returns:
         float: Hasil operasi
     
     Raises:
-        ValueError: Jika operator tidak dikenal
+        ValueError: Jika operator tidak dikenal atau hasil pangkat bukan real
         ZeroDivisionError: Jika terjadi pembagian dengan nol
     
     Example:
@@ -89,20 +139,14 @@ def apply_operator(operand1, operand2, operator):
     # Penjumlahan
     if operator == '+':
         result = operand1 + operand2
-        print(f"     Operasi: {operand1} + {operand2} = {result}")
-        return result
     
     # Pengurangan (URUTAN PENTING!)
     elif operator == '-':
         result = operand1 - operand2
-        print(f"     Operasi: {operand1} - {operand2} = {result}")
-        return result
     
     # Perkalian
     elif operator == '*':
         result = operand1 * operand2
-        print(f"     Operasi: {operand1} * {operand2} = {result}")
-        return result
     
     # Pembagian (URUTAN PENTING + CEK ZERO!)
     elif operator == '/':
@@ -111,21 +155,77 @@ def apply_operator(operand1, operand2, operator):
             raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
         
         result = operand1 / operand2
-        print(f"     Operasi: {operand1} / {operand2} = {result}")
-        return result
     
     # Pangkat (Power)
     elif operator == '^':
         result = operand1 ** operand2
-        print(f"     Operasi: {operand1} ^ {operand2} = {result}")
-        return result
+        
+        # Basis negatif dengan pangkat pecahan menghasilkan bilangan
+        # kompleks di Python, yang tidak didukung kalkulator ini
+        if isinstance(result, complex):
+            raise ValueError("Error: Hasil pangkat bukan bilangan real!")
+    
+    # Fungsi biner (hasil dari min(a, b, ...) / max(a, b, ...))
+    elif operator == 'min' or operator == 'max':
+        result = FUNCTIONS[operator](operand1, operand2)
     
     # Operator tidak dikenal
     else:
         raise ValueError(f"Error: Operator '{operator}' tidak dikenal!")
+    
+    if tracer is not None:
+        tracer.emit('postfix', 'apply', left=operand1, right=operand2,
+                    operator=operator, result=result)
+    return result
+
+
+def apply_function(operand, name, tracer=None):
+    """
+    Menjalankan fungsi unary (atau minus unary) pada satu operand.
+    
+    Args:
+        operand (float): Operand (yang di-pop dari stack)
+        name (str): Nama fungsi (neg, sqrt, sin, cos, tan, log, exp, abs)
+        tracer (TraceSink, optional): Sink untuk event 'apply_function'
+    
+    Returns:
+        float: Hasil fungsi
+    
+    Raises:
+        ValueError: Jika fungsi tidak dikenal atau operand di luar domain
+    
+    Example:
+        apply_function(9, 'sqrt')   # Returns 3.0
+        apply_function(2, 'neg')    # Returns -2.0
+    """
+    if name not in FUNCTIONS:
+        raise ValueError(f"Error: Fungsi '{name}' tidak dikenal!")
+    result = float(FUNCTIONS[name](operand))
+    if tracer is not None:
+        tracer.emit('postfix', 'apply_function', name=name, operand=operand, result=result)
+    return result
+
+
+def lookup_variable(variables, name):
+    """
+    Mengambil nilai variabel sebagai float.
+    
+    Args:
+        variables (dict): Mapping nama variabel → nilai (boleh None)
+        name (str): Nama variabel
+    
+    Returns:
+        float: Nilai variabel
+    
+    Raises:
+        ValueError: Jika variabel tidak didefinisikan
+    """
+    if variables is None or name not in variables:
+        raise ValueError(f"Error: Variabel '{name}' tidak didefinisikan!")
+    return float(variables[name])
 
 
-def evaluate_postfix(expression):
+def evaluate_postfix(expression, tracer=None, variables=None):
     """
     Mengevaluasi ekspresi postfix dan mengembalikan hasilnya.
     
@@ -133,7 +233,7 @@ def evaluate_postfix(expression):
     1. Buat stack kosong
     2. Scan setiap token (angka/operator) dari kiri ke kanan
     3. Jika token adalah ANGKA:
-       - Convert ke float
+       - Ambil konstanta yang sudah di-parse saat compile
        - Push ke stack
     4. Jika token adalah OPERATOR:
        - Pop dua angka dari stack (operand2 dulu, lalu operand1)
@@ -142,17 +242,24 @@ def evaluate_postfix(expression):
     5. Di akhir: angka terakhir di stack adalah hasil akhir
     
     Args:
-        expression (str): Ekspresi dalam notasi postfix
-                         Contoh: "3 4 +"
+        expression (PostfixProgram, str atau list): Ekspresi postfix.
+                         Contoh: infix_to_program("3 + 4"), "3 4 +"
+                         atau ["3", "4", "+"]. String/list di-compile
+                         dulu menjadi PostfixProgram (angka di-parse sekali).
+        variables (dict, optional): Nilai variabel, misal {"x": 2.5}
+        tracer (TraceSink, optional): Sink untuk step events (lihat Trace_Sink.py).
+                         Jika None, tidak ada event yang dibuat sama sekali.
     
     Returns:
         float: Hasil evaluasi
     
     Raises:
-        ValueError: Jika expression invalid (tidak cukup operand, dll)
+        ValueError: Jika expression invalid (tidak cukup operand, variabel
+                    tidak didefinisikan, dll)
         ZeroDivisionError: Jika terjadi pembagian dengan nol
     
     Example:
+        evaluate_postfix("x 4 +", variables={"x": 3})  # Returns 7.0
         evaluate_postfix("3 4 +")           # Returns 7.0
         evaluate_postfix("3 4 2 * +")       # Returns 11.0
         evaluate_postfix("10 5 /")          # Returns 2.0
@@ -160,36 +267,90 @@ def evaluate_postfix(expression):
     """
     
     # Stack untuk menyimpan operand (angka-angka)
-    stack = Stack()
+    # FloatStack: array('d') tanpa object float per item (lihat Stack.py)
+    stack = FloatStack()
+    
+    # Compile string/list token menjadi PostfixProgram
+    # Contoh: "3 4 +" → opcodes [PUSH, PUSH, ADD], constants [3.0, 4.0, 0.0]
+    # Jika sudah berupa program (misal dari cache), langsung dipakai
+    if isinstance(expression, PostfixProgram):
+        program = expression
+    else:
+        if isinstance(expression, str):
+            expression = expression.split()
+        program = PostfixProgram.from_tokens(expression)
+    
+    opcodes = program.opcodes
+    constants = program.constants
     
-    # Split expression menjadi tokens (dipisah spasi)
-    # Contoh: "3 4 +" → ["3", "4", "+"]
-    tokens = expression.split()
+    # Kedalaman maksimal sudah diketahui dari compile → alokasi sekali
+    stack.reserve(program.max_depth)
     
-    print(f"\n{'='*60}")
-    print(f"EVALUASI POSTFIX EXPRESSION")
-    print(f"{'='*60}")
-    print(f"Postfix: {expression}")
-    print(f"Tokens: {tokens}")
-    print(f"{'='*60}\n")
+    # Temp slot untuk sub-ekspresi bersama (OP_STORE/OP_FETCH)
+    # None = slot belum diisi
+    temps = [None] * program.temps
     
-    # Scan setiap token
-    for i, token in enumerate(tokens):
+    if tracer is not None:
+        tracer.emit('postfix', 'start', expression=str(program), tokens=program.tokens())
+    
+    # Scan setiap instruksi
+    for i, opcode in enumerate(opcodes):
         
-        print(f"Step {i+1}: Membaca token '{token}'")
+        if tracer is not None:
+            tracer.emit('postfix', 'read', step=i + 1, token=program.token(i))
         
-        # CASE 1: Token adalah ANGKA
-        if is_number(token):
-            # Convert string ke float dan push ke stack
-            number = float(token)
+        # CASE 1: Instruksi adalah ANGKA
+        if opcode == OP_PUSH:
+            # Angka sudah di-parse saat compile, langsung push ke stack
+            number = constants[i]
             stack.push(number)
-            print(f"  → Angka ditemukan: {number}")
-            print(f"  → Push {number} ke stack")
-            print(f"  → Stack sekarang: {stack}")
+            if tracer is not None:
+                tracer.emit('postfix', 'number', number=number, stack=list(stack.items))
+        
+        # CASE 1b: Instruksi adalah VARIABEL
+        elif opcode == OP_LOAD:
+            name = program.names[int(constants[i])]
+            value = lookup_variable(variables, name)
+            stack.push(value)
+            if tracer is not None:
+                tracer.emit('postfix', 'variable', name=name, value=value,
+                            stack=list(stack.items))
+        
+        # CASE 1c: Simpan top of stack ke temp slot (tanpa pop)
+        elif opcode == OP_STORE:
+            if stack.is_empty():
+                raise ValueError("Error: Tidak ada nilai untuk disimpan ke slot!")
+            slot = int(constants[i])
+            temps[slot] = stack.peek()
+            if tracer is not None:
+                tracer.emit('postfix', 'store', slot=slot, value=temps[slot])
         
-        # CASE 2: Token adalah OPERATOR
+        # CASE 1d: Ambil sub-ekspresi yang sudah dihitung dari temp slot
+        elif opcode == OP_FETCH:
+            slot = int(constants[i])
+            if temps[slot] is None:
+                raise ValueError(f"Error: Slot '${slot}' belum diisi!")
+            stack.push(temps[slot])
+            if tracer is not None:
+                tracer.emit('postfix', 'fetch', slot=slot, value=temps[slot],
+                            stack=list(stack.items))
+        
+        # CASE 2: Instruksi adalah OPERATOR
         else:
-            print(f"  → Operator ditemukan: '{token}'")
+            token = OPCODE_SYMBOLS[opcode]
+            if tracer is not None:
+                tracer.emit('postfix', 'operator', operator=token)
+            
+            # CASE 3: FUNGSI UNARY / MINUS UNARY (butuh 1 operand)
+            if OPCODE_ARITY[opcode] == 1:
+                if stack.is_empty():
+                    raise ValueError(f"Error: Tidak cukup operand untuk operator '{token}'!")
+                result = apply_function(stack.pop(), token, tracer)
+                stack.push(result)
+                if tracer is not None:
+                    tracer.emit('postfix', 'result', result=result, stack=list(stack.items))
+                    tracer.emit('postfix', 'step_end')
+                continue
             
             # Cek apakah ada cukup operand di stack
             # Operator membutuhkan minimal 2 operand
@@ -202,18 +363,19 @@ def evaluate_postfix(expression):
             operand2 = stack.pop()  # Top of stack (operand kanan)
             operand1 = stack.pop()  # Second from top (operand kiri)
             
-            print(f"  → Pop operand2 (kanan): {operand2}")
-            print(f"  → Pop operand1 (kiri): {operand1}")
+            if tracer is not None:
+                tracer.emit('postfix', 'operands', left=operand1, right=operand2)
             
             # Lakukan operasi
-            result = apply_operator(operand1, operand2, token)
+            result = apply_operator(operand1, operand2, token, tracer)
             
             # Push hasil ke stack
             stack.push(result)
-            print(f"  → Push hasil {result} ke stack")
-            print(f"  → Stack sekarang: {stack}")
+            if tracer is not None:
+                tracer.emit('postfix', 'result', result=result, stack=list(stack.items))
         
-        print()
+        if tracer is not None:
+            tracer.emit('postfix', 'step_end')
     
     # Setelah semua token di-scan, stack harus berisi tepat 1 angka
     # Angka tersebut adalah hasil akhir
@@ -227,11 +389,8 @@ def evaluate_postfix(expression):
     # Pop hasil akhir
     final_result = stack.pop()
     
-    print(f"{'='*60}")
-    print(f"HASIL EVALUASI:")
-    print(f"Postfix: {expression}")
-    print(f"Result:  {final_result}")
-    print(f"{'='*60}\n")
+    if tracer is not None:
+        tracer.emit('postfix', 'done', expression=str(program), result=final_result)
     
     return final_result
 
@@ -244,6 +403,7 @@ if __name__ == "__main__":
     """
     Testing Postfix Evaluator dengan berbagai kasus.
     """
+    from Trace_Sink import TextSink
     
     print("\n" + "="*60)
     print("TESTING POSTFIX EVALUATOR")
@@ -259,6 +419,8 @@ if __name__ == "__main__":
         ("5 6 + 7 8 + *", 165.0),          # (5+6) * (7+8) = 11 * 15 = 165
         ("15 7 1 1 + - / 3 * 2 1 1 + + -", 5.0),  # Complex expression
         ("2 3 ^", 8.0),                    # 2^3 = 8
+        ("9 sqrt 2 neg *", -6.0),          # sqrt(9) * -2 = -6
+        ("1 4 2 max max", 4.0),            # max(1, 4, 2) = 4
     ]
     
     print("\nMenjalankan test cases...\n")
@@ -268,7 +430,8 @@ if __name__ == "__main__":
     
     for postfix, expected in test_cases:
         try:
-            result = evaluate_postfix(postfix)
+            # TextSink menampilkan langkah-langkah evaluasi ke layar
+            result = evaluate_postfix(postfix, tracer=TextSink())
             
             # Cek apakah hasil sesuai expected (dengan toleransi untuk float)
             if abs(result - expected) < 0.0001:  # Toleransi 0.0001 untuk floating point
@@ -0,0 +1,484 @@
+"""
+Postfix Program - Compiled Representation
+==========================================
+
+File ini berisi representasi "program" postfix yang sudah di-compile.
+
+KENAPA TIDAK PAKAI STRING SAJA?
+Dulu hasil konversi adalah string "3 4 +", lalu evaluator memecahnya lagi
+dengan split() dan memanggil float() DUA kali per angka (sekali di
+is_number, sekali saat push). Itu kerja yang sia-sia.
+
+Sekarang konversi menghasilkan PostfixProgram yang berisi dua array paralel:
+- opcodes   : kode operasi per instruksi (OP_PUSH, OP_ADD, ...)
+- constants : angka yang sudah di-parse (hanya berarti untuk OP_PUSH)
+
+Contoh: "3 + 4 * 2"
+    index     : 0        1        2        3       4
+    opcodes   : OP_PUSH  OP_PUSH  OP_PUSH  OP_MUL  OP_ADD
+    constants : 3.0      4.0      2.0      0.0     0.0
+
+Minus unary dan fungsi (sqrt, sin, min, max, ...) juga punya opcode sendiri
+dan di-render dengan namanya: "-x" → "x neg", "sqrt(x)" → "x sqrt",
+"max(a, b, c)" → "a b c max max" (fungsi variadik = operasi biner berulang).
+
+Variabel (misal "x") di-compile menjadi OP_LOAD. Nama variabel disimpan
+di list `names`, dan constants berisi index (slot) nama tersebut.
+
+Sub-ekspresi yang dipakai berulang (lihat Expression_Tree.py) bisa disimpan
+di TEMP SLOT: OP_STORE menyalin top of stack ke slot (tanpa pop), OP_FETCH
+push isi slot. Rendering-nya "=>$0" (store) dan "$0" (fetch).
+
+Angka di-parse TEPAT SEKALI saat compile. Bentuk string ("3 4 2 * +")
+hanya dipakai untuk ditampilkan (rendering), lewat str(program).
+
+Teks asli setiap literal angka juga disimpan di `literals` (index instruksi
+→ teks), di samping constants. Engine float tidak memakainya; backend
+Decimal/Fraction (Numeric_Backend.py) membangun angka dari teks ini, jadi
+"10000000000000000000001" tetap eksak walaupun float-nya sudah dibulatkan.
+
+Program juga menghitung kedalaman stack maksimal (max_depth) saat compile,
+sehingga evaluator bisa mengalokasikan stack sekali di awal.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import math
+from array import array
+
+
+# ============================================================================
+# OPCODES
+# ============================================================================
+
+OP_PUSH = 0   # Push konstanta angka ke stack
+OP_ADD = 1    # Penjumlahan       (+)
+OP_SUB = 2    # Pengurangan       (-)
+OP_MUL = 3    # Perkalian         (*)
+OP_DIV = 4    # Pembagian         (/)
+OP_POW = 5    # Pangkat           (^)
+OP_LOAD = 6   # Push nilai variabel (constants = index di names)
+OP_STORE = 7  # Salin top of stack ke temp slot (constants = index slot)
+OP_FETCH = 8  # Push isi temp slot (constants = index slot)
+
+# Operasi unary (1 operand): minus unary dan fungsi 1 argumen
+OP_NEG = 9    # Minus unary       (-x)
+OP_SQRT = 10  # Akar kuadrat      sqrt(x)
+OP_SIN = 11   # Sinus (radian)    sin(x)
+OP_COS = 12   # Cosinus (radian)  cos(x)
+OP_TAN = 13   # Tangen (radian)   tan(x)
+OP_LOG = 14   # Logaritma natural log(x)
+OP_EXP = 15   # Eksponensial      exp(x)
+OP_ABS = 16   # Nilai absolut     abs(x)
+
+# Fungsi biner (2 operand). Selalu opcode TERBESAR supaya evaluator bisa
+# memakai satu perbandingan (opcode >= OP_MIN) untuk mengenalinya
+OP_MIN = 17   # Minimum           min(a, b, ...)
+OP_MAX = 18   # Maksimum          max(a, b, ...)
+
+# Mapping simbol operator → opcode
+OPERATOR_OPCODES = {
+    '+': OP_ADD,
+    '-': OP_SUB,
+    '*': OP_MUL,
+    '/': OP_DIV,
+    '^': OP_POW,
+}
+
+# Mapping nama fungsi (termasuk 'neg' untuk minus unary) → opcode
+FUNCTION_OPCODES = {
+    'neg': OP_NEG,
+    'sqrt': OP_SQRT,
+    'sin': OP_SIN,
+    'cos': OP_COS,
+    'tan': OP_TAN,
+    'log': OP_LOG,
+    'exp': OP_EXP,
+    'abs': OP_ABS,
+    'min': OP_MIN,
+    'max': OP_MAX,
+}
+
+# Semua simbol yang di-compile menjadi operasi (operator + fungsi)
+SYMBOL_OPCODES = {**OPERATOR_OPCODES, **FUNCTION_OPCODES}
+
+# Mapping kebalikannya: opcode → simbol (untuk rendering)
+OPCODE_SYMBOLS = {opcode: symbol for symbol, opcode in SYMBOL_OPCODES.items()}
+
+# Jumlah operand yang dipakai setiap opcode operasi
+OPCODE_ARITY = {opcode: (1 if OP_NEG <= opcode < OP_MIN else 2)
+                for opcode in OPCODE_SYMBOLS}
+
+
+def format_number(value):
+    """
+    Render angka konstanta menjadi token postfix.
+
+    Bilangan bulat ditampilkan tanpa ".0" supaya rendering sama dengan
+    input user (misal "3 4 +" bukan "3.0 4.0 +"). Hasil render selalu bisa
+    di-parse kembali oleh from_tokens() menjadi angka yang sama:
+    inf ditulis "1e999" (bukan "inf", yang akan dibaca sebagai variabel)
+    dan -0.0 ditulis "-0".
+
+    Args:
+        value (float): Angka konstanta
+
+    Returns:
+        str: Token angka
+
+    Example:
+        format_number(3.0)            # "3"
+        format_number(4.5)            # "4.5"
+        format_number(float('inf'))   # "1e999"
+    """
+    if math.isinf(value):
+        return "1e999" if value > 0 else "-1e999"
+    if value.is_integer() and abs(value) < 1e16:
+        if value == 0 and math.copysign(1.0, value) < 0:
+            return "-0"
+        return str(int(value))
+    return repr(value)
+
+
+class PostfixProgram:
+    """
+    Program postfix yang sudah di-compile (opcodes + constants paralel).
+
+    Attributes:
+        opcodes (array): Kode operasi per instruksi (array of unsigned char)
+        constants (array): Konstanta angka per instruksi (array of double).
+                           Untuk OP_LOAD berisi index variabel di names.
+        literals (dict): Index instruksi OP_PUSH → teks literal di sumber
+                         (misal "1.50"). Konstanta hasil hitungan (constant
+                         folding) tidak punya teks.
+        names (list): Nama variabel unik, urut sesuai kemunculan pertama
+        depth (int): Kedalaman stack setelah instruksi terakhir
+        max_depth (int): Kedalaman stack maksimal selama eksekusi
+        error (str): Pesan error pertama yang terdeteksi saat compile
+                     (misal operand kurang), None jika program valid
+        temps (int): Jumlah temp slot yang dipakai OP_STORE/OP_FETCH
+
+    Example:
+        program = PostfixProgram()
+        program.add_number(3.0)
+        program.add_number(4.0)
+        program.add_operator('+')
+        str(program)        # "3 4 +"
+        program.max_depth   # 2
+    """
+
+    __slots__ = ('opcodes', 'constants', 'literals', 'names', 'depth', 'max_depth',
+                 'error', 'temps')
+
+    def __init__(self):
+        """
+        Membuat program kosong.
+        """
+        self.opcodes = array('B')
+        self.constants = array('d')
+        self.literals = {}
+        self.names = []
+        self.depth = 0
+        self.max_depth = 0
+        self.error = None
+        self.temps = 0
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """
+        Compile list token postfix (string) menjadi PostfixProgram.
+
+        Args:
+            tokens (list): Token postfix, contoh ["3", "4", "+"]
+
+        Returns:
+            PostfixProgram: Program hasil compile
+
+        Raises:
+            ValueError: Jika ada token yang bukan angka dan bukan operator
+
+        Example:
+            PostfixProgram.from_tokens("3 4 +".split())
+        """
+        program = cls()
+        for token in tokens:
+            if token in SYMBOL_OPCODES:
+                program.add_operator(token)
+                continue
+            if token.isidentifier():
+                program.add_variable(token)
+                continue
+            if token.startswith('=>$') and token[3:].isdigit():
+                program.add_store(int(token[3:]))
+                continue
+            if token.startswith('$') and token[1:].isdigit():
+                program.add_fetch(int(token[1:]))
+                continue
+            try:
+                # Parse angka SEKALI di sini
+                value = float(token)
+            except ValueError:
+                raise ValueError(f"Error: Operator '{token}' tidak dikenal!")
+            program.add_number(value, token)
+        return program
+
+    def add_number(self, value, text=None):
+        """
+        Menambahkan instruksi OP_PUSH dengan konstanta angka.
+
+        Args:
+            value (float): Angka yang sudah di-parse
+            text (str, optional): Teks literal di sumber (misal "0.10"),
+                                  None untuk konstanta hasil hitungan
+        """
+        if text is not None:
+            self.literals[len(self.opcodes)] = text
+        self.opcodes.append(OP_PUSH)
+        self.constants.append(value)
+        self._grow()
+
+    def add_variable(self, name):
+        """
+        Menambahkan instruksi OP_LOAD untuk variabel.
+
+        Args:
+            name (str): Nama variabel, misal "x"
+        """
+        if name in self.names:
+            slot = self.names.index(name)
+        else:
+            slot = len(self.names)
+            self.names.append(name)
+        self.opcodes.append(OP_LOAD)
+        self.constants.append(slot)
+        self._grow()
+
+    def add_store(self, slot):
+        """
+        Menambahkan instruksi OP_STORE (salin top of stack ke temp slot).
+
+        Nilai tetap di stack, jadi depth tidak berubah.
+
+        Args:
+            slot (int): Index temp slot
+        """
+        if self.depth < 1 and self.error is None:
+            self.error = "Error: Tidak ada nilai untuk disimpan ke slot!"
+        self.opcodes.append(OP_STORE)
+        self.constants.append(slot)
+        if slot >= self.temps:
+            self.temps = slot + 1
+
+    def add_fetch(self, slot):
+        """
+        Menambahkan instruksi OP_FETCH (push isi temp slot).
+
+        Args:
+            slot (int): Index temp slot (harus sudah di-store sebelumnya)
+        """
+        if slot >= self.temps and self.error is None:
+            self.error = f"Error: Slot '${slot}' belum diisi!"
+        self.opcodes.append(OP_FETCH)
+        self.constants.append(slot)
+        if slot >= self.temps:
+            self.temps = slot + 1
+        self._grow()
+
+    def _grow(self):
+        """
+        Update depth setelah instruksi yang push 1 nilai.
+        """
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def add_operator(self, symbol):
+        """
+        Menambahkan instruksi operator (biner) atau fungsi (unary/biner).
+
+        Args:
+            symbol (str): Simbol operator (+, -, *, /, ^) atau nama fungsi
+                          (neg, sqrt, sin, cos, tan, log, exp, abs, min, max)
+        """
+        opcode = SYMBOL_OPCODES[symbol]
+        arity = OPCODE_ARITY[opcode]
+
+        # Operasi butuh `arity` operand. Jika kurang, catat error pertama
+        # (dilaporkan saat evaluasi, sama seperti evaluator berbasis string)
+        if self.depth < arity and self.error is None:
+            self.error = f"Error: Tidak cukup operand untuk operator '{symbol}'!"
+
+        self.opcodes.append(opcode)
+        self.constants.append(0.0)
+        self.depth -= arity - 1
+
+    def token(self, index):
+        """
+        Render satu instruksi menjadi token string.
+
+        Args:
+            index (int): Posisi instruksi
+
+        Returns:
+            str: Token, misal "3" atau "+"
+        """
+        opcode = self.opcodes[index]
+        if opcode == OP_PUSH:
+            return format_number(self.constants[index])
+        if opcode == OP_LOAD:
+            return self.names[int(self.constants[index])]
+        if opcode == OP_STORE:
+            return f"=>${int(self.constants[index])}"
+        if opcode == OP_FETCH:
+            return f"${int(self.constants[index])}"
+        return OPCODE_SYMBOLS[opcode]
+
+    def literal(self, index):
+        """
+        Teks angka untuk instruksi OP_PUSH, untuk backend angka eksak.
+
+        Args:
+            index (int): Posisi instruksi
+
+        Returns:
+            str: Teks literal di sumber, atau format_number() untuk
+                 konstanta tanpa teks (misal hasil constant folding)
+        """
+        text = self.literals.get(index)
+        if text is None:
+            return format_number(self.constants[index])
+        return text
+
+    def tokens(self):
+        """
+        Render seluruh program menjadi list token string.
+
+        Returns:
+            list: Contoh ["3", "4", "+"]
+        """
+        return [self.token(i) for i in range(len(self.opcodes))]
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __str__(self):
+        return ' '.join(self.tokens())
+
+    def __repr__(self):
+        return f"PostfixProgram('{self}')"
+
+    def __sizeof__(self):
+        # Dipakai sys.getsizeof() (misal untuk batas bytes di ExpressionCache)
+        return (object.__sizeof__(self) + self.opcodes.__sizeof__() +
+                self.constants.__sizeof__() + self.literals.__sizeof__() +
+                self.names.__sizeof__())
+
+
+def program_key(program, literals=False):
+    """
+    Key ter-normalisasi untuk program: opcodes + konstanta sebagai bytes.
+
+    Panjang opcodes (n byte) dan constants (8n byte) selalu sebanding,
+    jadi hasil penggabungan tidak ambigu.
+
+    Args:
+        program (PostfixProgram): Program hasil compile
+        literals (bool): Sertakan teks literal (untuk backend Decimal/Fraction:
+                         "3" dan "3.0", atau dua bilangan bulat panjang yang
+                         float-nya sama, memberi hasil berbeda)
+
+    Returns:
+        bytes: Key cache
+
+    Example:
+        program_key(infix_to_program("3+4")) == program_key(infix_to_program("3.0 + 4"))
+    """
+    key = program.opcodes.tobytes() + program.constants.tobytes()
+    if not literals:
+        return key
+    # Teks literal hanya berisi karakter angka, jadi '\0' tidak ambigu
+    return key + '\0'.join(program.literal(index) if opcode == OP_PUSH else ''
+                           for index, opcode in enumerate(program.opcodes)).encode('utf-8')
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing PostfixProgram (compile, rendering, max_depth).
+    """
+
+    print("\n" + "="*60)
+    print("TESTING POSTFIX PROGRAM")
+    print("="*60 + "\n")
+
+    # Test cases: (postfix, expected_max_depth)
+    test_cases = [
+        ("3 4 +", 2),
+        ("3 4 2 * +", 3),
+        ("3 4 + 2 *", 2),
+        ("5 6 + 7 8 + *", 3),
+        ("2.5 3 ^", 2),
+        ("x 2 * x +", 2),
+        ("x 1 + =>$0 $0 *", 2),
+        ("x neg 2 ^ sqrt", 2),
+        ("a b c max max", 3),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for postfix, expected_depth in test_cases:
+        program = PostfixProgram.from_tokens(postfix.split())
+        if str(program) == postfix and program.max_depth == expected_depth:
+            print(f"✅ PASS - {postfix} (max_depth={program.max_depth})")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {postfix}")
+            print(f"   Got: {program} (max_depth={program.max_depth})")
+            failed += 1
+
+    # Operand kurang dicatat sebagai error, bukan exception saat compile
+    program = PostfixProgram.from_tokens(["3", "+"])
+    if program.error is not None:
+        print(f"✅ PASS - Error tercatat: {program.error}")
+        passed += 1
+    else:
+        print("❌ FAIL - Error operand kurang tidak tercatat")
+        failed += 1
+
+    # Round-trip: konstanta hasil render di-parse kembali menjadi angka yang sama
+    values = [float('inf'), float('-inf'), -0.0, 0.0, 1e300, 1e16, -2.5, 0.1]
+    program = PostfixProgram()
+    for value in values:
+        program.add_number(value)
+    restored = PostfixProgram.from_tokens(str(program).split())
+    if (not restored.names and
+            [(v, math.copysign(1.0, v)) for v in restored.constants] ==
+            [(v, math.copysign(1.0, v)) for v in values]):
+        print(f"✅ PASS - Round-trip konstanta: {program}")
+        passed += 1
+    else:
+        print(f"❌ FAIL - Round-trip konstanta: {program} → {restored}")
+        failed += 1
+
+    # Teks literal disimpan (render tetap ter-normalisasi)
+    program = PostfixProgram.from_tokens("10000000000000000000001 3.0 + 0.10 *".split())
+    key_literals = program_key(program, literals=True)
+    same_float = PostfixProgram.from_tokens("10000000000000000000000 3 + 0.1 *".split())
+    if ([program.literal(i) for i in (0, 1, 3)] == ["10000000000000000000001", "3.0", "0.10"]
+            and str(program) == "1e+22 3 + 0.1 *"
+            and program_key(program) == program_key(same_float)
+            and key_literals != program_key(same_float, literals=True)):
+        print("✅ PASS - Teks literal dan program_key(literals=True)")
+        passed += 1
+    else:
+        print(f"❌ FAIL - Teks literal: {program.literals}")
+        failed += 1
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
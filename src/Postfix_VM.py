@@ -0,0 +1,221 @@
+"""
+Postfix Virtual Machine (Fast Evaluation Engine)
+=================================================
+
+File ini berisi engine evaluasi CEPAT untuk PostfixProgram.
+
+PERBEDAAN DENGAN evaluate_postfix():
+evaluate_postfix() adalah engine "edukasi": memakai class Stack
+(method push/pop/size per token), memilih operator lewat if/elif,
+dan bisa mengirim step events ke tracer.
+
+run_program() adalah engine "stack machine" yang dioptimasi:
+1. Stack operand berupa list yang dialokasikan SEKALI sebesar
+   program.max_depth (dihitung saat compile), dengan index `top` manual
+2. Operator dipilih lewat DISPATCH TABLE (list indexed by opcode),
+   bukan rantai if/elif
+3. Tidak ada I/O (print/tracer) per token
+4. Pengecekan operand (bounds checking) dilakukan SEKALI per program,
+   memakai informasi depth dari compile, bukan di setiap operator
+5. Temp slot (OP_STORE/OP_FETCH) untuk sub-ekspresi bersama juga
+   dialokasikan sekali sebesar program.temps
+6. Urutan cabang di loop: push, load, operator biner lebih dulu, baru
+   temp slot dan fungsi. Ekspresi tanpa fungsi tidak membayar biaya
+   tambahan untuk fitur fungsi/minus unary.
+
+Hasilnya identik dengan evaluate_postfix() (termasuk pesan error).
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import operator
+
+from Postfix_Program import (PostfixProgram, OP_PUSH, OP_LOAD, OP_ADD, OP_SUB,
+                             OP_MUL, OP_DIV, OP_POW, OP_STORE, OP_FETCH, OP_MIN,
+                             FUNCTION_OPCODES)
+from Postfix_Evaluator import evaluate_postfix, lookup_variable, FUNCTIONS
+
+
+def divide(operand1, operand2):
+    """
+    Pembagian dengan pengecekan nol (pesan error sama dengan apply_operator).
+
+    Raises:
+        ZeroDivisionError: Jika operand2 == 0
+    """
+    if operand2 == 0:
+        raise ZeroDivisionError("Error: Pembagian dengan nol tidak diperbolehkan!")
+    return operand1 / operand2
+
+
+def power(operand1, operand2):
+    """
+    Pangkat dengan pengecekan hasil kompleks (sama dengan apply_operator).
+
+    Raises:
+        ValueError: Jika hasil bukan bilangan real (misal (-8) ^ 0.5)
+    """
+    result = operand1 ** operand2
+    if isinstance(result, complex):
+        raise ValueError("Error: Hasil pangkat bukan bilangan real!")
+    return result
+
+
+# Dispatch table: DISPATCH[opcode] → fungsi operator / fungsi matematika
+# Index OP_PUSH, OP_LOAD, OP_STORE, OP_FETCH tidak dipakai (ditangani di loop)
+DISPATCH = [None] * (max(FUNCTION_OPCODES.values()) + 1)
+DISPATCH[OP_ADD] = operator.add
+DISPATCH[OP_SUB] = operator.sub
+DISPATCH[OP_MUL] = operator.mul
+DISPATCH[OP_DIV] = divide
+DISPATCH[OP_POW] = power
+for _name, _opcode in FUNCTION_OPCODES.items():
+    DISPATCH[_opcode] = FUNCTIONS[_name]
+
+
+def run_program(program, variables=None):
+    """
+    Mengevaluasi PostfixProgram dengan stack machine + dispatch table.
+
+    Args:
+        program (PostfixProgram): Program hasil infix_to_program()
+                                  atau PostfixProgram.from_tokens()
+        variables (dict, optional): Nilai variabel, misal {"x": 2.5}
+
+    Returns:
+        float: Hasil evaluasi
+
+    Raises:
+        ValueError: Jika program invalid (operand kurang/berlebih) atau
+                    ada variabel yang tidak didefinisikan
+        ZeroDivisionError: Jika terjadi pembagian dengan nol
+
+    Example:
+        run_program(infix_to_program("3 + 4 * 2"))   # Returns 11.0
+    """
+    # Bounds checking SEKALI per program.
+    # Jika ada operator yang kekurangan operand, serahkan ke evaluator
+    # berbasis Stack supaya urutan error-nya persis sama.
+    if program.error is not None:
+        return evaluate_postfix(program, variables=variables)
+
+    # Nilai variabel di-resolve SEKALI per program (bukan per OP_LOAD).
+    # Jika ada yang tidak didefinisikan, error-nya harus muncul di posisi
+    # OP_LOAD-nya (misal "1/0 + y" → ZeroDivisionError dulu), jadi program
+    # diserahkan ke evaluator berbasis Stack yang me-resolve per instruksi.
+    try:
+        slots = [lookup_variable(variables, name) for name in program.names]
+    except (ValueError, TypeError):
+        return evaluate_postfix(program, variables=variables)
+
+    # Alokasi stack sekali di awal (tidak ada append/pop list per token)
+    stack = [0.0] * program.max_depth
+    temps = [0.0] * program.temps
+    top = -1
+    dispatch = DISPATCH
+
+    for opcode, constant in zip(program.opcodes, program.constants):
+        if opcode == OP_PUSH:
+            top += 1
+            stack[top] = constant
+        elif opcode == OP_LOAD:
+            top += 1
+            stack[top] = slots[int(constant)]
+        elif opcode < OP_LOAD:
+            # Operator biner (OP_ADD..OP_POW)
+            # Operand kanan di top, operand kiri di bawahnya
+            right = stack[top]
+            top -= 1
+            stack[top] = dispatch[opcode](stack[top], right)
+        elif opcode == OP_STORE:
+            temps[int(constant)] = stack[top]
+        elif opcode == OP_FETCH:
+            top += 1
+            stack[top] = temps[int(constant)]
+        elif opcode >= OP_MIN:
+            # Fungsi biner (min, max)
+            right = stack[top]
+            top -= 1
+            stack[top] = dispatch[opcode](stack[top], right)
+        else:
+            # Fungsi unary / minus unary: operand diganti hasilnya di tempat
+            stack[top] = dispatch[opcode](stack[top])
+
+    # Setelah semua instruksi, stack harus berisi tepat 1 angka
+    if top < 0:
+        raise ValueError("Error: Expression kosong atau invalid!")
+    if top > 0:
+        raise ValueError(f"Error: Expression invalid! Stack masih berisi {top + 1} angka.")
+
+    return stack[0]
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing VM: hasil harus identik dengan evaluate_postfix().
+    """
+
+    print("\n" + "="*60)
+    print("TESTING POSTFIX VM")
+    print("="*60 + "\n")
+
+    # Test cases yang sama dengan Postfix_Evaluator.py
+    test_cases = [
+        "3 4 +",
+        "3 4 2 * +",
+        "3 4 + 2 *",
+        "10 5 /",
+        "10 5 -",
+        "5 6 + 7 8 + *",
+        "15 7 1 1 + - / 3 * 2 1 1 + + -",
+        "2 3 ^",
+        "10 0 /",
+        "3 +",
+        "3 4",
+        "x 2 * y +",
+        "x z +",
+        "0 8 - 0.5 ^",
+        "x y + =>$0 $0 * $0 /",
+        "$0 1 +",
+        "x neg 2 ^ sqrt y abs +",
+        "1 4 2 max max 3 min",
+        "x neg log",
+        "sqrt",
+        # Urutan error: variabel yang tidak ada baru error di OP_LOAD-nya
+        "1 0 / w +",
+        "0 1 - sqrt w +",
+        "w 1 0 / +",
+    ]
+
+    passed = 0
+    failed = 0
+
+    def outcome(engine, program):
+        # Bandingkan hasil ATAU jenis + pesan error
+        try:
+            return ('ok', engine(program, variables={"x": 3, "y": 1.5}))
+        except (ValueError, ZeroDivisionError) as e:
+            return (type(e).__name__, str(e))
+
+    for postfix in test_cases:
+        program = PostfixProgram.from_tokens(postfix.split())
+        expected = outcome(evaluate_postfix, program)
+        result = outcome(run_program, program)
+
+        if result == expected:
+            print(f"✅ PASS - {postfix:35} → {result[1]}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {postfix}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {result}")
+            failed += 1
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,594 @@
+"""
+Program Disk Cache - Cache PostfixProgram di Disk (mmap)
+=========================================================
+
+File ini berisi cache hasil konversi infix → PostfixProgram yang disimpan
+di SATU file biner, supaya proses baru (worker yang baru start, script
+one-shot, server yang di-restart) langsung "hangat": ekspresi yang pernah
+dikonversi tidak perlu dikonversi ulang.
+
+KENAPA PERLU?
+ExpressionCache (Expression_Cache.py) hanya hidup di RAM satu proses.
+Setiap proses baru mulai dari cache kosong, jadi ribuan rumus yang sama
+dikonversi ulang oleh setiap worker setelah setiap restart.
+
+KEY:
+- Ekspresi dinormalisasi (spasi di awal/akhir dibuang, deretan spasi
+  menjadi satu spasi), lalu di-hash: blake2b 16 byte
+- File berisi PARSER_VERSION (Infix_to_Postfix.py). File dengan versi
+  parser/format lain diabaikan (dianggap kosong) dan ditimpa saat flush
+
+FORMAT FILE (little-endian, bisa di-mmap read-only):
+    header : magic "SCPC", versi format, versi parser, jumlah slot, jumlah entry
+    index  : hash table open addressing (slot = hash, offset, panjang record;
+             panjang 0 = slot kosong), jumlah slot pangkat 2, terisi <= 50%
+    record : n, depth, max_depth, temps, jumlah nama, panjang error,
+             jumlah literal, opcodes (n byte), constants (8n byte),
+             nama variabel, error, teks literal (index instruksi + teks)
+
+CARA KERJA:
+- get(): hash → slot → record dibaca langsung dari mmap (tanpa membaca
+  seluruh file; halaman file dibagi oleh semua proses lewat page cache)
+- put(): record baru disimpan di RAM dulu (pending)
+- flush(): file terbaru + pending digabung lalu ditulis ke file sementara,
+  fsync, lalu os.replace() → ATOMIC. Pembaca yang masih memakai mmap file
+  lama tetap membaca file lama yang utuh, tidak pernah file setengah jadi
+- EVICTION berdasarkan ukuran: saat flush, record diurutkan dari yang
+  paling baru dipakai (pending, hit sejak flush terakhir, lalu urutan di
+  file lama) dan dipotong saat total melewati max_bytes
+
+Beberapa proses boleh flush ke file yang sama. File selalu utuh; jika dua
+flush berjalan bersamaan, pending salah satunya bisa hilang (hanya cache,
+akan dikonversi ulang).
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+
+from Postfix_Program import PostfixProgram
+from Infix_to_Postfix import PARSER_VERSION
+
+
+MAGIC = b'SCPC'
+FORMAT_VERSION = 2
+KEY_BYTES = 16
+
+HEADER = struct.Struct('<4sHHII')   # magic, format, parser, slots, entries
+SLOT = struct.Struct('<16sII')       # hash key, offset record, panjang record
+RECORD = struct.Struct('<IiIHHHI')   # n, depth, max_depth, temps, names, error, literals
+NAME = struct.Struct('<H')           # panjang nama variabel (bytes)
+LITERAL = struct.Struct('<IH')       # index instruksi, panjang teks literal (bytes)
+
+# Estimasi bytes index per entry: slot = 2-4x jumlah entry (pangkat 2)
+INDEX_BYTES_PER_ENTRY = 4 * SLOT.size
+
+# Konstanta disimpan little-endian
+SWAP_BYTES = sys.byteorder != 'little'
+
+
+def normalize(expression):
+    """
+    Normalisasi ekspresi untuk key: spasi berlebih tidak membuat key baru.
+
+    Args:
+        expression (str): Ekspresi infix
+
+    Returns:
+        str: Ekspresi tanpa spasi di awal/akhir, deretan spasi jadi satu
+
+    Example:
+        normalize("  3 +   4 ")   # "3 + 4"
+    """
+    return ' '.join(expression.split())
+
+
+def cache_key(expression):
+    """
+    Hash 16 byte dari ekspresi yang sudah dinormalisasi.
+
+    Args:
+        expression (str): Ekspresi infix
+
+    Returns:
+        bytes: Key (blake2b, 16 byte)
+    """
+    return hashlib.blake2b(normalize(expression).encode('utf-8'), digest_size=KEY_BYTES).digest()
+
+
+def encode_program(program):
+    """
+    Serialisasi PostfixProgram ke record biner.
+
+    Args:
+        program (PostfixProgram): Program hasil konversi
+
+    Returns:
+        bytes: Record (lihat FORMAT FILE di atas)
+    """
+    error = program.error.encode('utf-8') if program.error is not None else b''
+    constants = program.constants
+    if SWAP_BYTES:
+        constants = array('d', constants)
+        constants.byteswap()
+    parts = [RECORD.pack(len(program.opcodes), program.depth, program.max_depth,
+                         program.temps, len(program.names), len(error),
+                         len(program.literals)),
+             program.opcodes.tobytes(), constants.tobytes()]
+    for name in program.names:
+        encoded = name.encode('utf-8')
+        parts.append(NAME.pack(len(encoded)))
+        parts.append(encoded)
+    parts.append(error)
+    for index, text in program.literals.items():
+        encoded = text.encode('utf-8')
+        parts.append(LITERAL.pack(index, len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def decode_program(buffer, offset=0):
+    """
+    Membaca satu record menjadi PostfixProgram.
+
+    Args:
+        buffer (bytes atau mmap): Buffer berisi record
+        offset (int): Posisi awal record
+
+    Returns:
+        PostfixProgram: Program (sama persis dengan yang di-encode)
+
+    Raises:
+        struct.error, ValueError: Jika record rusak/terpotong
+    """
+    (count, depth, max_depth, temps, name_count, error_size,
+     literal_count) = RECORD.unpack_from(buffer, offset)
+    position = offset + RECORD.size
+
+    program = PostfixProgram.__new__(PostfixProgram)
+    program.opcodes = array('B', buffer[position:position + count])
+    position += count
+    program.constants = array('d', buffer[position:position + 8 * count])
+    position += 8 * count
+    if len(program.opcodes) != count or len(program.constants) != count:
+        raise ValueError("Error: Record program terpotong!")
+    if SWAP_BYTES:
+        program.constants.byteswap()
+
+    names = []
+    for _ in range(name_count):
+        (size,) = NAME.unpack_from(buffer, position)
+        position += NAME.size
+        names.append(str(buffer[position:position + size], 'utf-8'))
+        position += size
+    program.names = names
+    program.error = str(buffer[position:position + error_size], 'utf-8') if error_size else None
+    position += error_size
+
+    literals = {}
+    for _ in range(literal_count):
+        index, size = LITERAL.unpack_from(buffer, position)
+        position += LITERAL.size
+        literals[index] = str(buffer[position:position + size], 'utf-8')
+        position += size
+    program.literals = literals
+    program.depth = depth
+    program.max_depth = max_depth
+    program.temps = temps
+    return program
+
+
+class ProgramDiskCache:
+    """
+    Cache PostfixProgram di satu file (mmap read-only, flush atomic).
+
+    Attributes:
+        path (str): Path file cache
+        max_bytes (int): Ukuran file maksimal (perkiraan, termasuk index)
+        hits (int): Jumlah ekspresi yang ditemukan (di file atau pending)
+        misses (int): Jumlah ekspresi yang tidak ditemukan
+        writes (int): Jumlah flush yang menulis file
+        evictions (int): Jumlah entry yang dibuang karena batas ukuran
+
+    Example:
+        cache = ProgramDiskCache("programs.cache")
+        program = cache.get("3 + 4 * 2")          # None (miss)
+        cache.put("3 + 4 * 2", infix_to_program("3 + 4 * 2"))
+        cache.flush()                             # ditulis ke disk
+
+        # Proses lain (atau setelah restart)
+        ProgramDiskCache("programs.cache").get("3 + 4 * 2")   # PostfixProgram('3 4 2 * +')
+    """
+
+    def __init__(self, path, max_bytes=8 * 1024 * 1024):
+        """
+        Membuka cache (file boleh belum ada).
+
+        Args:
+            path (str): Path file cache
+            max_bytes (int): Ukuran file maksimal dalam bytes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._pending = {}      # key → record yang belum ditulis ke file
+        self._used = {}         # key → None, urut hit sejak flush terakhir
+        self._view = None       # (mmap, mask slot, jumlah entry) atau None
+        self._identity = None   # (inode, mtime, size) file yang di-mmap
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self.refresh()
+
+    def refresh(self):
+        """
+        Membuka ulang file jika sudah diganti (misal flush dari proses lain).
+
+        mmap lama tidak ditutup paksa: get() yang sedang berjalan di thread
+        lain tetap membaca file lama sampai selesai.
+
+        Returns:
+            bool: True jika file dibuka ulang
+        """
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            changed = self._identity is not None
+            self._view, self._identity = None, None
+            return changed
+
+        with f:
+            info = os.fstat(f.fileno())
+            identity = (info.st_ino, info.st_mtime_ns, info.st_size)
+            if identity == self._identity:
+                return False
+            self._identity = identity
+            self._view = None
+            if info.st_size < HEADER.size:
+                return True
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, parser, slots, count = HEADER.unpack_from(buffer, 0)
+        valid = ((magic, version, parser) == (MAGIC, FORMAT_VERSION, PARSER_VERSION) and
+                 slots > 0 and slots & (slots - 1) == 0 and count < slots and
+                 HEADER.size + slots * SLOT.size <= len(buffer))
+        if valid:
+            self._view = (buffer, slots - 1, count)
+        return True
+
+    def _find(self, view, key):
+        """
+        Mencari key di index file (linear probing).
+
+        Returns:
+            int atau None: Offset record, None jika tidak ada
+        """
+        buffer, mask, _ = view
+        slot = int.from_bytes(key[:8], 'little') & mask
+        for _ in range(mask + 1):
+            found, offset, length = SLOT.unpack_from(buffer, HEADER.size + slot * SLOT.size)
+            if not length:
+                return None
+            if found == key:
+                return offset
+            slot = (slot + 1) & mask
+        return None
+
+    def get(self, expression):
+        """
+        Mengambil program untuk ekspresi ini.
+
+        Args:
+            expression (str): Ekspresi infix
+
+        Returns:
+            PostfixProgram atau None: Program baru (hasil decode) jika ada,
+                                      None jika miss (atau record rusak)
+        """
+        key = cache_key(expression)
+        record = self._pending.get(key)
+        if record is not None:
+            program = decode_program(record)
+        else:
+            program = None
+            view = self._view
+            if view is not None:
+                offset = self._find(view, key)
+                if offset is not None:
+                    try:
+                        program = decode_program(view[0], offset)
+                    except (struct.error, ValueError):
+                        program = None
+
+        with self._lock:
+            if program is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._used.pop(key, None)   # Pindah ke posisi paling baru
+                self._used[key] = None
+        return program
+
+    def put(self, expression, program):
+        """
+        Menyimpan program (di RAM sampai flush() berikutnya).
+
+        Args:
+            expression (str): Ekspresi infix
+            program (PostfixProgram): Hasil infix_to_program(expression)
+        """
+        key = cache_key(expression)
+        record = encode_program(program)
+        with self._lock:
+            self._pending[key] = record
+
+    def _records(self):
+        """
+        Semua record di file saat ini, urut posisi di file
+        (= urutan dari yang paling baru dipakai saat flush terakhir).
+
+        Returns:
+            list: [(key, record bytes)]
+        """
+        view = self._view
+        if view is None:
+            return []
+        buffer, mask, _ = view
+        slots = []
+        for slot in range(mask + 1):
+            key, offset, length = SLOT.unpack_from(buffer, HEADER.size + slot * SLOT.size)
+            if length and offset + length <= len(buffer):
+                slots.append((offset, key, length))
+        slots.sort()
+        return [(key, buffer[offset:offset + length]) for offset, key, length in slots]
+
+    def flush(self):
+        """
+        Menulis pending ke file (digabung dengan isi file terbaru), atomic.
+
+        Returns:
+            int: Jumlah entry di file baru (0 jika tidak ada yang ditulis)
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+
+            # Gabung dengan file TERBARU (mungkin sudah ditulis proses lain)
+            self.refresh()
+            old = self._records()
+
+            # Urutan recency: pending terbaru, hit terbaru, lalu isi file lama
+            records = {key: self._pending[key] for key in reversed(list(self._pending))}
+            old_records = dict(old)
+            for key in reversed(list(self._used)):
+                if key in old_records:
+                    records.setdefault(key, old_records[key])
+            for key, record in old:
+                records.setdefault(key, record)
+
+            kept = []
+            total = HEADER.size
+            for key, record in records.items():
+                total += len(record) + INDEX_BYTES_PER_ENTRY
+                if total > self.max_bytes:
+                    break
+                kept.append((key, record))
+            self.evictions += len(records) - len(kept)
+
+            self._write(kept)
+            self._pending.clear()
+            self._used.clear()
+            self.writes += 1
+            self.refresh()
+            return len(kept)
+
+    def _write(self, entries):
+        """
+        Menulis file baru lewat file sementara + os.replace (atomic).
+
+        Args:
+            entries (list): [(key, record)], urut dari yang paling baru
+        """
+        slots = 1
+        while slots < 2 * len(entries):
+            slots *= 2
+        mask = slots - 1
+
+        table = bytearray(slots * SLOT.size)
+        offset = HEADER.size + len(table)
+        for key, record in entries:
+            slot = int.from_bytes(key[:8], 'little') & mask
+            while SLOT.unpack_from(table, slot * SLOT.size)[2]:
+                slot = (slot + 1) & mask
+            SLOT.pack_into(table, slot * SLOT.size, key, offset, len(record))
+            offset += len(record)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + '.',
+                                         suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, PARSER_VERSION, slots, len(entries)))
+                f.write(table)
+                f.writelines(record for _, record in entries)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def close(self):
+        """
+        flush() lalu melepas mmap.
+        """
+        self.flush()
+        self._view, self._identity = None, None
+
+    def stats(self):
+        """
+        Snapshot statistik cache.
+
+        Returns:
+            dict: entries (di file), pending, bytes (ukuran file), hits,
+                  misses, writes, evictions
+        """
+        with self._lock:
+            view, identity = self._view, self._identity
+            return {
+                'entries': view[2] if view is not None else 0,
+                'pending': len(self._pending),
+                'bytes': identity[2] if identity is not None else 0,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        view = self._view
+        return (view[2] if view is not None else 0) + len(self._pending)
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing ProgramDiskCache (format, versi, eviction, atomic, multi proses).
+    """
+    import subprocess
+    from Infix_to_Postfix import infix_to_program
+    from Expression_Tree import eliminate_common_subexpressions
+    from Calculator import Calculator
+
+    print("\n" + "="*60)
+    print("TESTING PROGRAM DISK CACHE")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    def same(a, b):
+        return all(getattr(a, field) == getattr(b, field) for field in PostfixProgram.__slots__)
+
+    directory = tempfile.mkdtemp()
+
+    # Test 1: Encode/decode tanpa kehilangan informasi
+    programs = [infix_to_program(expression) for expression in
+                ("3 + 4 * 2", "-x ^ 2 + max(y, 1.5e-3, z)", "sqrt(rate) * (0.1 + rate)")]
+    programs.append(eliminate_common_subexpressions(infix_to_program("(a+b)*(a+b)"))[0])
+    programs.append(PostfixProgram.from_tokens("3 +".split()))
+    check("Encode/decode (variabel, fungsi, temp slot, error)",
+          all(same(program, decode_program(encode_program(program))) for program in programs))
+
+    # Test 2: put → flush → dibaca instance lain (seperti proses baru)
+    path = os.path.join(directory, "programs.cache")
+    cache = ProgramDiskCache(path)
+    check("File belum ada = miss", cache.get("3 + 4 * 2") is None)
+    for expression in ("3 + 4 * 2", "x * (y - 1)", "1 / 0"):
+        cache.put(expression, infix_to_program(expression))
+    check("Pending langsung bisa dibaca", str(cache.get("x * (y - 1)")) == "x y 1 - *")
+    check("flush menulis 3 entry", cache.flush() == 3 and len(ProgramDiskCache(path)) == 3)
+
+    warm = ProgramDiskCache(path)
+    check("Instance baru: hit dari file", str(warm.get("3 + 4 * 2")) == "3 4 2 * +")
+    check("Key ternormalisasi (spasi berlebih)", str(warm.get("  x *   (y - 1) ")) == "x y 1 - *")
+    check("Ekspresi lain = miss", warm.get("3 + 5") is None and warm.stats()['misses'] == 1)
+
+    # Test 3: Versi parser lain diabaikan (lalu ditimpa saat flush)
+    with open(path, 'r+b') as f:
+        f.seek(6)
+        f.write(struct.pack('<H', PARSER_VERSION + 1))
+    stale = ProgramDiskCache(path)
+    check("Versi parser lain = cache kosong", stale.get("3 + 4 * 2") is None and len(stale) == 0)
+    stale.put("2 ^ 10", infix_to_program("2 ^ 10"))
+    stale.flush()
+    check("Flush menimpa file versi lama", len(ProgramDiskCache(path)) == 1)
+
+    # Test 4: Eviction berdasarkan ukuran (yang paling lama dibuang)
+    path = os.path.join(directory, "small.cache")
+    small = ProgramDiskCache(path, max_bytes=4096)
+    for i in range(200):
+        small.put(f"{i} * x + {i}", infix_to_program(f"{i} * x + {i}"))
+    small.flush()
+    check("Ukuran file <= max_bytes", os.path.getsize(path) <= 4096 and small.evictions > 0)
+    check("Entry terbaru tetap ada, terlama dibuang",
+          small.get("199 * x + 199") is not None and small.get("0 * x + 0") is None)
+
+    # Test 5: Atomic - pembaca lama tetap utuh, tanpa file sementara tersisa
+    path = os.path.join(directory, "shared.cache")
+    writer = ProgramDiskCache(path)
+    writer.put("1 + 1", infix_to_program("1 + 1"))
+    writer.flush()
+    reader = ProgramDiskCache(path)
+    writer.put("2 + 2", infix_to_program("2 + 2"))
+    writer.flush()
+    check("mmap lama tetap terbaca setelah file diganti",
+          str(reader.get("1 + 1")) == "1 1 +" and reader.get("2 + 2") is None)
+    check("refresh() melihat entry baru", reader.refresh() and str(reader.get("2 + 2")) == "2 2 +")
+    check("Tidak ada file .tmp tersisa", not [name for name in os.listdir(directory)
+                                            if name.endswith('.tmp')])
+
+    # Test 6: File rusak/terpotong = miss, bukan crash
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 20)
+    broken = ProgramDiskCache(path)
+    check("Record terpotong = miss, record lain tetap terbaca",
+          broken.get("1 + 1") is None and str(broken.get("2 + 2")) == "2 2 +")
+
+    # Test 7: Beberapa proses membaca file yang sama bersamaan
+    path = os.path.join(directory, "workers.cache")
+    cache = ProgramDiskCache(path)
+    expressions = [f"({i} + x) * {i % 7}" for i in range(500)]
+    for expression in expressions:
+        cache.put(expression, infix_to_program(expression))
+    cache.flush()
+    code = ("import sys; from Program_Disk_Cache import ProgramDiskCache; "
+            "cache = ProgramDiskCache(sys.argv[1]); "
+            "print(sum(cache.get(f'({i} + x) * {i % 7}') is not None for i in range(500)))")
+    here = os.path.dirname(os.path.abspath(__file__))
+    workers = [subprocess.Popen([sys.executable, '-c', code, path], cwd=here,
+                                stdout=subprocess.PIPE, text=True) for _ in range(4)]
+    outputs = [worker.communicate()[0].strip() for worker in workers]
+    check("4 proses: semua 500 ekspresi hit", outputs == ['500'] * 4)
+
+    # Test 8: Calculator dengan program_cache - worker baru langsung hangat
+    path = os.path.join(directory, "calc.cache")
+    first = Calculator(program_cache=ProgramDiskCache(path))
+    expected = [first.evaluate(expression, {'x': 2.0}) for expression in expressions]
+    first.program_cache.close()
+    cold = Calculator(program_cache=ProgramDiskCache(path), optimize=True)
+    results = [cold.evaluate(expression, {'x': 2.0}) for expression in expressions]
+    stats = cold.program_cache.stats()
+    check("Calculator baru: semua program dari disk, hasil sama",
+          results == expected and stats['hits'] == 500 and stats['misses'] == 0)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,326 @@
+"""
+Result Cache - Memoization Hasil Ekspresi Konstan
+==================================================
+
+File ini berisi cache HASIL evaluasi (bukan program) untuk ekspresi murni.
+
+KENAPA PERLU CACHE HASIL?
+ExpressionCache menyimpan PostfixProgram, jadi konversi tidak diulang,
+tapi evaluasinya tetap dijalankan setiap kali. Padahal sebagian besar
+traffic adalah ekspresi konstan yang IDENTIK ("100 * 1.1", "2 ^ 10"):
+hasilnya pasti sama, jadi cukup dihitung sekali.
+
+EKSPRESI MURNI:
+Hanya program TANPA variabel yang di-cache (hasilnya hanya bergantung
+pada ekspresi itu sendiri). Fungsi (sqrt, sin, ...) juga murni.
+
+KEY YANG DINORMALISASI:
+Key = stream opcode + konstanta hasil compile (program_key), bukan
+string input. Jadi "3+4", "3 + 4" dan "3.0 + 4" memakai entry yang
+sama: spasi dan penulisan angka tidak berpengaruh.
+
+EVICTION:
+- LRU   : entry yang paling lama tidak dipakai dibuang duluan
+- TTL   : entry lebih tua dari `ttl` detik dianggap tidak ada (expired)
+- Bytes : total estimasi memory dibatasi `max_bytes`
+
+ERROR JUGA DI-CACHE:
+Error yang deterministik (ZeroDivisionError, ValueError, OverflowError)
+disimpan sebagai (tipe, pesan). Saat hit, error yang SAMA di-raise lagi
+(object exception baru, supaya traceback tidak menumpuk antar thread).
+
+THREAD SAFETY:
+Semua akses ke struktur internal dilindungi satu threading.Lock, jadi
+satu ResultCache boleh dipakai bersama oleh banyak thread. Evaluasi
+sendiri dijalankan DI LUAR lock (thread lain tidak menunggu).
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# program_key ada di Postfix_Program.py (di-import ulang di sini untuk kompatibilitas)
+from Postfix_Program import program_key
+
+
+class ResultCache:
+    """
+    Cache hasil evaluasi dengan LRU + TTL + batas bytes, thread-safe.
+
+    Attributes:
+        max_entries (int): Jumlah entry maksimal (None = tidak dibatasi)
+        ttl (float): Umur maksimal entry dalam detik (None = tidak expired)
+        max_bytes (int): Total estimasi bytes maksimal (None = tidak dibatasi)
+        hits (int): Jumlah cache hit (termasuk hit error)
+        misses (int): Jumlah cache miss (termasuk entry expired)
+        evictions (int): Jumlah entry yang dibuang karena batas entry/bytes
+        expirations (int): Jumlah entry yang dibuang karena TTL
+
+    Example:
+        cache = ResultCache(max_entries=1000, ttl=60)
+        cache.get_or_compute(key, run_program, program)   # miss → dihitung
+        cache.get_or_compute(key, run_program, program)   # hit
+        cache.hit_ratio                                   # 0.5
+    """
+
+    def __init__(self, max_entries=1024, ttl=None, max_bytes=None, clock=time.monotonic):
+        """
+        Membuat cache kosong.
+
+        Args:
+            max_entries (int): Jumlah entry maksimal (None = tidak dibatasi)
+            ttl (float, optional): Umur maksimal entry (detik)
+            max_bytes (int, optional): Batas total estimasi bytes
+            clock (callable): Sumber waktu (bisa diganti untuk testing)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        # key → (is_error, value, expires_at, size); urutan = urutan pemakaian
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_compute(self, key, compute, *args):
+        """
+        Mengambil hasil dari cache, atau menghitung lalu menyimpannya.
+
+        Args:
+            key (bytes): Key ter-normalisasi (lihat program_key)
+            compute (callable): Fungsi evaluasi, dipanggil compute(*args)
+            *args: Argumen untuk compute
+
+        Returns:
+            Hasil evaluasi
+
+        Raises:
+            ValueError / ArithmeticError: Error evaluasi (juga saat hit
+                                          error yang tersimpan)
+        """
+        with self._lock:
+            entry = self._lookup(key)
+
+        if entry is not None:
+            is_error, value = entry
+            if is_error:
+                error_type, message = value
+                raise error_type(message)
+            return value
+
+        # Evaluasi di luar lock: thread lain tetap bisa memakai cache
+        try:
+            result = compute(*args)
+        except (ValueError, ArithmeticError) as e:
+            # Error deterministik: ekspresi yang sama pasti error yang sama
+            self._store(key, True, (type(e), str(e)))
+            raise
+        self._store(key, False, result)
+        return result
+
+    def _lookup(self, key):
+        """
+        Cari entry (harus dipanggil dengan lock). Entry expired dibuang.
+
+        Returns:
+            tuple atau None: (is_error, value) jika hit
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        is_error, value, expires_at, size = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[key]
+            self.total_bytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return is_error, value
+
+    def _store(self, key, is_error, value):
+        """
+        Simpan entry lalu evict jika melewati batas.
+        """
+        if self.max_entries == 0:
+            return
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        if is_error:
+            size += sys.getsizeof(value[1])
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[3]
+            self._entries[key] = (is_error, value, expires_at, size)
+            self.total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        """
+        Buang entry paling lama sampai batas entry dan bytes terpenuhi
+        (harus dipanggil dengan lock).
+        """
+        while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            _, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry[3]
+            self.evictions += 1
+
+    @property
+    def hit_ratio(self):
+        """
+        Rasio hit terhadap semua lookup (0.0 jika belum ada lookup).
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """
+        Mengosongkan cache (counter tidak di-reset).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """
+        Snapshot statistik cache.
+
+        Returns:
+            dict: entries, bytes, hits, misses, evictions, expirations, hit_ratio
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': self.hit_ratio,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing ResultCache (normalisasi key, LRU, TTL, bytes, error, thread).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from Infix_to_Postfix import infix_to_program
+    from Postfix_VM import run_program
+
+    print("\n" + "="*60)
+    print("TESTING RESULT CACHE")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    calls = []
+
+    def counted(program):
+        calls.append(program)
+        return run_program(program)
+
+    def cached(cache, infix):
+        program = infix_to_program(infix)
+        return cache.get_or_compute(program_key(program), counted, program)
+
+    # Test 1: Key dinormalisasi (spasi, penulisan angka)
+    cache = ResultCache()
+    cached(cache, "3 + 4 * 2")
+    check("'3+4*2' dan '3.0 + 4 * 2' memakai entry yang sama",
+          cached(cache, "3+4*2") == cached(cache, "3.0 + 4 * 2") == 11.0 and len(calls) == 1)
+    check("Hit ratio 2/3", abs(cache.hit_ratio - 2 / 3) < 1e-9)
+
+    # Test 2: Error deterministik di-cache
+    calls.clear()
+    messages = []
+    for _ in range(2):
+        try:
+            cached(cache, "1 / 0")
+        except ZeroDivisionError as e:
+            messages.append(str(e))
+    check("Pembagian nol di-cache (evaluasi sekali, pesan sama)",
+          len(calls) == 1 and len(messages) == 2 and messages[0] == messages[1])
+
+    # Test 3: LRU
+    cache = ResultCache(max_entries=2)
+    cached(cache, "1 + 1")
+    cached(cache, "2 + 2")
+    cached(cache, "1 + 1")      # "1 + 1" paling baru
+    cached(cache, "3 + 3")      # "2 + 2" di-evict
+    calls.clear()
+    cached(cache, "1 + 1")
+    check("LRU eviction", len(calls) == 0 and cache.evictions == 1)
+
+    # Test 4: TTL (clock palsu)
+    now = [0.0]
+    cache = ResultCache(ttl=10, clock=lambda: now[0])
+    cached(cache, "5 * 5")
+    now[0] = 9.9
+    calls.clear()
+    cached(cache, "5 * 5")
+    check("Belum expired sebelum TTL", len(calls) == 0)
+    now[0] = 10.0
+    cached(cache, "5 * 5")
+    check("Expired setelah TTL", len(calls) == 1 and cache.expirations == 1)
+
+    # Test 5: Batas bytes
+    cache = ResultCache(max_entries=None, max_bytes=300)
+    for i in range(20):
+        cached(cache, f"{i} + 1")
+    check(f"Batas bytes ({cache.total_bytes} <= 300)", 0 < cache.total_bytes <= 300)
+
+    # Test 6: Dipakai bersama oleh banyak thread
+    cache = ResultCache(max_entries=50)
+    programs = [infix_to_program(f"{i % 100} * 3 + 1") for i in range(5000)]
+
+    def worker(program):
+        return cache.get_or_compute(program_key(program), run_program, program)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, programs))
+    stats = cache.stats()
+    check("8 thread: hasil benar",
+          results == [(i % 100) * 3 + 1.0 for i in range(5000)])
+    check("8 thread: counter konsisten",
+          stats['hits'] + stats['misses'] == 5000 and stats['entries'] <= 50)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -11,6 +11,8 @@ Author: Fadli Ghafatul Hijriah
 Date: Februari 2026
 """
 
+from array import array
+
 
 class Stack:
     """
@@ -212,6 +214,200 @@ class Stack:
         return f"Stack({self.items})"
 
 
+class FloatStack:
+    """
+    Stack khusus angka (float) berbasis array('d') dengan index top manual.
+    
+    Dipakai evaluator untuk menyimpan operand. Berbeda dengan Stack:
+    - Data disimpan di array('d') yang sudah dialokasikan (preallocated),
+      jadi angka disimpan sebagai double mentah, bukan object float per item
+    - Posisi top disimpan di integer `_top`; pop/peek tidak memanggil
+      is_empty() atau len() setiap kali
+    - clear() hanya me-reset top (tidak membuat array baru)
+    - Ada reserve()/capacity() dan operasi bulk push_many()/pop_many()
+    - Memakai __slots__ (tanpa __dict__ per object)
+    
+    API dasarnya sama dengan Stack (push, pop, peek, is_empty, size,
+    clear), jadi bisa langsung menggantikan Stack untuk operand angka.
+    
+    Attributes:
+        _data (array): Buffer angka (kapasitas >= jumlah item)
+        _top (int): Jumlah item di stack (= index slot kosong berikutnya)
+    
+    Example:
+        stack = FloatStack(capacity=8)
+        stack.push(5)             # Disimpan sebagai 5.0
+        stack.push_many([1, 2])   # FloatStack: [5.0, 1.0, 2.0]
+        stack.pop_many(2)         # [1.0, 2.0]
+    """
+    
+    __slots__ = ('_data', '_top')
+    
+    def __init__(self, capacity=16):
+        """
+        Membuat stack kosong dengan kapasitas awal.
+        
+        Args:
+            capacity (int): Jumlah slot yang dialokasikan di awal
+        """
+        # bytes(8 * n) = n buah double bernilai 0.0
+        self._data = array('d', bytes(8 * max(capacity, 1)))
+        self._top = 0
+    
+    
+    def reserve(self, capacity):
+        """
+        Memastikan kapasitas minimal `capacity` slot (tanpa alokasi ulang
+        jika sudah cukup). Berguna jika kedalaman maksimal sudah diketahui,
+        misal dari PostfixProgram.max_depth.
+        
+        Args:
+            capacity (int): Kapasitas minimal
+        """
+        missing = capacity - len(self._data)
+        if missing > 0:
+            self._data.extend(array('d', bytes(8 * missing)))
+    
+    
+    def capacity(self):
+        """
+        Mengembalikan jumlah slot yang sudah dialokasikan.
+        
+        Returns:
+            int: Kapasitas buffer
+        """
+        return len(self._data)
+    
+    
+    def push(self, item):
+        """
+        Menambahkan angka ke top. Buffer digandakan jika penuh.
+        
+        Args:
+            item (float): Angka (int/float, disimpan sebagai double)
+        
+        Raises:
+            TypeError: Jika item bukan bilangan real
+        """
+        top = self._top
+        if top == len(self._data):
+            self.reserve(2 * top)
+        self._data[top] = item
+        self._top = top + 1
+    
+    
+    def push_many(self, items):
+        """
+        Push banyak angka sekaligus (item terakhir menjadi top).
+        
+        Args:
+            items (iterable): Angka-angka yang akan di-push
+        """
+        values = array('d', items)
+        top = self._top
+        end = top + len(values)
+        self.reserve(end)
+        self._data[top:end] = values
+        self._top = end
+    
+    
+    def pop(self):
+        """
+        Menghapus dan mengembalikan angka di top.
+        
+        Returns:
+            float: Angka di top
+        
+        Raises:
+            IndexError: Jika stack kosong
+        """
+        top = self._top
+        if top == 0:
+            raise IndexError("Pop from empty stack! Stack sudah kosong, tidak ada item untuk diambil.")
+        top -= 1
+        self._top = top
+        return self._data[top]
+    
+    
+    def pop_many(self, count):
+        """
+        Pop `count` angka sekaligus.
+        
+        Args:
+            count (int): Jumlah angka yang di-pop
+        
+        Returns:
+            list: Angka yang di-pop, urut dari bawah ke atas
+                  (elemen terakhir = yang tadinya top)
+        
+        Raises:
+            IndexError: Jika isi stack kurang dari count
+        """
+        top = self._top
+        if count > top:
+            raise IndexError(f"Pop {count} item dari stack yang hanya berisi {top} item!")
+        start = top - count
+        self._top = start
+        return self._data[start:top].tolist()
+    
+    
+    def peek(self):
+        """
+        Melihat angka di top tanpa menghapusnya.
+        
+        Returns:
+            float: Angka di top
+        
+        Raises:
+            IndexError: Jika stack kosong
+        """
+        if self._top == 0:
+            raise IndexError("Peek from empty stack! Stack kosong, tidak ada item untuk dilihat.")
+        return self._data[self._top - 1]
+    
+    
+    def is_empty(self):
+        """
+        Returns:
+            bool: True jika stack kosong
+        """
+        return self._top == 0
+    
+    
+    def size(self):
+        """
+        Returns:
+            int: Jumlah angka di stack
+        """
+        return self._top
+    
+    
+    def clear(self):
+        """
+        Mengosongkan stack. Buffer TIDAK dialokasikan ulang,
+        hanya top yang di-reset ke 0.
+        """
+        self._top = 0
+    
+    
+    @property
+    def items(self):
+        """
+        Snapshot isi stack sebagai list (bottom → top), sama seperti Stack.items.
+        """
+        return self._data[:self._top].tolist()
+    
+    
+    def __str__(self):
+        if self._top == 0:
+            return "Stack: [] (Empty)"
+        return f"Stack: {self.items} (Top: {self.peek()})"
+    
+    
+    def __repr__(self):
+        return f"FloatStack({self.items})"
+
+
 # ============================================================================
 # TESTING SECTION - Untuk memastikan Stack bekerja dengan benar
 # ============================================================================
@@ -303,6 +499,22 @@ if __name__ == "__main__":
     print(f"Stack dengan berbagai tipe: {stack}")
     print()
     
+    # Test 10: FloatStack (stack angka berbasis array)
+    print("Test 10: FloatStack dengan reserve dan operasi bulk")
+    float_stack = FloatStack(capacity=2)
+    float_stack.push(5)
+    float_stack.push_many([1, 2, 3])      # Melebihi kapasitas awal → tumbuh
+    print(f"Setelah push_many: {float_stack} (capacity: {float_stack.capacity()})")
+    print(f"pop_many(2): {float_stack.pop_many(2)}")   # [2.0, 3.0]
+    print(f"pop(): {float_stack.pop()}")              # 1.0
+    float_stack.clear()
+    print(f"Setelah clear: {float_stack}, capacity tetap {float_stack.capacity()}")
+    try:
+        float_stack.pop()
+    except IndexError as e:
+        print(f"Error tertangkap: {e}")
+    print()
+    
     print("=" * 60)
     print("SEMUA TEST SELESAI! ✅")
     print("=" * 60)
\ No newline at end of file
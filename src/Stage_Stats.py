@@ -0,0 +1,314 @@
+"""
+Stage Stats - Timer per Tahap Perhitungan
+==========================================
+
+File ini berisi instrumentasi ringan untuk Calculator.calculate().
+
+KENAPA PERLU?
+Tanpa angka, kita tidak tahu waktu calculate() habis di mana: validasi
+input, konversi infix → postfix, evaluasi, append history, atau menulis
+output. StageStats mengumpulkan per Calculator:
+- jumlah panggilan per tahap
+- total waktu per tahap
+- p50 / p99 dari sampel terbaru (ring buffer per tahap)
+- jumlah token postfix yang dievaluasi
+
+BIAYA:
+- Jam: time.perf_counter_ns() (monotonic, resolusi nanodetik)
+- Saat DIMATIKAN (enabled=False): calculate() hanya membaca satu
+  atribut, tidak ada pemanggilan jam sama sekali
+- Saat aktif: hot path hanya menulis angka jam ke list marks, lalu
+  record() menyimpan list itu apa adanya (satu lock + satu append)
+- Selisih waktu, counter per tahap, ring buffer sampel dan persentil
+  dihitung belakangan: per batch `samples` perhitungan, atau saat
+  stats() dipanggil
+
+Bisa dinyalakan/dimatikan kapan saja (calc.stage_stats.enabled = True).
+Benchmark: stats.calculate_off (mati) vs stats.calculate_on (aktif).
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import math
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+
+# Tahap di Calculator.calculate(), urut sesuai workflow
+STAGES = ('validate', 'convert', 'evaluate', 'history', 'output')
+
+# Posisi jam di list marks, urut sesuai EKSEKUSI di calculate() (output
+# ditulis sebelum history). marks[i] = jam saat tahap MARK_STAGES[i] mulai
+# (0 = tahap tidak dijalankan, misal error di tengah), marks[-1] = jam selesai.
+# List baru: [perf_counter_ns(), 0, 0, 0, 0, 0]
+MARK_STAGES = ('validate', 'convert', 'evaluate', 'output', 'history')
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Persentil nearest-rank dari sampel yang sudah diurutkan.
+
+    Args:
+        sorted_samples (list): Sampel terurut (tidak boleh kosong)
+        fraction (float): 0.5 untuk p50, 0.99 untuk p99
+
+    Returns:
+        Nilai sampel pada persentil tersebut
+
+    Example:
+        percentile([1, 2, 3, 4], 0.5)   # 2
+    """
+    index = max(0, math.ceil(len(sorted_samples) * fraction) - 1)
+    return sorted_samples[index]
+
+
+class StageStats:
+    """
+    Counter + timer per tahap, thread-safe, bisa dinyalakan saat runtime.
+
+    Attributes:
+        enabled (bool): Rekam atau tidak (boleh diubah kapan saja)
+        samples (int): Jumlah sampel terbaru per tahap untuk persentil
+        calls (int): Jumlah perhitungan yang direkam
+        tokens (int): Total token postfix dari perhitungan yang direkam
+
+    Example:
+        stats = StageStats(enabled=True)
+        marks = [perf_counter_ns(), 0, 0, 0, 0, 0]   # validate dimulai
+        ...
+        marks[1] = perf_counter_ns()                 # convert dimulai
+        ...
+        marks[-1] = perf_counter_ns()                # selesai
+        stats.record(marks, tokens=5)
+        stats.snapshot()['stages']['convert']['p50_us']
+    """
+
+    def __init__(self, enabled=False, samples=1024):
+        """
+        Args:
+            enabled (bool): Langsung aktif atau tidak
+            samples (int): Ukuran ring buffer sampel per tahap
+        """
+        self.enabled = enabled
+        self.samples = samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Menghapus semua counter dan sampel (enabled tidak berubah).
+        """
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        """
+        Isi reset(); pemanggil harus memegang self._lock.
+        """
+        self.calls = 0
+        self.tokens = 0
+        self._pending = []
+        self._counts = dict.fromkeys(STAGES, 0)
+        self._totals = dict.fromkeys(STAGES, 0)
+        self._samples = {stage: deque(maxlen=self.samples) for stage in STAGES}
+
+    def record(self, marks, tokens=0):
+        """
+        Merekam satu perhitungan dari list jam (lihat MARK_STAGES).
+
+        Hot path: list marks disimpan apa adanya. Selisih waktu per tahap
+        dihitung per batch oleh _fold() (setiap `samples` perhitungan, dan
+        saat snapshot), jadi memory pending tetap terbatas.
+
+        Args:
+            marks (list): Jam per posisi MARK_STAGES, contoh [t0, t1, 0, t3, 0, t5]:
+                          validate t0→t1, convert t1→t3 (evaluate tidak
+                          dijalankan), output t3→t5 (history tidak dijalankan)
+            tokens (int): Jumlah token postfix program
+        """
+        with self._lock:
+            self.calls += 1
+            self.tokens += tokens
+            pending = self._pending
+            pending.append(marks)
+            if len(pending) >= self.samples:
+                self._fold()
+
+    def _fold(self):
+        """
+        Mengolah marks pending menjadi counter, total dan sampel per tahap.
+
+        Pemanggil harus memegang self._lock.
+        """
+        counts = self._counts
+        totals = self._totals
+        samples = self._samples
+        complete = []
+        for marks in self._pending:
+            if all(marks):
+                complete.append(marks)
+                continue
+            # Ada tahap yang tidak dijalankan (error): durasi sampai mark berikutnya
+            begin = marks[0]
+            stage = MARK_STAGES[0]
+            for index in range(1, len(marks)):
+                end = marks[index]
+                if end:
+                    elapsed = end - begin
+                    counts[stage] += 1
+                    totals[stage] += elapsed
+                    samples[stage].append(elapsed)
+                    if index < len(MARK_STAGES):
+                        begin, stage = end, MARK_STAGES[index]
+
+        # Jalur umum (semua tahap dijalankan): per kolom, tanpa loop per tahap
+        if complete:
+            for index, stage in enumerate(MARK_STAGES):
+                column = [marks[index + 1] - marks[index] for marks in complete]
+                counts[stage] += len(column)
+                totals[stage] += sum(column)
+                samples[stage].extend(column)
+        self._pending = []
+
+    def snapshot(self, reset=False):
+        """
+        Snapshot statistik (waktu dalam mikrodetik).
+
+        Args:
+            reset (bool): Jika True, counter di-reset setelah snapshot
+                          (dalam lock yang sama: perhitungan yang direkam
+                          di antaranya tidak hilang)
+
+        Returns:
+            dict: {'enabled', 'calls', 'tokens', 'stages': {stage: {'count',
+                  'total_ms', 'mean_us', 'p50_us', 'p99_us'}}}
+        """
+        with self._lock:
+            self._fold()
+            counts = self._counts
+            totals = self._totals
+            samples = self._samples
+            calls, tokens = self.calls, self.tokens
+            if reset:
+                # Object lama tidak dipakai lagi, jadi tidak perlu disalin
+                self._clear()
+            else:
+                counts = dict(counts)
+                totals = dict(totals)
+                samples = {stage: list(values) for stage, values in samples.items()}
+
+        stages = {}
+        for stage in STAGES:
+            count = counts[stage]
+            ordered = sorted(samples[stage])
+            stages[stage] = {
+                'count': count,
+                'total_ms': totals[stage] / 1e6,
+                'mean_us': totals[stage] / count / 1e3 if count else 0.0,
+                'p50_us': percentile(ordered, 0.50) / 1e3 if ordered else 0.0,
+                'p99_us': percentile(ordered, 0.99) / 1e3 if ordered else 0.0,
+            }
+
+        return {'enabled': self.enabled, 'calls': calls, 'tokens': tokens, 'stages': stages}
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing StageStats (counter, persentil, reset, thread, on/off).
+    """
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    from Calculator import Calculator
+
+    print("\n" + "="*60)
+    print("TESTING STAGE STATS")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    # Test 1: Persentil nearest-rank
+    values = list(range(1, 101))
+    check("p50 / p99 dari 1..100", percentile(values, 0.5) == 50 and percentile(values, 0.99) == 99)
+    check("Persentil satu sampel", percentile([7], 0.99) == 7)
+
+    # Test 2: Record + snapshot
+    stats = StageStats(enabled=True)
+    for elapsed in range(1000, 101000, 1000):
+        # validate 0 ns, convert elapsed, evaluate 2 * elapsed, output/history tidak ada
+        stats.record([1, 1, 1 + elapsed, 0, 0, 1 + 3 * elapsed], tokens=3)
+    snapshot = stats.snapshot()
+    convert = snapshot['stages']['convert']
+    check("Counter calls/tokens", snapshot['calls'] == 100 and snapshot['tokens'] == 300)
+    check("p50/p99 convert (us)", convert['p50_us'] == 50.0 and convert['p99_us'] == 99.0)
+    check("Tahap yang tidak direkam = 0", snapshot['stages']['history']['count'] == 0)
+    check("Selisih marks per tahap (tahap yang dilewati = 0)",
+          snapshot['stages']['validate']['total_ms'] == 0.0 and
+          snapshot['stages']['evaluate']['p50_us'] == 100.0 and
+          snapshot['stages']['output']['count'] == 0)
+    stats.snapshot(reset=True)
+    check("reset", stats.snapshot()['calls'] == 0)
+
+    # Test 2b: Batch pending diolah setiap `samples` perhitungan
+    stats = StageStats(enabled=True, samples=4)
+    for _ in range(10):
+        stats.record([1, 2, 4, 7, 11, 16], tokens=1)
+    check("Pending terbatas (samples=4)", len(stats._pending) < 4)
+    stages = stats.snapshot()['stages']
+    check("Semua perhitungan dihitung walaupun sampel dibatasi",
+          stages['history']['count'] == 10 and stages['history']['total_ms'] == 50 / 1e6 and
+          stages['evaluate']['p99_us'] == 0.003)
+
+    # Test 3: Terpasang di Calculator, bisa dinyalakan saat runtime
+    calc = Calculator(output=io.StringIO())
+    calc.calculate("1 + 1")
+    check("Default mati: tidak ada yang direkam", calc.stats()['calls'] == 0)
+    calc.stage_stats.enabled = True
+    calc.calculate("3 + 4 * 2")
+    try:
+        calc.calculate("1 / 0")
+    except ZeroDivisionError:
+        pass
+    snapshot = calc.stats()
+    stages = snapshot['stages']
+    check("Semua tahap terekam", all(stages[stage]['count'] >= 1 for stage in STAGES))
+    check("Error di evaluasi: history tidak dihitung",
+          snapshot['calls'] == 2 and stages['evaluate']['count'] == 2 and
+          stages['history']['count'] == 1)
+    check("Token postfix dihitung (5 + 3)", snapshot['tokens'] == 8)
+
+    # Test 4: Banyak thread memakai Calculator yang sama
+    calc.stats(reset=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(calc.calculate, [f"{i} * 2" for i in range(800)]))
+    check("8 thread: 800 perhitungan terekam", calc.stats()['calls'] == 800)
+
+    # Test 5: snapshot(reset=True) saat thread lain merekam: tidak ada yang hilang
+    calc.stats(reset=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(calc.calculate, f"{i} + 1") for i in range(2000)]
+        taken = 0
+        while not all(future.done() for future in futures):
+            taken += calc.stats(reset=True)['calls']
+    taken += calc.stats(reset=True)['calls']
+    check("snapshot(reset=True) atomic: 2000 perhitungan", taken == 2000)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,325 @@
+"""
+Stream Evaluator - CLI untuk File Ekspresi Besar
+=================================================
+
+File ini berisi entry point NON-INTERAKTIF untuk mengevaluasi ekspresi
+dari file (atau stdin) baris per baris.
+
+PIPELINE (semua berupa generator):
+    read_lines()  →  evaluate_lines()  →  write_buffered()
+    (baca baris)     (hitung hasil)       (tulis per batch)
+
+Karena setiap tahap adalah generator, hanya satu batch kecil yang ada
+di memory pada satu waktu. Memory tetap konstan walaupun file input
+berukuran beberapa GB.
+
+FORMAT OUTPUT (satu baris per ekspresi):
+    7.0
+    ERROR line 2: ZeroDivisionError: Error: Pembagian dengan nol tidak diperbolehkan!
+
+Baris kosong dan baris yang diawali '#' dilewati.
+Di akhir, statistik (jumlah baris dan lines/sec) ditulis ke stderr.
+
+CARA PAKAI:
+    python Stream_Evaluator.py expressions.txt
+    python Stream_Evaluator.py expressions.txt -o results.txt
+    cat expressions.txt | python Stream_Evaluator.py - --echo
+    python Stream_Evaluator.py invoices.txt --backend decimal
+    python Stream_Evaluator.py --self-test
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import argparse
+import sys
+import time
+
+
+def read_lines(stream):
+    """
+    Membaca ekspresi dari stream baris per baris.
+
+    Args:
+        stream: File-like object (text mode)
+
+    Yields:
+        tuple: (line_number, expression) untuk setiap baris yang tidak kosong
+    """
+    for line_number, line in enumerate(stream, 1):
+        expression = line.strip()
+        if not expression or expression.startswith('#'):
+            continue
+        yield line_number, expression
+
+
+def evaluate_lines(lines, calc, echo=False):
+    """
+    Mengevaluasi setiap ekspresi dan mengubahnya menjadi baris output.
+
+    Error per baris tidak menghentikan stream, tapi ditulis sebagai
+    baris "ERROR line N: ...".
+
+    Args:
+        lines (iterable): (line_number, expression) dari read_lines()
+        calc (Calculator): Calculator untuk evaluasi (tanpa output)
+        echo (bool): Jika True, sertakan ekspresi di output ("expr = hasil")
+
+    Yields:
+        str: Baris output (tanpa newline)
+    """
+    evaluate = calc.evaluate
+    for line_number, expression in lines:
+        try:
+            result = evaluate(expression)
+        except (ValueError, ArithmeticError) as e:
+            yield f"ERROR line {line_number}: {type(e).__name__}: {e}"
+            continue
+        if echo:
+            yield f"{expression} = {result}"
+        else:
+            yield str(result)
+
+
+def write_buffered(output, lines, batch_size=4096):
+    """
+    Menulis baris output per batch (bulk write), bukan satu per satu.
+
+    Args:
+        output: File-like object tujuan
+        lines (iterable): Baris output (tanpa newline)
+        batch_size (int): Jumlah baris per write()
+
+    Returns:
+        int: Jumlah baris yang ditulis
+    """
+    count = 0
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            output.write('\n'.join(batch) + '\n')
+            count += len(batch)
+            batch = []
+    if batch:
+        output.write('\n'.join(batch) + '\n')
+        count += len(batch)
+    return count
+
+
+def run_stream(input_stream, output_stream, calc=None, echo=False, batch_size=4096):
+    """
+    Menjalankan seluruh pipeline streaming.
+
+    Args:
+        input_stream: File-like object sumber ekspresi
+        output_stream: File-like object tujuan hasil
+        calc (Calculator, optional): Calculator yang dipakai (default: baru)
+        echo (bool): Sertakan ekspresi di output
+        batch_size (int): Jumlah baris per bulk write
+
+    Returns:
+        tuple: (jumlah baris, waktu dalam detik)
+    """
+    if calc is None:
+        from Calculator import Calculator
+        calc = Calculator()
+
+    start = time.perf_counter()
+    count = write_buffered(output_stream,
+                           evaluate_lines(read_lines(input_stream), calc, echo),
+                           batch_size)
+    return count, time.perf_counter() - start
+
+
+def main(argv=None):
+    """
+    Entry point CLI.
+
+    Args:
+        argv (list, optional): Argumen command line (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(
+        description="Evaluasi ekspresi dari file/stdin secara streaming.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="File input (default: '-' = stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="File output (default: '-' = stdout)")
+    parser.add_argument('--echo', action='store_true',
+                        help="Tulis 'ekspresi = hasil' bukan hasil saja")
+    parser.add_argument('--engine', default='vm', choices=['vm', 'codegen', 'stack'],
+                        help="Engine evaluasi (default: vm)")
+    parser.add_argument('--backend', default='float', choices=['float', 'decimal', 'fraction'],
+                        help="Backend angka (default: float)")
+    parser.add_argument('--batch-size', type=int, default=4096,
+                        help="Jumlah baris per bulk write (default: 4096)")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Jalankan testing section lalu keluar")
+    args = parser.parse_args(argv)
+
+    if args.self_test:
+        return self_test()
+
+    from Calculator import Calculator
+    calc = Calculator(engine=args.engine, backend=args.backend)
+
+    input_stream = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    # Buffer output besar (1 MB) supaya write ke disk/pipe jarang terjadi
+    output_stream = (sys.stdout if args.output == '-'
+                     else open(args.output, 'w', encoding='utf-8', buffering=1 << 20))
+
+    try:
+        count, elapsed = run_stream(input_stream, output_stream, calc,
+                                    args.echo, args.batch_size)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"{count} lines in {elapsed:.3f}s ({rate:,.0f} lines/sec)", file=sys.stderr)
+    return 0
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+def self_test():
+    """
+    Testing stream evaluator: pipeline streaming, baris error, dan pemilihan
+    engine/backend lewat main(argv) (stdin/stdout diganti StringIO).
+
+    Returns:
+        int: Exit code (0 jika semua test lulus)
+    """
+    import io
+    import os
+    import tempfile
+    import Calculator as calculator_module
+
+    print("\n" + "="*60)
+    print("TESTING STREAM EVALUATOR")
+    print("="*60 + "\n")
+
+    counts = {'passed': 0, 'failed': 0}
+
+    def check(name, condition):
+        if condition:
+            print(f"✅ PASS - {name}")
+            counts['passed'] += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            counts['failed'] += 1
+
+    def run_main(argv, text):
+        # main() dengan stdin/stdout/stderr palsu → (exit code, stdout)
+        streams = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(text), io.StringIO(), io.StringIO()
+        try:
+            code = main(argv)
+            return code, sys.stdout.getvalue()
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = streams
+
+    text = "3 + 4\n\n# komentar\n1 / 0\n  2 * ( 3 + 1 )  \n3 $ 4\n0.1 + 0.2\n"
+
+    # Test 1: Hasil per baris, baris kosong/komentar dilewati, error per baris
+    code, output = run_main([], text)
+    check("Exit code 0 walaupun ada baris error", code == 0)
+    check("Hasil dan baris error", output.splitlines() == [
+        "7.0",
+        "ERROR line 4: ZeroDivisionError: Error: Pembagian dengan nol tidak diperbolehkan!",
+        "8.0",
+        "ERROR line 6: ValueError: Error: Karakter '$' tidak dikenal (posisi 2)!",
+        "0.30000000000000004",
+    ])
+
+    # Test 2: --echo
+    code, output = run_main(['--echo'], "3 + 4\n")
+    check("--echo", output == "3 + 4 = 7.0\n")
+
+    # Test 3: Streaming: baris dibaca per batch, bukan seluruh input dulu
+    read = []
+
+    def source(total=10):
+        for i in range(total):
+            read.append(i)
+            yield f"{i} + 1\n"
+
+    class Output:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, chunk):
+            # Saat write pertama, baru satu batch yang sudah dibaca
+            self.writes.append((chunk, len(read)))
+
+    output = Output()
+    count, _ = run_stream(source(), output, batch_size=4)
+    check("Jumlah baris", count == 10)
+    check("Write per batch", [chunk.count('\n') for chunk, _ in output.writes] == [4, 4, 2])
+    check("Input dibaca per batch", [seen for _, seen in output.writes] == [4, 8, 10])
+
+    # Test 4: Pemilihan engine (hasil sama, engine yang dipilih benar-benar dipakai)
+    outputs = {}
+    for engine in ('vm', 'codegen', 'stack'):
+        used = []
+        original = calculator_module.ENGINES[engine]
+
+        def spy(*args, _original=original, **kwargs):
+            used.append(True)
+            return _original(*args, **kwargs)
+
+        calculator_module.ENGINES[engine] = spy
+        try:
+            outputs[engine] = run_main(['--engine', engine], text)[1]
+        finally:
+            calculator_module.ENGINES[engine] = original
+        check(f"--engine {engine} dipakai", bool(used))
+    check("Semua engine sama", outputs['vm'] == outputs['codegen'] == outputs['stack'])
+
+    # Test 5: Pemilihan backend
+    lines = "0.1 + 0.2\n1 / 3\n1 / 0\n"
+    expected = {
+        'float': ["0.30000000000000004", "0.3333333333333333"],
+        'decimal': ["0.3", "0.3333333333333333333333333333"],
+        'fraction': ["3/10", "1/3"],
+    }
+    for backend, results in expected.items():
+        output = run_main(['--backend', backend], lines)[1].splitlines()
+        check(f"--backend {backend}",
+              output[:2] == results and output[2].startswith("ERROR line 3: ZeroDivisionError"))
+
+    # Test 6: File input/output (-o) dan pilihan yang tidak dikenal
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, 'input.txt')
+        target_path = os.path.join(directory, 'output.txt')
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        code, output = run_main([source_path, '-o', target_path], '')
+        with open(target_path, encoding='utf-8') as f:
+            check("File input/output", code == 0 and output == '' and
+                  f.read() == run_main([], text)[1])
+    try:
+        run_main(['--engine', 'tree'], '')
+        check("Engine tidak dikenal ditolak", False)
+    except SystemExit as e:
+        check("Engine tidak dikenal ditolak", e.code == 2)
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {counts['passed']} passed, {counts['failed']} failed")
+    print("="*60)
+    return 0 if counts['failed'] == 0 else 1
+
+
+# ============================================================================
+# MAIN PROGRAM
+# ============================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Tokenizer - Single-Pass Regex Scanner
+======================================
+
+File ini berisi tokenizer untuk ekspresi infix.
+
+KENAPA PERLU TOKENIZER?
+Loop per karakter di infix_to_program() membangun angka dengan
+`current_number += char` (string baru setiap karakter) dan memanggil
+beberapa fungsi per karakter. Untuk ekspresi panjang, itu lambat.
+
+Tokenizer ini memakai SATU regex yang dijalankan oleh engine regex (C):
+setiap match langsung menghasilkan satu token utuh, tanpa concat string.
+
+FITUR:
+1. Tidak butuh spasi:      "3+4*2", "(5+6)*2", "x^2-1"
+2. Notasi ilmiah:          "1.5e3", "2E-4"
+3. Fungsi dan koma:        "sqrt(x)", "max(a, b, 3)"
+4. Token bertipe + posisi: tuple (kind, value, position)
+5. Karakter yang tidak dikenal langsung dilaporkan beserta posisinya
+
+JENIS TOKEN (kind):
+- 'number'   : value = teks angka (sudah pasti valid untuk float();
+               teksnya disimpan supaya backend Decimal/Fraction tetap eksak)
+- 'function' : value = nama fungsi (nama yang langsung diikuti '(')
+- 'name'     : value = nama variabel (str)
+- 'operator' : value = simbol operator (+, -, *, /, ^)
+- '('  /  ')': value = simbol kurung
+- ','        : value = koma (pemisah argumen fungsi)
+
+Token bisa langsung dipakai oleh tokens_to_program() (Shunting Yard).
+infix_to_program() memakai scan_to_program() yang membaca match regex yang
+sama secara langsung (tanpa membuat token), jadi nomor group TOKEN_PATTERN
+juga dipakai di sana dan di Bulk_Ingest.py.
+Token sengaja berupa tuple biasa (bukan namedtuple/class): membuat tuple
+jauh lebih murah, dan ini dikerjakan untuk SETIAP token.
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import re
+
+# Satu regex untuk semua jenis token. Group yang match menentukan jenisnya:
+#   1 = angka biasa (digit, pecahan dan eksponen opsional, misal 12, 3.5,
+#   1e-5), 2 = angka lain (misal .5, 1_000, 1.2.3, 2x), 3 = nama fungsi (nama
+#   yang diikuti '('), 4 = nama variabel, 5 = operator, 6 = '(', 7 = ')',
+#   8 = ',', 9 = karakter lain (error)
+# Angka di group 1 pasti valid untuk float(), jadi tidak perlu divalidasi:
+# angka cukup di-parse satu kali oleh tokens_to_program(). Hanya group 2
+# (jarang) yang divalidasi dengan float().
+# Huruf yang menempel di belakang angka (misal "2x") ikut ke group 2 supaya
+# dilaporkan sebagai angka invalid, sama seperti loop per karakter.
+# Whitespace dilewati oleh \s* di depan setiap token.
+TOKEN_PATTERN = re.compile(r'\s*(?:([0-9]+(?:\.[0-9]*)?(?:[eE][-+]?[0-9]+)?)(?![A-Za-z0-9_.])|'
+                           r'([0-9.]+(?:[eE][-+]?[0-9]+)?[A-Za-z0-9_.]*)|'
+                           r'([A-Za-z_][A-Za-z0-9_]*)(?=\s*\()|([A-Za-z_][A-Za-z0-9_]*)|'
+                           r'([-+*/^])|(\()|(\))|(,)|(\S))')
+
+# Group regex → jenis token (index 0 tidak dipakai, 9 adalah error)
+GROUP_KINDS = (None, 'number', 'number', 'function', 'name', 'operator', '(', ')', ',')
+
+
+def tokenize(expression):
+    """
+    Memecah ekspresi infix menjadi list Token (satu kali scan).
+
+    Args:
+        expression (str): Ekspresi infix, dengan atau tanpa spasi
+
+    Returns:
+        list: List tuple (kind, value, position),
+              position = index karakter pertama token di ekspresi
+
+    Raises:
+        ValueError: Jika ada angka yang tidak valid (misal "1.2.3")
+                    atau karakter yang tidak dikenal (misal "%")
+
+    Example:
+        tokenize("3+4*x")
+        # [('number', '3', 0), ('operator', '+', 1), ('number', '4', 2),
+        #  ('operator', '*', 3), ('name', 'x', 4)]
+    """
+    tokens = []
+    append = tokens.append
+    kinds = GROUP_KINDS
+    for match in TOKEN_PATTERN.finditer(expression):
+        group = match.lastindex
+        if group is None:
+            break  # Hanya whitespace di akhir ekspresi
+        text = match.group(group)
+        position = match.start(group)
+        if group == 2:
+            try:
+                # Validasi di sini supaya urutan error sama dengan loop per
+                # karakter (angka invalid dilaporkan sebelum token sesudahnya)
+                float(text)
+            except ValueError:
+                raise ValueError(f"Error: Angka '{text}' tidak valid!")
+        elif group == 9:
+            raise ValueError(f"Error: Karakter '{text}' tidak dikenal (posisi {position})!")
+        append((kinds[group], text, position))
+    return tokens
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing tokenizer (spasi opsional, notasi ilmiah, posisi, error).
+    """
+    from Infix_to_Postfix import tokens_to_program
+
+    print("\n" + "="*60)
+    print("TESTING TOKENIZER")
+    print("="*60 + "\n")
+
+    # Test cases: (infix, expected_postfix)
+    test_cases = [
+        ("3 + 4 * 2", "3 4 2 * +"),
+        ("3+4*2", "3 4 2 * +"),
+        ("(5+6)*(7+8)", "5 6 + 7 8 + *"),
+        ("1.5e3 + 2E-4", "1500 0.0002 +"),
+        ("x*2+rate_2", "x 2 * rate_2 +"),
+        ("\t10 /\t2 ", "10 2 /"),
+        ("-x^2", "x 2 ^ neg"),
+        ("sqrt (x) + max(1, 2, y)", "x sqrt 1 2 y max max +"),
+    ]
+
+    passed = 0
+    failed = 0
+
+    def check(name, condition):
+        global passed, failed
+        if condition:
+            print(f"✅ PASS - {name}")
+            passed += 1
+        else:
+            print(f"❌ FAIL - {name}")
+            failed += 1
+
+    for infix, expected in test_cases:
+        result = str(tokens_to_program(tokenize(infix)))
+        check(f"{infix!r:20} → {result}", result == expected)
+
+    # Posisi token
+    tokens = tokenize("12 + x")
+    check("Posisi token", [position for _, _, position in tokens] == [0, 3, 5])
+    check("Jenis token fungsi", [kind for kind, _, _ in tokenize("min(a,b)")] ==
+          ['function', '(', 'name', ',', 'name', ')'])
+
+    # Pola angka = grammar float(): teks angka valid tanpa dipanggil float()
+    check("Teks angka (underscore, eksponen)",
+          [value for kind, value, _ in tokenize("1_000+.5e-3*2.E4") if kind == 'number'] ==
+          ['1_000', '.5e-3', '2.E4'])
+
+    # Error: karakter tidak dikenal dan angka invalid
+    for infix, message in [("3 % 4", "posisi 2"), ("1.2.3 + 4", "1.2.3"), ("2x + 1", "2x"),
+                           ("1__0 + 2", "1__0"), ("1.2.3 % 4", "1.2.3")]:
+        try:
+            tokenize(infix)
+            check(f"Error untuk {infix!r}", False)
+        except ValueError as e:
+            check(f"Error untuk {infix!r}: {e}", message in str(e))
+
+    # Error: ')' tanpa pasangan ditolak oleh tokens_to_program (dulu diabaikan)
+    try:
+        tokens_to_program(tokenize("3 + 4 )"))
+        check("Error untuk '3 + 4 )'", False)
+    except ValueError as e:
+        check(f"Error untuk '3 + 4 )': {e}", "tanpa pasangan (posisi 6)" in str(e))
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,360 @@
+"""
+Trace Sink - Structured Step Events
+====================================
+
+File ini berisi API "trace sink" untuk menerima langkah-langkah (step events)
+dari infix_to_postfix dan evaluate_postfix secara TERSTRUKTUR.
+
+KENAPA PERLU TRACE SINK?
+Dulu setiap langkah langsung di-print dengan f-string, lalu Calculator
+membuang output tersebut dengan menukar sys.stdout ke StringIO. Artinya:
+- Formatting tetap dikerjakan walaupun hasilnya dibuang (lambat)
+- Menukar sys.stdout tidak thread-safe
+
+Sekarang kedua fungsi menerima parameter `tracer`:
+- tracer=None  → tidak ada event sama sekali (tanpa biaya formatting)
+- tracer=sink  → setiap langkah dikirim sebagai event ke sink
+
+FORMAT EVENT:
+    sink.emit(stage, event, **data)
+
+    stage: 'infix' (konversi) atau 'postfix' (evaluasi)
+    event: nama langkah, misal 'read', 'push', 'apply'
+    data:  field tambahan sesuai jenis event (angka, operator, isi stack, dll)
+
+SINK YANG TERSEDIA:
+1. TextSink       - Render event menjadi teks step-by-step (seperti dulu)
+2. JsonLinesSink  - Tulis satu JSON object per event (JSON Lines)
+3. CollectSink    - Simpan event di memory (list of dict) untuk diperiksa
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import json
+import sys
+
+
+def format_stack(items):
+    """
+    Format isi stack sama seperti Stack.__str__.
+
+    Args:
+        items (list): Snapshot isi stack (bottom → top)
+
+    Returns:
+        str: Representasi string dari stack
+
+    Example:
+        format_stack([5, 10])  # "Stack: [5, 10] (Top: 10)"
+        format_stack([])       # "Stack: [] (Empty)"
+    """
+    if not items:
+        return "Stack: [] (Empty)"
+    return f"Stack: {items} (Top: {items[-1]})"
+
+
+class TraceSink:
+    """
+    Base class untuk semua trace sink.
+
+    Subclass cukup meng-override method emit().
+    """
+
+    def emit(self, stage, event, **data):
+        """
+        Menerima satu step event.
+
+        Args:
+            stage (str): 'infix' atau 'postfix'
+            event (str): Nama event
+            **data: Field tambahan dari event
+        """
+        raise NotImplementedError
+
+
+class CollectSink(TraceSink):
+    """
+    Sink yang menyimpan semua event di memory.
+
+    Berguna untuk testing atau untuk menampilkan langkah-langkah
+    di UI lain tanpa parsing teks.
+
+    Attributes:
+        events (list): List of dict, satu dict per event
+
+    Example:
+        sink = CollectSink()
+        infix_to_postfix("3 + 4", tracer=sink)
+        sink.events[0]  # {'stage': 'infix', 'event': 'start', ...}
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, stage, event, **data):
+        data['stage'] = stage
+        data['event'] = event
+        self.events.append(data)
+
+    def clear(self):
+        """
+        Menghapus semua event yang sudah dikumpulkan.
+        """
+        self.events = []
+
+
+class JsonLinesSink(TraceSink):
+    """
+    Sink yang menulis setiap event sebagai satu baris JSON.
+
+    Args:
+        stream: File-like object tujuan (default: sys.stdout)
+
+    Example:
+        with open("trace.jsonl", "w") as f:
+            evaluate_postfix("3 4 +", tracer=JsonLinesSink(f))
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, stage, event, **data):
+        record = {'stage': stage, 'event': event}
+        record.update(data)
+        stream = self.stream if self.stream is not None else sys.stdout
+        # default=str supaya nilai seperti complex tetap bisa ditulis
+        stream.write(json.dumps(record, default=str) + "\n")
+
+
+class TextSink(TraceSink):
+    """
+    Sink yang me-render event menjadi teks step-by-step.
+
+    Output-nya sama dengan print() yang dulu ada di dalam
+    infix_to_postfix dan evaluate_postfix.
+
+    Args:
+        stream: File-like object tujuan (default: sys.stdout saat emit)
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, stage, event, **data):
+        # Cari method render yang sesuai, misal _infix_read()
+        render = getattr(self, f"_{stage}_{event}", None)
+        if render is None:
+            return
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(render(**data) + "\n")
+
+    # ------------------------------------------------------------------
+    # Render untuk stage 'infix' (Infix_to_Postfix)
+    # ------------------------------------------------------------------
+
+    def _infix_start(self, expression):
+        return (f"\n{'='*60}\n"
+                f"KONVERSI INFIX KE POSTFIX\n"
+                f"{'='*60}\n"
+                f"Infix expression: {expression}\n"
+                f"{'='*60}\n")
+
+    def _infix_read(self, step, char):
+        return f"Step {step}: Membaca karakter '{char}'"
+
+    def _infix_digit(self, buffer):
+        return f"  → Digit/Decimal point, tambah ke number buffer: '{buffer}'"
+
+    def _infix_letter(self, buffer):
+        return f"  → Huruf/underscore, tambah ke buffer variabel: '{buffer}'"
+
+    def _infix_number(self, number, reason, postfix):
+        if reason == 'space':
+            return (f"  → Spasi ditemukan, finalisasi number: {number}\n"
+                    f"  → Tambah '{number}' ke postfix\n"
+                    f"  → Postfix sekarang: {' '.join(postfix)}")
+        if reason == 'paren':
+            return f"  → Finalisasi number sebelum ')': {number}"
+        if reason == 'operator':
+            return f"  → Finalisasi number sebelum operator: {number}"
+        return f"\nFinalisasi number terakhir: {number}"
+
+    def _infix_lparen(self, stack):
+        return (f"  → Kurung buka '(', push ke stack\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _infix_rparen(self):
+        return "  → Kurung tutup ')', pop operator sampai ketemu '('"
+
+    def _infix_pop(self, operator, reason, precedence=None):
+        if reason == 'paren':
+            return f"     - Pop operator '{operator}' dari stack ke postfix"
+        if reason == 'operator':
+            return f"     - Pop '{operator}' (precedence: {precedence}) dari stack ke postfix"
+        return f"  - Pop '{operator}' dari stack ke postfix"
+
+    def _infix_discard_paren(self):
+        return "  → Buang '(' dari stack"
+
+    def _infix_postfix(self, postfix):
+        return f"  → Postfix sekarang: {' '.join(postfix)}"
+
+    def _infix_operator(self, operator, precedence):
+        return f"  → Operator '{operator}' (precedence: {precedence})"
+
+    def _infix_function(self, name, stack):
+        return (f"  → Fungsi '{name}', push ke stack (dipanggil setelah ')')\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _infix_comma(self, count):
+        return f"  → Koma, pop operator sampai '(' (argumen ke-{count})"
+
+    def _infix_call(self, name, count, postfix):
+        return (f"  → Pop fungsi '{name}' dengan {count} argumen ke postfix\n"
+                f"  → Postfix sekarang: {' '.join(postfix)}")
+
+    def _infix_push(self, operator, stack):
+        return (f"  → Push operator '{operator}' ke stack\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _infix_flush(self):
+        return "\nPop semua operator tersisa di stack:"
+
+    def _infix_done(self, expression, postfix):
+        return (f"\n{'='*60}\n"
+                f"HASIL KONVERSI:\n"
+                f"Infix:   {expression}\n"
+                f"Postfix: {postfix}\n"
+                f"{'='*60}\n")
+
+    # ------------------------------------------------------------------
+    # Render untuk stage 'postfix' (Postfix_Evaluator)
+    # ------------------------------------------------------------------
+
+    def _postfix_start(self, expression, tokens):
+        return (f"\n{'='*60}\n"
+                f"EVALUASI POSTFIX EXPRESSION\n"
+                f"{'='*60}\n"
+                f"Postfix: {expression}\n"
+                f"Tokens: {tokens}\n"
+                f"{'='*60}\n")
+
+    def _postfix_read(self, step, token):
+        return f"Step {step}: Membaca token '{token}'"
+
+    def _postfix_number(self, number, stack):
+        return (f"  → Angka ditemukan: {number}\n"
+                f"  → Push {number} ke stack\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _postfix_variable(self, name, value, stack):
+        return (f"  → Variabel ditemukan: {name} = {value}\n"
+                f"  → Push {value} ke stack\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _postfix_store(self, slot, value):
+        return f"  → Simpan {value} ke slot ${slot} (dipakai ulang nanti)"
+
+    def _postfix_fetch(self, slot, value, stack):
+        return (f"  → Ambil {value} dari slot ${slot} (tidak dihitung ulang)\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _postfix_operator(self, operator):
+        return f"  → Operator ditemukan: '{operator}'"
+
+    def _postfix_operands(self, left, right):
+        return (f"  → Pop operand2 (kanan): {right}\n"
+                f"  → Pop operand1 (kiri): {left}")
+
+    def _postfix_apply(self, left, right, operator, result):
+        return f"     Operasi: {left} {operator} {right} = {result}"
+
+    def _postfix_apply_function(self, name, operand, result):
+        return (f"  → Pop operand: {operand}\n"
+                f"     Fungsi: {name}({operand}) = {result}")
+
+    def _postfix_result(self, result, stack):
+        return (f"  → Push hasil {result} ke stack\n"
+                f"  → Stack sekarang: {format_stack(stack)}")
+
+    def _postfix_step_end(self):
+        return ""
+
+    def _postfix_done(self, expression, result):
+        return (f"{'='*60}\n"
+                f"HASIL EVALUASI:\n"
+                f"Postfix: {expression}\n"
+                f"Result:  {result}\n"
+                f"{'='*60}\n")
+
+
+# ============================================================================
+# TESTING SECTION
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Testing trace sink dengan infix_to_postfix dan evaluate_postfix.
+    """
+    from io import StringIO
+    from Infix_to_Postfix import infix_to_postfix
+    from Postfix_Evaluator import evaluate_postfix
+
+    print("\n" + "="*60)
+    print("TESTING TRACE SINK")
+    print("="*60 + "\n")
+
+    passed = 0
+    failed = 0
+
+    # Test 1: Tanpa sink → tidak ada output sama sekali
+    buffer = StringIO()
+    old_stdout = sys.stdout
+    sys.stdout = buffer
+    try:
+        evaluate_postfix(infix_to_postfix("( 5 + 6 ) * 2"))
+    finally:
+        sys.stdout = old_stdout
+    if buffer.getvalue() == "":
+        print("✅ PASS - Tanpa sink tidak ada output")
+        passed += 1
+    else:
+        print("❌ FAIL - Masih ada output tanpa sink")
+        failed += 1
+
+    # Test 2: CollectSink mengumpulkan event terstruktur
+    sink = CollectSink()
+    evaluate_postfix(infix_to_postfix("3 + 4", tracer=sink), tracer=sink)
+    applies = [e for e in sink.events if e['event'] == 'apply']
+    if len(applies) == 1 and applies[0]['result'] == 7.0:
+        print("✅ PASS - CollectSink menyimpan event 'apply'")
+        passed += 1
+    else:
+        print("❌ FAIL - CollectSink tidak lengkap")
+        failed += 1
+
+    # Test 3: JsonLinesSink menulis satu JSON per baris
+    buffer = StringIO()
+    evaluate_postfix("3 4 +", tracer=JsonLinesSink(buffer))
+    lines = buffer.getvalue().splitlines()
+    if lines and all(json.loads(line)['stage'] == 'postfix' for line in lines):
+        print("✅ PASS - JsonLinesSink menulis JSON Lines")
+        passed += 1
+    else:
+        print("❌ FAIL - JsonLinesSink output invalid")
+        failed += 1
+
+    # Test 4: TextSink me-render langkah seperti dulu
+    buffer = StringIO()
+    evaluate_postfix("3 4 +", tracer=TextSink(buffer))
+    if "Operasi: 3.0 + 4.0 = 7.0" in buffer.getvalue():
+        print("✅ PASS - TextSink me-render step-by-step")
+        passed += 1
+    else:
+        print("❌ FAIL - TextSink output tidak sesuai")
+        failed += 1
+
+    print("\n" + "="*60)
+    print(f"SUMMARY: {passed} passed, {failed} failed")
+    print("="*60)
@@ -0,0 +1,26 @@
+"""
+calc - Launcher Mode One-Shot
+==============================
+
+Launcher kecil untuk mode one-shot (lihat Calculator.one_shot).
+
+KENAPA TIDAK LANGSUNG Calculator.py?
+File yang dijalankan sebagai script (__main__) selalu di-compile ulang
+dari source, tanpa .pyc. Calculator.py cukup besar, jadi setiap
+`python Calculator.py "3 + 4"` membayar compile itu lagi. Launcher ini
+hanya meng-import Calculator, sehingga .pyc-nya dipakai.
+
+CARA PAKAI:
+    python calc.py "3 + 4 * 2"      # 11.0
+    python calc.py "1 / 0"          # stderr: Error: ..., exit code 1
+
+Author: Fadli Ghafatul Hijriah
+Date: Februari 2026
+"""
+
+import sys
+
+import Calculator
+
+if __name__ == "__main__":
+    sys.exit(Calculator.one_shot(sys.argv[1:]))